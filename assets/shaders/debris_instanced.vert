@@ -0,0 +1,47 @@
+#version 330
+
+// Instanced debris boxes: one unit cube drawn once per fragment.
+// Each instance reads 5 texels from instanceData: 4 rows of its model
+// matrix (Panda row-vector layout) followed by its RGBA color.
+// Outputs match terrain.vert so terrain.frag shades debris like any piece.
+uniform mat4 p3d_ViewMatrix;
+uniform mat4 p3d_ViewProjectionMatrix;
+uniform mat4 shadowMatrix0;  // Shadow cascade 0
+uniform samplerBuffer instanceData;
+
+in vec4 p3d_Vertex;
+in vec3 p3d_Normal;
+
+out vec3 vWorldPos;
+out vec3 vNormal;
+out vec2 vTexCoord;
+out vec4 vShadowCoord0;
+out float vViewDepth;
+out vec4 vColor;
+
+void main() {
+    int base = gl_InstanceID * 5;
+    mat4 model = mat4(
+        texelFetch(instanceData, base),
+        texelFetch(instanceData, base + 1),
+        texelFetch(instanceData, base + 2),
+        texelFetch(instanceData, base + 3)
+    );
+
+    // World position
+    vec4 worldPos = model * p3d_Vertex;
+    vWorldPos = worldPos.xyz;
+
+    // Normal in view space (inverse-transpose handles non-uniform scale)
+    mat3 normalMatrix = transpose(inverse(mat3(model)));
+    vNormal = normalize(mat3(p3d_ViewMatrix) * normalMatrix * p3d_Normal);
+
+    vTexCoord = vec2(0.0);
+    vColor = texelFetch(instanceData, base + 4);
+
+    // Shadow coordinates and view depth for cascade selection
+    vShadowCoord0 = shadowMatrix0 * worldPos;
+    vViewDepth = -(p3d_ViewMatrix * worldPos).z;
+
+    gl_Position = p3d_ViewProjectionMatrix * worldPos;
+}
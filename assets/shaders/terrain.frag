@@ -11,6 +11,7 @@ uniform float cascadeSplits[3];
 uniform vec2 shadowMapSize;
 uniform float shadowSoftness;
 uniform int useVertexColor;// 1 = use vertex colors, 0 = use default terrain color
+uniform float damage;// 0 = intact, 1 = destroyed (building pieces desaturate)
 
 // Fog uniforms
 uniform int fogEnabled;// 1 = fog enabled, 0 = disabled
@@ -203,6 +204,10 @@ void main(){
         }
     }
     
+    // Damaged pieces fade toward grey (keeps 20% saturation at zero health)
+    float gray=dot(baseColor,vec3(.299,.587,.114));
+    baseColor=mix(baseColor,vec3(gray),damage*.8);
+    
     // Normal lighting
     vec3 normal=normalize(vNormal);
     vec3 lightDir=normalize(-lightDirection);
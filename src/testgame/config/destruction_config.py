@@ -0,0 +1,53 @@
+"""Building damage and destruction configuration settings."""
+
+# Piece Spatial Index
+PIECE_INDEX_CELL_SIZE = 8.0  # Grid cell size in world units (about one wall span)
+DAMAGE_SEARCH_RADIUS = 1.0  # Max distance from an impact to the surface of the damaged piece
+
+# Area Damage
+AOE_MAX_CHUNKED_PIECES = 6  # Destroyed pieces per blast that break into chunks
+
+# Destruction Scheduling
+DESTRUCTION_FRAME_BUDGET_MS = 2.0  # Time per frame spent spawning debris for destroyed pieces
+
+# Debris Pool
+DEBRIS_MAX_FRAGMENTS = 200  # Live fragments across the whole world
+DEBRIS_MAX_CHUNKS = 120  # Live destructible chunks across the whole world
+DEBRIS_PREWARM_FRAGMENTS = 64  # Fragments created up front when the world loads
+DEBRIS_MEMORY_BUDGET = 1024 * 1024  # Bytes of live debris before the oldest is recycled
+DEBRIS_FRAGMENT_BYTES = 2048  # Approximate footprint of one fragment (body, shape, nodes)
+DEBRIS_CHUNK_BYTES = 4096  # Approximate footprint of one chunk piece
+
+# Settled Debris
+DEBRIS_SETTLE_SPEED = 0.15  # Linear/angular speed below which debris counts as resting
+DEBRIS_SETTLE_FRAMES = 30  # Consecutive resting frames before debris is made static
+DEBRIS_SETTLE_CELL_SIZE = 16.0  # World units per merged static debris area
+DEBRIS_SETTLED_PER_CELL = 64  # Settled boxes kept per area (oldest dropped first)
+DEBRIS_SETTLED_CHUNK_LIFETIME = 120.0  # Seconds a settled chunk stays in its area
+
+# Debris Rendering
+DEBRIS_INSTANCING_ENABLED = True  # Draw fragments with one instanced call when supported
+
+# Building Render Batching
+BUILDING_BATCHING_ENABLED = True  # Draw intact static pieces of a building as one merged batch
+BUILDING_BATCH_REBUILD_DELAY = 2.0  # Quiet seconds before a batch drops split-out pieces
+
+# Compound Building Collision
+BUILDING_COMPOUND_COLLISION = True  # Share one static body among a building's intact pieces
+COMPOUND_PEEL_DAMAGE = 0.5  # Fraction of health lost before a piece gets its own body
+
+# Destruction LOD
+DESTRUCTION_LOD_FULL_DISTANCE = 25.0  # Closer than this: chunks and fragments
+DESTRUCTION_LOD_EFFECT_DISTANCE = 60.0  # Farther than this: dust effect only, no debris
+DESTRUCTION_LOD_LOAD_WEIGHT = 1.0  # Full debris load shrinks both distances by 1 / (1 + weight)
+DESTRUCTION_LOD_REDUCED_CHUNKS = 2  # Max (larger) chunks spawned between the two distances
+DESTRUCTION_DUST_DURATION = 0.6  # Lifetime of the far-destruction dust puff (seconds)
+
+# Deterministic Destruction
+DESTRUCTION_SEED = None  # Seed for the world's destruction RNG (None = random each run)
+
+# Structural Integrity
+STRUCTURAL_INTEGRITY_ENABLED = False  # Propagate load to foundations and fail overloaded supports
+STRUCTURAL_STRENGTH = 250.0  # Load (kg) a piece carries per square metre of footprint
+STRUCTURAL_LEVEL_TOLERANCE = 0.25  # Height difference before a neighbour counts as below
+STRUCTURAL_FRAME_BUDGET_MS = 1.0  # Time per frame spent re-solving damaged components
@@ -39,6 +39,11 @@ def configure():
 CHUNK_SIZE = 32
 RENDER_DISTANCE = 25
 PHYSICS_FPS = 60
+PHYSICS_MAX_SUBSTEPS = 10  # Most fixed steps run in one frame
+PHYSICS_FRAME_BUDGET_MS = 8.0  # Stepping time per frame before substeps are reduced
+PHYSICS_MAX_FRAME_TIME = 0.25  # Longer frames (hitches, loading) are clamped to this
+PHYSICS_INTERPOLATION = True  # Draw moving bodies between the last two physics steps
+PHYSICS_THREADED = False  # Step Bullet on a worker thread while the frame renders
 GRAVITY = -9.81
 
 # World generation
@@ -0,0 +1,45 @@
+"""Mapping from Bullet body nodes to the game objects that own them.
+
+Owners are stored as a Python tag on the body node itself, so resolving a
+raycast or contact result to its BuildingPiece, CurvedRoofPiece or prop is a
+single lookup. Python tags survive Panda3D handing back fresh wrapper objects
+for the same node (as ray results do).
+"""
+
+OWNER_TAG = "owner"
+
+
+def register_body(node, owner):
+    """Associate a Bullet body node with its owning game object.
+
+    Args:
+        node: BulletRigidBodyNode (or any PandaNode)
+        owner: Object that owns the body
+    """
+    node.setPythonTag(OWNER_TAG, owner)
+
+
+def unregister_body(node):
+    """Remove a body's owner association.
+
+    Clearing the tag also breaks the node -> owner -> node reference cycle.
+
+    Args:
+        node: Body node previously passed to register_body (may be None)
+    """
+    if node is not None and node.hasPythonTag(OWNER_TAG):
+        node.clearPythonTag(OWNER_TAG)
+
+
+def get_body_owner(node):
+    """Look up the game object that owns a Bullet body node.
+
+    Args:
+        node: Body node, e.g. from a ray result (may be None)
+
+    Returns:
+        Owner object or None if the node is not registered
+    """
+    if node is None or not node.hasPythonTag(OWNER_TAG):
+        return None
+    return node.getPythonTag(OWNER_TAG)
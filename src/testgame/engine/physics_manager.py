@@ -1,16 +1,399 @@
 """Physics management for the game world."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from panda3d.core import Quat, TransformState
+
+from testgame.config.settings import (
+    PHYSICS_FPS,
+    PHYSICS_FRAME_BUDGET_MS,
+    PHYSICS_INTERPOLATION,
+    PHYSICS_MAX_FRAME_TIME,
+    PHYSICS_MAX_SUBSTEPS,
+    PHYSICS_THREADED,
+)
+
+STEP_TIME_SMOOTHING = 0.1  # Weight of the newest step in the average step time
+
+
+def interpolate_transform(start, end, alpha):
+    """Blend two transforms (lerp position, nlerp rotation, keep end scale).
+
+    Args:
+        start: TransformState at alpha 0
+        end: TransformState at alpha 1
+        alpha: Blend factor in [0, 1]
+
+    Returns:
+        TransformState
+    """
+    pos = start.getPos() + (end.getPos() - start.getPos()) * alpha
+    q0 = start.getQuat()
+    q1 = end.getQuat()
+    if q0.dot(q1) < 0:
+        q1 = -q1  # Take the short way round
+    quat = Quat(q0 * (1.0 - alpha) + q1 * alpha)
+    quat.normalize()
+    return TransformState.makePosQuatScale(pos, quat, end.getScale())
+
+
+class _TrackedBody:
+    """A body whose visuals are drawn by a proxy node at published poses."""
+
+    __slots__ = ("body_np", "node", "proxy", "children", "previous", "current")
+
+    def __init__(self, body_np):
+        self.body_np = body_np
+        self.node = body_np.node()  # Stays usable after body_np is removed
+        self.previous = self.current = body_np.getTransform()
+
+        # Visuals move to a sibling proxy, so Bullet writing the body's
+        # transform (possibly on the physics thread) never moves them
+        self.proxy = body_np.getParent().attachNewNode(f"{body_np.getName()}_visual")
+        self.proxy.setTransform(self.current)
+        self.children = list(body_np.getChildren())
+        for child in self.children:
+            child.reparentTo(self.proxy)
+
+    def release(self):
+        """Hand the visuals back to the body, or drop them if it was removed."""
+        if not self.body_np.isEmpty():
+            for child in self.children:
+                if not child.isEmpty():
+                    child.reparentTo(self.body_np)
+        self.proxy.removeNode()
+
 
 class PhysicsManager:
-    """Manages physics simulation and collision detection."""
+    """Owns Bullet stepping for the game world.
+
+    Frame time is fed into an accumulator and the world advances in fixed
+    steps of 1 / PHYSICS_FPS. Moving bodies that are tracked are drawn
+    between their last two physics states, so motion stays smooth when the
+    frame rate and the step rate differ. The number of steps allowed per
+    frame follows the measured cost of a step, so a slow frame cannot queue
+    up ever more physics work (the "spiral of death"); time that cannot be
+    simulated is dropped instead.
+
+    In threaded mode update() hands the frame's steps to a worker thread and
+    returns, so stepping overlaps rendering, and sync() waits for it at the
+    start of the next frame. Poses are double-buffered: the worker records
+    the tracked bodies' last two states and sync() publishes them, so the
+    visuals show the previous batch while the next one runs. Nothing may
+    change the world while a batch runs: callers sync() first, or go
+    through call(), which queues the change until sync().
+    """
+
+    def __init__(
+        self,
+        bullet_world,
+        step_size=1.0 / PHYSICS_FPS,
+        max_substeps=PHYSICS_MAX_SUBSTEPS,
+        frame_budget_ms=PHYSICS_FRAME_BUDGET_MS,
+        max_frame_time=PHYSICS_MAX_FRAME_TIME,
+        interpolation=PHYSICS_INTERPOLATION,
+        threaded=PHYSICS_THREADED,
+        clock=time.perf_counter,
+    ):
+        """Initialize the physics manager.
+
+        Args:
+            bullet_world: Bullet physics world to step
+            step_size: Fixed simulation step in seconds
+            max_substeps: Most steps run in one update()
+            frame_budget_ms: Stepping time per update() before substeps drop
+            max_frame_time: Frame time clamp in seconds
+            interpolation: Whether tracked bodies are drawn interpolated
+            threaded: Whether to step on a worker thread during rendering
+            clock: Function returning the current time in seconds
+        """
+        self.world = bullet_world
+        self.step_size = step_size
+        self.max_substeps = max_substeps
+        self.frame_budget_ms = frame_budget_ms
+        self.max_frame_time = max_frame_time
+        self.interpolation = interpolation
+        self.threaded = threaded
+        self.clock = clock
+
+        self.paused = False
+        self.time_scale = 1.0
+        self.accumulator = 0.0
+        self.alpha = 0.0  # Fraction of a step between the last state and the next
+        self.substep_limit = max_substeps
+        self._tracked = {}  # body node -> _TrackedBody
+
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="physics")
+            if threaded
+            else None
+        )
+        self._job = None  # Future of the running step batch
+        self._queued = []  # (function, args) waiting for sync()
+
+        # Timing counters
+        self.total_steps = 0
+        self.frame_steps = 0
+        self.last_step_ms = 0.0
+        self.max_step_ms = 0.0  # Slowest step of the last update()
+        self.average_step_ms = 0.0
+        self.dropped_time = 0.0  # Simulation seconds skipped to stay on budget
+        self.calls_queued = 0
+
+    def track(self, body_np):
+        """Draw a body's visuals from published physics poses.
+
+        The body's children are moved under a proxy node, so Bullet never
+        sees the interpolated transform. Bodies whose NodePath is removed or
+        detached are forgotten (and their visuals handed back) automatically.
+
+        Args:
+            body_np: NodePath of a rigid body with visual children
+        """
+        if not (self.interpolation or self.threaded):
+            return
+        if body_np.isEmpty() or not body_np.hasParent():
+            return
+        if body_np.node() not in self._tracked:
+            self._tracked[body_np.node()] = _TrackedBody(body_np)
+
+    def untrack(self, body_np):
+        """Stop drawing a body from published poses and give its visuals back.
+
+        Args:
+            body_np: NodePath passed to track()
+        """
+        tracked = self._tracked.pop(body_np.node(), None)
+        if tracked is not None:
+            tracked.release()
+
+    def call(self, function, *args):
+        """Run a change to the physics world now, or after the running batch.
+
+        Use this for attaching, removing and pushing bodies from code that can
+        run while a threaded step is in flight; calls keep their order.
+
+        Args:
+            function: Callable that touches the physics world
+            *args: Arguments passed to it
+        """
+        if self._job is None:
+            function(*args)
+        else:
+            self._queued.append((function, args))
+            self.calls_queued += 1
+
+    def attach(self, node):
+        """Attach a rigid body to the world.
+
+        Args:
+            node: BulletRigidBodyNode
+        """
+        self.call(self.world.attachRigidBody, node)
 
-    def __init__(self):
-        pass
+    def remove(self, node):
+        """Remove a rigid body from the world.
+
+        Args:
+            node: BulletRigidBodyNode
+        """
+        self.call(self.world.removeRigidBody, node)
+
+    def apply_impulse(self, node, impulse, torque=None):
+        """Push a rigid body.
+
+        Args:
+            node: BulletRigidBodyNode
+            impulse: Vec3 central impulse
+            torque: Optional Vec3 torque impulse
+        """
+        self.call(node.applyCentralImpulse, impulse)
+        if torque is not None:
+            self.call(node.applyTorqueImpulse, torque)
 
     def update(self, dt):
-        """Update physics simulation.
+        """Advance the simulation by a frame's worth of fixed steps.
+
+        Args:
+            dt: Frame time in seconds
+
+        Returns:
+            int: Number of steps run (or started, in threaded mode)
+        """
+        self.sync()
+        self.frame_steps = 0
+        self.max_step_ms = 0.0
+        if self.paused:
+            return 0
+
+        self.accumulator += min(dt, self.max_frame_time) * self.time_scale
+        steps = min(int(self.accumulator / self.step_size), self.substep_limit)
+        self.accumulator -= steps * self.step_size
+        if self.accumulator >= self.step_size:
+            # Over the substep limit: drop whole steps rather than fall behind
+            dropped = self.accumulator - self.accumulator % self.step_size
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+        self.alpha = self.accumulator / self.step_size
+
+        bodies = self._live_bodies()
+        if steps and self._executor is not None:
+            self._job = self._executor.submit(self._run_steps, steps, bodies)
+            return steps
+
+        if steps:
+            self._publish(self._run_steps(steps, bodies))
+            self._adapt_substeps()
+        self._apply_poses()
+        return steps
+
+    def sync(self):
+        """Wait for the running step batch, then apply queued calls and poses.
+
+        Does nothing when no batch is running. An exception raised by the
+        worker is re-raised here, after the queued calls have been applied.
+        """
+        job, self._job = self._job, None
+        if job is None:
+            return
+
+        try:
+            poses = job.result()
+        finally:
+            queued, self._queued = self._queued, []
+            for function, args in queued:
+                function(*args)
+        self._publish(poses)
+        self._adapt_substeps()
+        self._apply_poses()
+
+    def shutdown(self):
+        """Finish the running step batch and stop the worker thread."""
+        self.sync()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def step(self):
+        """Run exactly one fixed step and record its duration."""
+        start = self.clock()
+        self.world.doPhysics(self.step_size, 1, self.step_size)
+        elapsed_ms = (self.clock() - start) * 1000.0
+
+        self.total_steps += 1
+        self.frame_steps += 1
+        self.last_step_ms = elapsed_ms
+        self.max_step_ms = max(self.max_step_ms, elapsed_ms)
+        if self.total_steps == 1:
+            self.average_step_ms = elapsed_ms
+        else:
+            self.average_step_ms += (
+                elapsed_ms - self.average_step_ms
+            ) * STEP_TIME_SMOOTHING
+
+    def _run_steps(self, steps, bodies):
+        """Run steps and record tracked bodies' transforms around the last one.
+
+        Runs on the worker thread in threaded mode, so bodies are read through
+        their nodes, which stay usable if the game thread removes a NodePath.
 
         Args:
-            dt: Delta time since last update
+            steps: Number of steps to run
+            bodies: List of _TrackedBody to record
+
+        Returns:
+            List of (tracked, previous, current) transforms
+        """
+        previous = []
+        for i in range(steps):
+            if i == steps - 1:
+                previous = [tracked.node.getTransform() for tracked in bodies]
+            self.step()
+        return [
+            (tracked, before, tracked.node.getTransform())
+            for tracked, before in zip(bodies, previous)
+        ]
+
+    def _publish(self, poses):
+        """Make recorded transforms the ones tracked bodies are drawn between."""
+        for tracked, previous, current in poses:
+            tracked.previous = previous
+            tracked.current = current
+
+    def _adapt_substeps(self):
+        """Allow as many steps per frame as the budget covers at the current cost."""
+        if self.average_step_ms <= 0:
+            self.substep_limit = self.max_substeps
+            return
+        affordable = int(self.frame_budget_ms / self.average_step_ms)
+        self.substep_limit = max(1, min(self.max_substeps, affordable))
+
+    def _live_bodies(self):
+        """Forget bodies that were removed or taken out of the scene.
+
+        Returns:
+            List of the remaining _TrackedBody
+        """
+        for node, tracked in list(self._tracked.items()):
+            body_np = tracked.body_np
+            if body_np.isEmpty() or not body_np.hasParent():
+                # Pooled bodies come back later with their visuals
+                tracked.release()
+                del self._tracked[node]
+        return list(self._tracked.values())
+
+    def _apply_poses(self):
+        """Pose each tracked body's visuals from its published transforms."""
+        for tracked in self._live_bodies():
+            if self.interpolation and tracked.node.isActive():
+                pose = interpolate_transform(
+                    tracked.previous, tracked.current, self.alpha
+                )
+            else:
+                pose = tracked.current  # Asleep: nothing to smooth
+            tracked.proxy.setTransform(pose)
+
+    def count_active_bodies(self):
+        """Count rigid bodies that are awake and simulated.
+
+        Returns:
+            int
+        """
+        return sum(1 for body in self.world.getRigidBodies() if body.isActive())
+
+    def count_contacts(self):
+        """Count contact points across all touching body pairs.
+
+        Returns:
+            int
+        """
+        return sum(
+            manifold.getNumManifoldPoints() for manifold in self.world.getManifolds()
+        )
+
+    def get_stats(self):
+        """Get stepping timings and world counters.
+
+        Body and contact counts walk the world, so call this for diagnostics
+        rather than every frame.
+
+        Returns:
+            Dict of physics statistics
         """
-        pass
+        return {
+            "steps": self.frame_steps,
+            "total_steps": self.total_steps,
+            "substep_limit": self.substep_limit,
+            "alpha": self.alpha,
+            "last_step_ms": self.last_step_ms,
+            "max_step_ms": self.max_step_ms,
+            "average_step_ms": self.average_step_ms,
+            "dropped_time": self.dropped_time,
+            "threaded": self._executor is not None,
+            "calls_queued": self.calls_queued,
+            "tracked_bodies": len(self._tracked),
+            "rigid_bodies": self.world.getNumRigidBodies(),
+            "active_bodies": self.count_active_bodies(),
+            "contacts": self.count_contacts(),
+        }
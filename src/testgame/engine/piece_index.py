@@ -0,0 +1,244 @@
+"""World-level spatial index of building pieces."""
+
+import math
+
+from panda3d.core import Mat4, Point3, Vec3
+
+from testgame.config.destruction_config import PIECE_INDEX_CELL_SIZE
+
+
+class PieceSpatialIndex:
+    """Uniform grid of building piece AABBs for fast damage lookup.
+
+    Each piece is bucketed into every grid cell its world AABB overlaps, so a
+    point query only looks at the handful of pieces near the impact instead of
+    every piece in every building. Static pieces are indexed once; pieces that
+    become dynamic are tracked and re-bucketed by refresh_dynamic() while their
+    bodies are awake.
+    """
+
+    def __init__(self, cell_size=PIECE_INDEX_CELL_SIZE):
+        """Initialize the spatial index.
+
+        Args:
+            cell_size: Grid cell size in world units
+        """
+        self.cell_size = cell_size
+        self._cells = {}  # (ix, iy, iz) -> set of pieces
+        self._piece_cells = {}  # piece -> tuple of cell keys
+        self._dynamic = set()
+
+    def __len__(self):
+        return len(self._piece_cells)
+
+    def __contains__(self, piece):
+        return piece in self._piece_cells
+
+    def _piece_aabb(self, piece):
+        """Compute a piece's world-space AABB.
+
+        Args:
+            piece: BuildingPiece or CurvedRoofPiece
+
+        Returns:
+            Tuple (min Vec3, max Vec3) or None if the piece has no node
+        """
+        body_np = piece.body_np
+        if body_np is None or body_np.isEmpty():
+            return None
+
+        mat = body_np.getMat()
+        center = body_np.getPos()
+        half = (piece.size.x * 0.5, piece.size.y * 0.5, piece.size.z * 0.5)
+
+        # Rotated box extents: |R| * half_extents (rows are the local axes)
+        extents = [
+            sum(abs(mat.getCell(i, j)) * half[i] for i in range(3)) for j in range(3)
+        ]
+        ext = Vec3(*extents)
+        return center - ext, center + ext
+
+    def _cell_range(self, lo, hi):
+        """List the grid cells overlapped by a box.
+
+        Args:
+            lo: Box minimum corner
+            hi: Box maximum corner
+
+        Returns:
+            Tuple of (ix, iy, iz) cell keys
+        """
+        size = self.cell_size
+        x0, x1 = math.floor(lo.x / size), math.floor(hi.x / size)
+        y0, y1 = math.floor(lo.y / size), math.floor(hi.y / size)
+        z0, z1 = math.floor(lo.z / size), math.floor(hi.z / size)
+        return tuple(
+            (ix, iy, iz)
+            for ix in range(x0, x1 + 1)
+            for iy in range(y0, y1 + 1)
+            for iz in range(z0, z1 + 1)
+        )
+
+    def insert(self, piece):
+        """Add a piece to the index (or re-bucket it if already present).
+
+        Args:
+            piece: BuildingPiece or CurvedRoofPiece
+        """
+        aabb = self._piece_aabb(piece)
+        if aabb is None:
+            self.remove(piece)
+            return
+
+        cells = self._cell_range(*aabb)
+        old_cells = self._piece_cells.get(piece)
+        if old_cells == cells:
+            return
+
+        if old_cells:
+            self._unlink(piece, old_cells)
+        for key in cells:
+            self._cells.setdefault(key, set()).add(piece)
+        self._piece_cells[piece] = cells
+
+    # Moving a piece is just re-inserting it
+    update = insert
+
+    def remove(self, piece):
+        """Remove a piece from the index.
+
+        Args:
+            piece: BuildingPiece or CurvedRoofPiece
+        """
+        cells = self._piece_cells.pop(piece, None)
+        if cells:
+            self._unlink(piece, cells)
+        self._dynamic.discard(piece)
+
+    def _unlink(self, piece, cells):
+        """Remove a piece from a set of grid cells.
+
+        Args:
+            piece: Piece to remove
+            cells: Cell keys the piece was stored in
+        """
+        for key in cells:
+            bucket = self._cells.get(key)
+            if bucket is not None:
+                bucket.discard(piece)
+                if not bucket:
+                    del self._cells[key]
+
+    def mark_dynamic(self, piece):
+        """Track a piece that now moves under physics.
+
+        Args:
+            piece: Piece whose body became dynamic
+        """
+        if piece in self._piece_cells:
+            self._dynamic.add(piece)
+
+    def refresh_dynamic(self):
+        """Re-bucket moving pieces; drop destroyed or removed ones.
+
+        Sleeping bodies are skipped since their AABB cannot have changed.
+        """
+        for piece in list(self._dynamic):
+            if piece.is_destroyed or piece.body_np is None or piece.body_np.isEmpty():
+                self.remove(piece)
+            elif piece.body_np.node().isActive():
+                self.insert(piece)
+
+    def clear(self):
+        """Remove every piece from the index."""
+        self._cells.clear()
+        self._piece_cells.clear()
+        self._dynamic.clear()
+
+    def _candidates(self, position, radius):
+        """Collect pieces from the cells overlapping a sphere's bounding box.
+
+        Args:
+            position: Query centre
+            radius: Query radius
+
+        Returns:
+            Set of candidate pieces
+        """
+        r = Vec3(radius, radius, radius)
+        candidates = set()
+        for key in self._cell_range(position - r, position + r):
+            bucket = self._cells.get(key)
+            if bucket:
+                candidates.update(bucket)
+        return candidates
+
+    def _distance_to_piece(self, piece, position):
+        """Exact distance from a point to a piece's oriented box.
+
+        Args:
+            piece: Indexed piece
+            position: World position
+
+        Returns:
+            Distance (0 if the point is inside the box)
+        """
+        inverse = Mat4(piece.body_np.getMat())
+        inverse.invertInPlace()
+        local = inverse.xformPoint(Point3(position))
+
+        hx, hy, hz = piece.size.x * 0.5, piece.size.y * 0.5, piece.size.z * 0.5
+        dx = max(abs(local.x) - hx, 0.0)
+        dy = max(abs(local.y) - hy, 0.0)
+        dz = max(abs(local.z) - hz, 0.0)
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+    def query_radius(self, position, radius):
+        """Find all live pieces within a radius of a point.
+
+        Args:
+            position: Vec3 world position
+            radius: Search radius (distance to the piece's box, not its centre)
+
+        Returns:
+            List of (piece, distance) tuples sorted by distance, then name
+        """
+        results = []
+        for piece in self._candidates(position, radius):
+            if piece.is_destroyed or piece.body_np is None or piece.body_np.isEmpty():
+                continue
+            dist = self._distance_to_piece(piece, position)
+            if dist <= radius:
+                results.append((piece, dist))
+
+        # Names break ties so seeded destruction visits pieces in a stable order
+        results.sort(key=lambda item: (item[1], item[0].name))
+        return results
+
+    def query_nearest(self, position, max_distance):
+        """Find the piece closest to a point.
+
+        Distance is measured to each piece's box; pieces the point lies on or
+        inside tie at zero and are ranked by distance to their centres.
+
+        Args:
+            position: Vec3 world position
+            max_distance: Maximum distance to consider
+
+        Returns:
+            Closest piece or None
+        """
+        best_piece = None
+        best_key = None
+        for piece in self._candidates(position, max_distance):
+            if piece.is_destroyed or piece.body_np is None or piece.body_np.isEmpty():
+                continue
+            dist = self._distance_to_piece(piece, position)
+            if dist > max_distance:
+                continue
+            key = (dist, (piece.body_np.getPos() - position).lengthSquared())
+            if best_key is None or key < best_key:
+                best_key = key
+                best_piece = piece
+
+        return best_piece
@@ -1,11 +1,27 @@
 """World management and initialization."""
 
+import random
+import time
+
 from panda3d.core import Vec3, Vec4
 from panda3d.bullet import BulletRigidBodyNode, BulletBoxShape
 
 from testgame.config.settings import RENDER_DISTANCE
+from testgame.config.destruction_config import (
+    DAMAGE_SEARCH_RADIUS,
+    DESTRUCTION_SEED,
+    STRUCTURAL_INTEGRITY_ENABLED,
+)
+from testgame.engine.body_registry import get_body_owner
 from testgame.engine.terrain import Terrain
+from testgame.engine.piece_index import PieceSpatialIndex
+from testgame.rendering.geometry_cache import attach_box
+from testgame.structures.debris_pool import DebrisPool
+from testgame.structures.destruction_lod import DestructionLOD
+from testgame.structures.destruction_scheduler import DestructionScheduler
+from testgame.structures.prefracture import Prefracturer
 from testgame.structures.simple_building import SimpleBuilding
+from testgame.structures.structural_load import StructuralSolver
 from testgame.structures.japanese_building import JapaneseBuilding
 from testgame.engine.world_serializer import WorldSerializer
 
@@ -13,16 +29,36 @@ from testgame.engine.world_serializer import WorldSerializer
 class World:
     """Manages the game world state and updates."""
 
-    def __init__(self, render, bullet_world, auto_generate=True, world_data=None):
+    def __init__(
+        self,
+        render,
+        bullet_world,
+        auto_generate=True,
+        world_data=None,
+        seed=DESTRUCTION_SEED,
+        clock=time.time,
+        physics_manager=None,
+    ):
         """Initialize the world.
 
         Args:
             render: Panda3D render node
             bullet_world: Bullet physics world
             auto_generate: Whether to automatically generate initial terrain and buildings
+            world_data: Saved world state to load when auto_generate is False
+            seed: Seed for the destruction RNG (None picks a random seed)
+            clock: Function returning the current time in seconds
+            physics_manager: Optional PhysicsManager that interpolates debris
         """
         self.render = render
         self.bullet_world = bullet_world
+        self.clock = clock
+        self.physics_manager = physics_manager
+
+        # Every random choice made while breaking pieces (fragment scatter,
+        # chunk layouts) draws from this one stream, so a seeded world
+        # replays the same damage identically
+        self.destruction_rng = random.Random(seed)
 
         # Initialize terrain system
         self.terrain = Terrain(render, bullet_world)
@@ -36,12 +72,37 @@ class World:
         # Track buildings
         self.buildings = []
 
+        # Spatial index of all building pieces for damage lookup
+        self.piece_index = PieceSpatialIndex()
+
+        # Spreads debris spawning from destroyed pieces across frames
+        self.destruction_scheduler = DestructionScheduler()
+
+        # Recycled fragment bodies and the global debris budget
+        self.debris_pool = DebrisPool(bullet_world, render, clock=clock)
+        self.debris_pool.physics_manager = physics_manager
+
+        # Reserves chunk layout seeds for pieces when they are first damaged
+        self.prefracturer = Prefracturer(rng=self.destruction_rng)
+
+        # Scales debris from destroyed pieces by viewer distance and debris load
+        self.destruction_lod = DestructionLOD()
+
+        # Fails overloaded supports (off unless structural integrity is enabled)
+        self.structural_solver = (
+            StructuralSolver() if STRUCTURAL_INTEGRITY_ENABLED else None
+        )
+
         # Track props (lanterns, decorations, etc.)
         self.props = []
 
         # Optional point light manager reference for prop lighting
         self.point_light_manager = None
 
+        # Optional RaycastService whose cached hits go stale when damage
+        # changes the world
+        self.raycast_service = None
+
         # Initialize world serializer
         self.serializer = WorldSerializer()
 
@@ -86,7 +147,7 @@ class World:
                 building_info, self.bullet_world, self.render
             )
             if building:
-                self.buildings.append(building)
+                self.add_building(building)
 
         print(
             f"Loaded {len(self.loaded_chunks)} terrain chunks and {len(self.buildings)} buildings from save data"
@@ -157,91 +218,14 @@ class World:
         # Add to physics world
         self.bullet_world.attachRigidBody(body_node)
 
-        # Create visual geometry
-        from panda3d.core import (
-            GeomNode,
-            GeomVertexFormat,
-            GeomVertexData,
-            GeomVertexWriter,
-        )
-        from panda3d.core import Geom, GeomTriangles, Vec4
-
-        # Create vertex data
-        vformat = GeomVertexFormat.getV3n3c4()
-        vdata = GeomVertexData(f"{name}_vdata", vformat, Geom.UHStatic)
-
-        vertex = GeomVertexWriter(vdata, "vertex")
-        normal = GeomVertexWriter(vdata, "normal")
-        color = GeomVertexWriter(vdata, "color")
-
-        # Generate cube vertices with different colors per cube
-        import random
-
+        # Create visual geometry with a different color per cube
         cube_color = Vec4(
             random.uniform(0.5, 1.0),
             random.uniform(0.5, 1.0),
             random.uniform(0.5, 1.0),
             1.0,
         )
-
-        # Define cube vertices (8 corners)
-        s = size / 2
-        vertices = [
-            Vec3(-s, -s, -s),
-            Vec3(s, -s, -s),
-            Vec3(s, s, -s),
-            Vec3(-s, s, -s),  # bottom
-            Vec3(-s, -s, s),
-            Vec3(s, -s, s),
-            Vec3(s, s, s),
-            Vec3(-s, s, s),  # top
-        ]
-
-        # Define faces with normals (counter-clockwise winding for outward-facing)
-        faces = [
-            # Face vertices (CCW from outside), normal
-            ([3, 2, 1, 0], Vec3(0, 0, -1)),  # bottom
-            ([4, 5, 6, 7], Vec3(0, 0, 1)),  # top
-            ([1, 5, 4, 0], Vec3(0, -1, 0)),  # front
-            ([3, 7, 6, 2], Vec3(0, 1, 0)),  # back
-            ([4, 7, 3, 0], Vec3(-1, 0, 0)),  # left
-            ([2, 6, 5, 1], Vec3(1, 0, 0)),  # right
-        ]
-
-        # Build geometry
-        tris = GeomTriangles(Geom.UHStatic)
-        vtx_index = 0
-
-        for face_indices, face_normal in faces:
-            # Two triangles per face (counter-clockwise winding)
-            # First triangle: 0, 1, 2
-            for i in [0, 1, 2]:
-                v = vertices[face_indices[i]]
-                vertex.addData3(v)
-                normal.addData3(face_normal)
-                color.addData4(cube_color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-            # Second triangle: 0, 2, 3
-            for i in [0, 2, 3]:
-                v = vertices[face_indices[i]]
-                vertex.addData3(v)
-                normal.addData3(face_normal)
-                color.addData4(cube_color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-        tris.closePrimitive()
-
-        # Create geometry
-        geom = Geom(vdata)
-        geom.addPrimitive(tris)
-
-        # Create node and attach
-        geom_node = GeomNode(f"{name}_geom")
-        geom_node.addGeom(geom)
-        geom_np = body_np.attachNewNode(geom_node)
+        attach_box(body_np, Vec3(size, size, size), cube_color, f"{name}_geom")
 
         return body_np
 
@@ -259,7 +243,7 @@ class World:
             height=10,
             name="western_building",
         )
-        self.buildings.append(western_building)
+        self.add_building(western_building)
 
         # Create a Japanese-style building
         japanese_building = JapaneseBuilding(
@@ -271,7 +255,7 @@ class World:
             height=7,
             name="japanese_building",
         )
-        self.buildings.append(japanese_building)
+        self.add_building(japanese_building)
 
         print(f"Created {len(self.buildings)} example buildings (Western + Japanese)")
 
@@ -281,7 +265,21 @@ class World:
         Args:
             building: Building instance to add
         """
+        self._sync_physics()
         self.buildings.append(building)
+        if hasattr(building, "attach_piece_index"):
+            building.attach_piece_index(self.piece_index)
+            building.destruction_scheduler = self.destruction_scheduler
+            building.debris_pool = self.debris_pool
+            building.prefracturer = self.prefracturer
+            building.destruction_lod = self.destruction_lod
+            building.destruction_rng = self.destruction_rng
+            building.structural_solver = self.structural_solver
+            building.physics_manager = self.physics_manager
+            building.build_render_batch()
+            building.build_compound_collision()
+            if self.structural_solver is not None:
+                self.structural_solver.mark_building(building)
         print(
             f"Added building '{building.name}' to world (total: {len(self.buildings)} buildings)"
         )
@@ -295,6 +293,42 @@ class World:
         self.props.append(prop)
         print(f"Added prop to world (total: {len(self.props)} props)")
 
+    def damage_at_hit(self, hit, damage=50):
+        """Damage whatever a physics raycast hit.
+
+        The hit body is resolved to its owning piece through the body
+        registry; the nearest-piece search is only used when the hit node has
+        no registered owner.
+
+        Args:
+            hit: Raycast result dict with 'position' and 'node' keys
+                (as returned by BuildingRaycaster)
+            damage: Amount of damage to apply
+
+        Returns:
+            bool: True if something was damaged
+        """
+        if not hit or not hit.get("hit", True):
+            return False
+
+        self._sync_physics()
+        position = hit["position"]
+        owner = get_body_owner(hit.get("node"))
+        if hasattr(owner, "piece_for_child"):
+            # Shared building body: the child index identifies the piece
+            owner = owner.piece_for_child(hit.get("shape_index", -1))
+        if owner is None:
+            return self.damage_building_at_position(position, damage=damage)
+
+        building = getattr(owner, "parent_building", None)
+        if building is None or owner.is_destroyed:
+            # Props and orphaned pieces absorb the hit
+            return False
+
+        building.damage_piece(owner.name, damage, impact_pos=position)
+        self._invalidate_raycasts()
+        return True
+
     def damage_building_at_position(self, position, damage=50):
         """Damage a building piece at or near a position.
 
@@ -305,29 +339,68 @@ class World:
         Returns:
             bool: True if something was damaged
         """
-        # Find the closest building piece
-        closest_building = None
-        closest_piece = None
-        closest_dist = float("inf")
+        self._sync_physics()
+        piece = self.piece_index.query_nearest(position, DAMAGE_SEARCH_RADIUS)
+        if piece is None or piece.parent_building is None:
+            return False
 
-        for building in self.buildings:
-            piece = building.get_piece_at_position(position, max_distance=5.0)
-            if piece:
-                piece_pos = piece.body_np.getPos()
-                dist = (piece_pos - position).length()
-                if dist < closest_dist:
-                    closest_dist = dist
-                    closest_piece = piece
-                    closest_building = building
-
-        if closest_piece and closest_building:
-            print(f"Damaging {closest_piece.name} (distance: {closest_dist:.2f})")
-            closest_building.damage_piece(
-                closest_piece.name, damage, impact_pos=position
+        dist = (piece.body_np.getPos() - position).length()
+        print(f"Damaging {piece.name} (distance: {dist:.2f})")
+        piece.parent_building.damage_piece(piece.name, damage, impact_pos=position)
+        self._invalidate_raycasts()
+        return True
+
+    def damage_in_radius(self, center, radius, damage, create_fragments=False):
+        """Damage every building piece within a radius, with linear falloff.
+
+        Pieces are grouped per building so each building runs its stability
+        check once for the whole blast.
+
+        Args:
+            center: Vec3 world position of the blast
+            radius: Blast radius (measured to each piece's surface)
+            damage: Damage at the centre, falling to zero at the radius
+            create_fragments: If True, chunked pieces also spawn fragments
+
+        Returns:
+            int: Number of pieces destroyed
+        """
+        self._sync_physics()
+        damage_by_building = {}
+        for piece, dist in self.piece_index.query_radius(center, radius):
+            building = piece.parent_building
+            amount = damage * (1.0 - dist / radius)
+            if building is None or amount <= 0:
+                continue
+            damage_by_building.setdefault(building, {})[piece.name] = amount
+
+        destroyed = 0
+        for building, damage_map in damage_by_building.items():
+            destroyed += len(
+                building.damage_pieces(
+                    damage_map,
+                    create_fragments=create_fragments,
+                    impact_pos=center,
+                )
+            )
+
+        if damage_by_building:
+            self._invalidate_raycasts()
+            print(
+                f"Blast hit {sum(len(m) for m in damage_by_building.values())} pieces, "
+                f"destroyed {destroyed}"
             )
-            return True
+        return destroyed
 
-        return False
+    def _sync_physics(self):
+        """Wait for a threaded physics step before changing the physics world."""
+        if self.physics_manager is not None:
+            self.physics_manager.sync()
+
+    def _invalidate_raycasts(self):
+        """Drop cached raycast hits after the world changed."""
+        if self.raycast_service is not None:
+            self.raycast_service.invalidate()
 
     def update(self, dt, camera_pos=None):
         """Update world state.
@@ -336,18 +409,33 @@ class World:
             dt: Delta time since last update
             camera_pos: Camera position for dynamic chunk loading (optional)
         """
+        self._sync_physics()
+
         # Update terrain (for dynamic loading if needed)
         if camera_pos:
             self.terrain.update(camera_pos)
+            self.destruction_lod.set_viewer(camera_pos)
 
-        # Update buildings (cleanup debris)
-        import time
+        # Spawn queued debris within this frame's budget
+        self.destruction_scheduler.process()
 
-        current_time = time.time()
+        # Keep moving pieces bucketed correctly in the spatial index
+        self.piece_index.refresh_dynamic()
+
+        # Update buildings (cleanup debris)
+        current_time = self.clock()
+        self.debris_pool.update(current_time)
         for building in self.buildings:
             if hasattr(building, "update"):
                 building.update(dt, current_time)
 
+        # Re-solve loads around this frame's damage within the solver's budget
+        if self.structural_solver is not None:
+            self.structural_solver.update()
+
+        # Debris spawns and load failures above may have moved or removed bodies
+        self._invalidate_raycasts()
+
     def update_chunks_around_position(self, position):
         """Load/unload chunks based on position.
 
@@ -434,7 +522,7 @@ class World:
             name="standalone_wall",
         )
         wall_building.add_piece(wall)
-        self.buildings.append(wall_building)
+        self.add_building(wall_building)
 
         print(f"Created standalone destructible wall at {wall_base_position}")
 
@@ -473,11 +561,19 @@ class World:
 
     def clear_world(self):
         """Clear all objects from the world (buildings, physics objects, etc.)."""
+        self._sync_physics()
+
         # Remove all buildings
         for building in self.buildings:
             if hasattr(building, "destroy"):
                 building.destroy()
         self.buildings.clear()
+        self.piece_index.clear()
+        self.destruction_scheduler.clear()
+        self.debris_pool.clear()
+        self.prefracturer.clear()
+        if self.structural_solver is not None:
+            self.structural_solver.clear()
 
         # Remove all physics objects
         for obj_np in self.physics_objects:
@@ -486,5 +582,6 @@ class World:
                 self.bullet_world.removeRigidBody(body_node)
                 obj_np.removeNode()
         self.physics_objects.clear()
+        self._invalidate_raycasts()
 
         print("World cleared")
@@ -232,8 +232,24 @@ class WorldSerializer:
                 "pieces": [],
             }
 
+            # Blueprint buildings only store what differs from the blueprint
+            blueprint = getattr(building, "blueprint", None)
+            if blueprint is not None:
+                building_data["blueprint"] = blueprint.blueprint_id
+                building_data["dimensions"] = list(blueprint.dimensions)
+                building_data["rotation"] = getattr(building, "rotation", 0.0)
+                building_data["removed"] = [
+                    spec.suffix
+                    for spec in blueprint.pieces
+                    if self._blueprint_piece_removed(building, spec)
+                ]
+
             # Serialize each piece (building.pieces is a list, not a dict)
             for piece in building.pieces:
+                if blueprint is not None and not self._piece_differs_from_blueprint(
+                    building, piece
+                ):
+                    continue
                 if not piece.is_destroyed:
                     piece_data = {
                         "name": piece.name,
@@ -243,6 +259,7 @@ class WorldSerializer:
                         "color": self._vec4_to_list(piece.color),
                         "mass": piece.mass,
                         "health": piece.health,
+                        "max_health": piece.max_health,
                         "piece_type": piece.piece_type,
                     }
 
@@ -255,15 +272,77 @@ class WorldSerializer:
                     piece_data["angular_velocity"] = self._vec3_to_list(
                         angular_velocity
                     )
+                    piece_data["dynamic"] = body_node.getMass() > 0
 
                     building_data["pieces"].append(piece_data)
 
             # Only save building if it has pieces
-            if building_data["pieces"]:
+            has_blueprint_pieces = blueprint is not None and len(
+                building_data["removed"]
+            ) < len(blueprint.pieces)
+            if building_data["pieces"] or has_blueprint_pieces:
                 serialized.append(building_data)
 
         return serialized
 
+    def _blueprint_piece_removed(self, building, spec):
+        """Check whether a blueprint piece no longer exists in a building.
+
+        Args:
+            building: Building built from a blueprint
+            spec: PieceSpec from that blueprint
+
+        Returns:
+            bool: True if the piece is gone or destroyed
+        """
+        piece = building.piece_map.get(f"{building.name}_{spec.suffix}")
+        return piece is None or piece.is_destroyed
+
+    def _piece_differs_from_blueprint(self, building, piece):
+        """Check whether a piece has to be saved in full.
+
+        Args:
+            building: Building built from a blueprint
+            piece: Piece of that building
+
+        Returns:
+            bool: True for damaged, moved or released pieces and for pieces
+            (such as debris chunks) that are not in the blueprint
+        """
+        prefix = f"{building.name}_"
+        spec = None
+        if piece.name.startswith(prefix):
+            spec = building.blueprint.piece_specs.get(piece.name[len(prefix) :])
+        if spec is None:
+            return True
+
+        if piece.health < piece.max_health:
+            return True
+        if piece.body_np.node().getMass() > 0:
+            return True
+
+        expected_pos, expected_quat = self._blueprint_transform(building, spec)
+        if not piece.body_np.getPos().almostEqual(expected_pos, 1e-4):
+            return True
+        return not piece.body_np.getQuat().almostSameDirection(expected_quat, 1e-4)
+
+    def _blueprint_transform(self, building, spec):
+        """Get where a blueprint piece sits in a building that may be turned.
+
+        Placed buildings are turned about their position by their heading
+        (the building's rotation attribute, in degrees).
+
+        Args:
+            building: Building built from a blueprint
+            spec: PieceSpec from that blueprint
+
+        Returns:
+            tuple: (Vec3 world position, Quat world rotation)
+        """
+        quat = Quat()
+        quat.setHpr(Vec3(getattr(building, "rotation", 0.0), 0, 0))
+        return building.position + quat.xform(Vec3(*spec.offset)), quat
+
     def _deserialize_buildings(self, data, world):
         """Deserialize buildings.
 
@@ -278,7 +357,11 @@ class WorldSerializer:
             position = Vec3(*building_data["position"])
 
             # Create appropriate building type
-            if building_type == "SimpleBuilding":
+            if "blueprint" in building_data:
+                building = self._deserialize_blueprint_building(building_data, world)
+                if building is not None:
+                    world.add_building(building)
+            elif building_type == "SimpleBuilding":
                 # For SimpleBuilding, we need to reconstruct it manually
                 # since it has special constructor parameters
                 building = Building(
@@ -317,12 +400,13 @@ class WorldSerializer:
                         Vec3(*piece_data["angular_velocity"])
                     )
 
-                    # Restore health
+                    # Restore health (older saves have no max_health)
+                    piece.max_health = piece_data.get("max_health", piece.max_health)
                     piece.health = piece_data["health"]
 
                     building.add_piece(piece)
 
-                world.buildings.append(building)
+                world.add_building(building)
             else:
                 # Generic building type
                 building = Building(
@@ -356,11 +440,101 @@ class WorldSerializer:
                     piece.body_np.node().setAngularVelocity(
                         Vec3(*piece_data["angular_velocity"])
                     )
+                    piece.max_health = piece_data.get("max_health", piece.max_health)
                     piece.health = piece_data["health"]
 
                     building.add_piece(piece)
 
-                world.buildings.append(building)
+                world.add_building(building)
+
+    def _deserialize_blueprint_building(self, building_data, world):
+        """Rebuild a building from its blueprint and apply the saved differences.
+
+        Args:
+            building_data: Dict with blueprint id, dimensions, removed pieces
+                and the pieces that differ from the blueprint
+            world: World instance the building belongs to
+
+        Returns:
+            Building, or None if the building type is unknown
+        """
+        from testgame.structures.building import BuildingPiece
+        from testgame.structures.japanese_building import JapaneseBuilding
+        from testgame.structures.simple_building import SimpleBuilding
+
+        building_classes = {
+            "SimpleBuilding": SimpleBuilding,
+            "JapaneseBuilding": JapaneseBuilding,
+        }
+        building_class = building_classes.get(building_data["type"])
+        if building_class is None:
+            print(
+                f"Warning: Unknown blueprint building type "
+                f"'{building_data['type']}', skipping"
+            )
+            return None
+
+        name = building_data["name"]
+        building = building_class(
+            world.bullet_world,
+            world.render,
+            Vec3(*building_data["position"]),
+            *building_data["dimensions"],
+            name=name,
+        )
+
+        # Turn the blueprint pieces the way the building was placed
+        heading = building_data.get("rotation", 0.0)
+        if heading:
+            building.rotation = heading
+            for spec in building.blueprint.pieces:
+                piece = building.piece_map[f"{name}_{spec.suffix}"]
+                position, quat = self._blueprint_transform(building, spec)
+                piece.body_np.setPos(position)
+                piece.body_np.setQuat(quat)
+                piece.position = position
+
+        for suffix in building_data.get("removed", []):
+            piece = building.piece_map.get(f"{name}_{suffix}")
+            if piece is not None:
+                building.remove_piece(piece)
+
+        for piece_data in building_data["pieces"]:
+            piece = building.piece_map.get(piece_data["name"])
+            if piece is None:
+                # Not part of the blueprint (e.g. a debris chunk)
+                piece = BuildingPiece(
+                    world.bullet_world,
+                    world.render,
+                    Vec3(*piece_data["position"]),
+                    Vec3(*piece_data["size"]),
+                    piece_data["mass"],
+                    Vec4(*piece_data["color"]),
+                    piece_data["name"],
+                    piece_type=piece_data["piece_type"],
+                    parent_building=building,
+                )
+                building.add_piece(piece)
+            else:
+                piece.body_np.setPos(Vec3(*piece_data["position"]))
+
+            piece.body_np.setQuat(Quat(*piece_data["rotation"]))
+            # Chunks are weaker than the piece they came from
+            piece.max_health = piece_data.get("max_health", piece.max_health)
+            piece.health = piece_data["health"]
+            if piece.health < piece.max_health and hasattr(
+                piece, "_update_damage_color"
+            ):
+                piece._update_damage_color(piece.health / piece.max_health)
+
+            if piece_data.get("dynamic"):
+                building.release_piece(piece)
+            piece.body_np.node().setLinearVelocity(Vec3(*piece_data["velocity"]))
+            piece.body_np.node().setAngularVelocity(
+                Vec3(*piece_data["angular_velocity"])
+            )
+
+        return building
 
     def _serialize_physics_objects(self, physics_objects):
         """Serialize physics objects (like cubes).
@@ -608,6 +782,14 @@ class WorldSerializer:
         for building in world.buildings:
             building.destroy()
         world.buildings.clear()
+        if hasattr(world, "piece_index"):
+            world.piece_index.clear()
+        if hasattr(world, "destruction_scheduler"):
+            world.destruction_scheduler.clear()
+        if hasattr(world, "debris_pool"):
+            world.debris_pool.clear()
+        if hasattr(world, "prefracturer"):
+            world.prefracturer.clear()
 
         # Remove all props (gltf models, lights)
         for prop in getattr(world, "props", []):
@@ -8,7 +8,6 @@ from direct.showbase.ShowBaseGlobal import globalClock
 
 from testgame.config.settings import (
     configure,
-    PHYSICS_FPS,
     GRAVITY,
     FOG_ENABLED,
     FOG_COLOR,
@@ -16,17 +15,21 @@ from testgame.config.settings import (
     FOG_END_DISTANCE,
     FOG_STRENGTH,
 )
+from testgame.config.destruction_config import DEBRIS_INSTANCING_ENABLED
+from testgame.engine.physics_manager import PhysicsManager
 from testgame.engine.world import World
 from testgame.player.controller import PlayerController
 from testgame.player.camera import CameraController
 from testgame.player.character_model import CharacterModel
-from testgame.interaction.raycast import TerrainRaycaster
+from testgame.interaction.heightfield_raycast import HeightfieldRaycaster
 from testgame.interaction.terrain_editor import TerrainEditor
 from testgame.interaction.building_raycast import BuildingRaycaster
+from testgame.interaction.raycast_service import RaycastService
 from testgame.rendering.brush_indicator import BrushIndicator
 from testgame.rendering.shadow_manager import ShadowManager
 from testgame.rendering.post_process import PostProcessManager
 from testgame.rendering.effects import EffectsManager
+from testgame.rendering.instanced_debris import InstancedDebrisRenderer
 from testgame.rendering.weapon_viewmodel import WeaponViewModel
 from testgame.rendering.skybox import MountainSkybox
 from testgame.rendering.point_light_manager import PointLightManager
@@ -52,8 +55,14 @@ class Game(ShowBase):
         # Setup mouse control early
         self.mouse_captured = False
 
-        # Start update task (will check if level is loaded)
-        self.taskMgr.add(self.update, "update")
+        # Join the previous frame's physics step before input events (the
+        # event manager runs at sort 0) can touch the physics world
+        self.taskMgr.add(self.sync_physics, "physicsSync", sort=-60)
+
+        # Start update task (will check if level is loaded). It runs after the
+        # event manager, intervals and collisions and ends by starting the
+        # physics step, so a threaded step overlaps only rendering (sort 50)
+        self.taskMgr.add(self.update, "update", sort=40)
 
         self.saves_dir = Path(saves_directory)
         self.saves_dir.mkdir(exist_ok=True)
@@ -102,8 +111,10 @@ class Game(ShowBase):
         """Return to main menu."""
         print("Returning to main menu...")
         # Clean up current level/game state
+        self.physics.sync()
         if hasattr(self, "game_world"):
             # self.game_world.cleanup()
+            self.game_world.prefracturer.shutdown()
             del self.game_world
         if hasattr(self, "player"):
             # self.player.cleanup()
@@ -165,7 +176,16 @@ class Game(ShowBase):
         print("Created mountain skybox with distant peaks, clouds, and sun")
 
         # Initialize world and terrain
-        self.game_world = World(self.render, self.world)
+        self.game_world = World(self.render, self.world, physics_manager=self.physics)
+
+        # Draw debris fragments with one instanced call when the GPU allows it
+        if DEBRIS_INSTANCING_ENABLED and InstancedDebrisRenderer.is_supported(
+            self.win.getGsg()
+        ):
+            self.game_world.debris_pool.set_renderer(
+                InstancedDebrisRenderer(self.render)
+            )
+            print("Debris fragments use instanced rendering")
 
         # Initialize player (start at the base of Mount Everest)
         start_pos = Vec3(
@@ -182,15 +202,22 @@ class Game(ShowBase):
         self.character_model.hide()  # Start hidden (first-person mode)
 
         # Initialize terrain editing
-        self.raycaster = TerrainRaycaster(self.cam, self.render)
+        self.raycaster = HeightfieldRaycaster(
+            self.cam, self.render, self.game_world.terrain
+        )
         self.terrain_editor = TerrainEditor(self.game_world.terrain)
         self.brush_indicator = BrushIndicator(self.render)
 
         # Initialize building raycaster for physics-based shooting
         self.building_raycaster = BuildingRaycaster(self.world, self.render)
 
+        # Shared per-frame raycast cache used by tools, brush indicator and HUD
+        self.raycast_service = RaycastService(self.raycaster, self.building_raycaster)
+        self.terrain_editor.raycast_service = self.raycast_service
+        self.game_world.raycast_service = self.raycast_service
+
         # Initialize HUD
-        self.hud = HUD(self.aspect2d, self.render)
+        self.hud = HUD(self.aspect2d, self.render, raycast_service=self.raycast_service)
 
         # Set initial player health (for demonstration)
         self.player_health = 100
@@ -205,6 +232,10 @@ class Game(ShowBase):
 
         # Initialize effects manager
         self.effects_manager = EffectsManager(self.render)
+        # Distant destruction shows a dust puff instead of debris
+        self.game_world.destruction_lod.effect_callback = (
+            self.effects_manager.create_dust_puff
+        )
 
         # Initialize weapon viewmodel (FPS-style weapon display)
         self.weapon_viewmodel = WeaponViewModel(self.camera)
@@ -221,11 +252,11 @@ class Game(ShowBase):
             self.game_world,
             self.camera,
             self.effects_manager,
-            self.building_raycaster,
+            self.raycast_service,
             self.weapon_viewmodel,
             self.render,
             self.world,
-            self.raycaster,
+            self.raycast_service,
             self.mouseWatcherNode,
             self.point_light_manager,
         )
@@ -364,6 +395,9 @@ class Game(ShowBase):
         self.world = BulletWorld()
         self.world.setGravity(Vec3(0, 0, GRAVITY))
 
+        # Fixed-step simulation with interpolated visuals
+        self.physics = PhysicsManager(self.world)
+
         # Optional: Enable debug visualization
         debugNode = BulletDebugNode("Debug")
         debugNode.showWireframe(True)
@@ -581,7 +615,7 @@ class Game(ShowBase):
             ToolType.FIST,
         ]:
             # Get hit info for these tools
-            hit = self.raycaster.get_terrain_hit(self.mouseWatcherNode)
+            hit = self.raycast_service.get_terrain_hit(self.mouseWatcherNode)
 
             if button == 1:  # Left click
                 result = self.tool_manager.use_primary(hit)
@@ -638,7 +672,7 @@ class Game(ShowBase):
                 and active_tool == self.rotation_active_tool
             ):
                 if not self.rotation_has_moved:
-                    hit = self.raycaster.get_terrain_hit(self.mouseWatcherNode)
+                    hit = self.raycast_service.get_terrain_hit(self.mouseWatcherNode)
                     if hit:
                         self.tool_manager.use_secondary(hit)
                 if hasattr(self.rotation_active_tool, "end_rotation_gesture"):
@@ -1025,8 +1059,16 @@ class Game(ShowBase):
         print("\nQuitting game...")
         if hasattr(self, "shadow_manager") and self.shadow_manager:
             self.shadow_manager.cleanup()
+        self.physics.shutdown()
+        if hasattr(self, "game_world"):
+            self.game_world.prefracturer.shutdown()
         self.userExit()
 
+    def sync_physics(self, task):
+        """Finish the physics step started at the end of the last frame."""
+        self.physics.sync()
+        return task.cont
+
     def update(self, task):
         """Main game loop"""
         dt = globalClock.getDt()
@@ -1103,7 +1145,7 @@ class Game(ShowBase):
                 self.win.movePointer(0, center_x, center_y)
 
         # Handle tool usage
-        hit = self.raycaster.get_terrain_hit(self.mouseWatcherNode)
+        hit = self.raycast_service.get_terrain_hit(self.mouseWatcherNode)
         if hit:
             # Update brush indicator position (only show for terrain tool)
             if active_tool and active_tool.tool_type == ToolType.TERRAIN:
@@ -1188,12 +1230,12 @@ class Game(ShowBase):
         is_jumping = not self.player.is_on_ground()
         self.character_model.update(dt, is_moving, is_running, is_jumping)
 
-        # Update physics
-        self.world.doPhysics(dt, 10, 1.0 / PHYSICS_FPS)
-
         # Update game world
         self.game_world.update(dt, player_pos)
 
+        # Update physics last so a threaded step overlaps rendering
+        self.physics.update(dt)
+
         return task.cont
 
     def quick_save(self):
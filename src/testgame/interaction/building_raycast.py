@@ -1,6 +1,7 @@
 """Raycasting specifically for building/physics objects."""
 
-from panda3d.core import Vec3
+import numpy as np
+from panda3d.core import BitMask32, Point3, Vec3
 
 
 class BuildingRaycaster:
@@ -16,15 +17,29 @@ class BuildingRaycaster:
         self.bullet_world = bullet_world
         self.render = render
 
-    def raycast_from_camera(self, camera, max_distance=100.0):
+    @staticmethod
+    def _mask(mask):
+        """Resolve an optional collide mask.
+
+        Args:
+            mask: BitMask32 or None
+
+        Returns:
+            BitMask32 to pass to Bullet
+        """
+        return BitMask32.allOn() if mask is None else mask
+
+    def raycast_from_camera(self, camera, max_distance=100.0, mask=None):
         """Perform raycast from camera forward.
 
         Args:
             camera: Camera node
             max_distance: Maximum ray distance
+            mask: Optional BitMask32 collide mask (defaults to all bits)
 
         Returns:
-            dict with keys: hit (bool), position (Vec3), normal (Vec3), node (NodePath), distance (float)
+            dict with keys: hit (bool), position (Vec3), normal (Vec3), node (NodePath),
+            shape_index (int, child index within a compound body), distance (float)
         """
         # Get camera position in world space
         cam_pos = camera.getPos(self.render)
@@ -37,7 +52,7 @@ class BuildingRaycaster:
         end_pos = cam_pos + forward * max_distance
 
         # Perform bullet physics raycast
-        result = self.bullet_world.rayTestClosest(cam_pos, end_pos)
+        result = self.bullet_world.rayTestClosest(cam_pos, end_pos, self._mask(mask))
 
         if result.hasHit():
             hit_pos = result.getHitPos()
@@ -50,6 +65,7 @@ class BuildingRaycaster:
                 "position": hit_pos,
                 "normal": hit_normal,
                 "node": hit_node,
+                "shape_index": result.getTriangleIndex(),
                 "distance": distance,
             }
         else:
@@ -62,17 +78,18 @@ class BuildingRaycaster:
                 "distance": max_distance,
             }
 
-    def raycast(self, start_pos, end_pos):
+    def raycast(self, start_pos, end_pos, mask=None):
         """Perform raycast between two points.
 
         Args:
             start_pos: Vec3 starting position
             end_pos: Vec3 ending position
+            mask: Optional BitMask32 collide mask (defaults to all bits)
 
         Returns:
             dict with hit information
         """
-        result = self.bullet_world.rayTestClosest(start_pos, end_pos)
+        result = self.bullet_world.rayTestClosest(start_pos, end_pos, self._mask(mask))
 
         if result.hasHit():
             hit_pos = result.getHitPos()
@@ -85,6 +102,7 @@ class BuildingRaycaster:
                 "position": hit_pos,
                 "normal": hit_normal,
                 "node": hit_node,
+                "shape_index": result.getTriangleIndex(),
                 "distance": distance,
             }
         else:
@@ -97,17 +115,18 @@ class BuildingRaycaster:
                 "distance": distance,
             }
 
-    def raycast_all(self, start_pos, end_pos):
+    def raycast_all(self, start_pos, end_pos, mask=None):
         """Perform raycast and get ALL hits along the ray.
 
         Args:
             start_pos: Vec3 starting position
             end_pos: Vec3 ending position
+            mask: Optional BitMask32 collide mask (defaults to all bits)
 
         Returns:
             list of dicts with hit information, sorted by distance
         """
-        result = self.bullet_world.rayTestAll(start_pos, end_pos)
+        result = self.bullet_world.rayTestAll(start_pos, end_pos, self._mask(mask))
 
         hits = []
         if result.hasHits():
@@ -124,6 +143,7 @@ class BuildingRaycaster:
                         "position": hit_pos,
                         "normal": hit_normal,
                         "node": hit_node,
+                        "shape_index": hit.getTriangleIndex(),
                         "distance": distance,
                     }
                 )
@@ -131,3 +151,100 @@ class BuildingRaycaster:
         # Sort by distance (closest first)
         hits.sort(key=lambda h: h["distance"])
         return hits
+
+    def raycast_batch(self, starts, ends, mask=None):
+        """Perform many closest-hit raycasts in one call.
+
+        Results are written straight into preallocated NumPy arrays, so there
+        is no per-ray dict or sorting overhead. Suited to shotgun spreads,
+        line-of-sight checks and placement probes.
+
+        Args:
+            starts: Array-like of shape (N, 3) with ray start positions
+            ends: Array-like of shape (N, 3) with ray end positions
+            mask: Optional BitMask32 collide mask (defaults to all bits)
+
+        Returns:
+            dict with keys:
+                hit: (N,) bool array
+                positions: (N, 3) float32 hit positions (ray end on a miss)
+                normals: (N, 3) float32 hit normals (zero on a miss)
+                distances: (N,) float32 hit distances (ray length on a miss)
+                nodes: List of N hit Bullet nodes (None on a miss), which
+                    get_body_owner() resolves
+                shape_indices: (N,) int32 child index within a compound
+                    body (-1 on a miss)
+        """
+        starts = np.asarray(starts, dtype=np.float32).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=np.float32).reshape(-1, 3)
+        count = len(starts)
+
+        hit = np.zeros(count, dtype=bool)
+        positions = ends.copy()
+        normals = np.zeros((count, 3), dtype=np.float32)
+        distances = np.linalg.norm(ends - starts, axis=1).astype(np.float32)
+        nodes = [None] * count
+        shape_indices = np.full(count, -1, dtype=np.int32)
+
+        ray_test = self.bullet_world.rayTestClosest
+        bit_mask = self._mask(mask)
+
+        # Gather hits into flat Python lists and convert once at the end;
+        # writing Panda vectors into NumPy rows one at a time is much slower
+        hit_index = []
+        hit_pos = []
+        hit_normal = []
+        hit_fraction = []
+        hit_shapes = []
+        for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+            result = ray_test(Point3(*start), Point3(*end), bit_mask)
+            if result.hasHit():
+                hit_index.append(i)
+                hit_pos.extend(result.getHitPos())
+                hit_normal.extend(result.getHitNormal())
+                hit_fraction.append(result.getHitFraction())
+                hit_shapes.append(result.getTriangleIndex())
+                nodes[i] = result.getNode()
+
+        if hit_index:
+            hit[hit_index] = True
+            positions[hit_index] = np.reshape(hit_pos, (-1, 3))
+            normals[hit_index] = np.reshape(hit_normal, (-1, 3))
+            distances[hit_index] *= np.asarray(hit_fraction, dtype=np.float32)
+            shape_indices[hit_index] = hit_shapes
+
+        return {
+            "hit": hit,
+            "positions": positions,
+            "normals": normals,
+            "distances": distances,
+            "nodes": nodes,
+            "shape_indices": shape_indices,
+        }
+
+    @staticmethod
+    def batch_hit(batch, index):
+        """Get one ray of a raycast_batch() result as a raycast() dict.
+
+        Lets a batch hit be passed to code that takes single hits, such as
+        World.damage_at_hit.
+
+        Args:
+            batch: Dict returned by raycast_batch()
+            index: Ray index
+
+        Returns:
+            dict with hit information
+        """
+        hit = {
+            "hit": bool(batch["hit"][index]),
+            "position": Vec3(*batch["positions"][index].tolist()),
+            "normal": Vec3(*batch["normals"][index].tolist()),
+            "node": batch["nodes"][index],
+            "distance": float(batch["distances"][index]),
+        }
+        if hit["hit"]:
+            hit["shape_index"] = int(batch["shape_indices"][index])
+        else:
+            hit["normal"] = Vec3(0, 0, 1)
+        return hit
@@ -0,0 +1,324 @@
+"""Heightfield ray marching for terrain picking."""
+
+import math
+
+from panda3d.core import Point3, Vec3
+
+from testgame.config.settings import CHUNK_SIZE, RENDER_DISTANCE
+
+
+def _walk_grid(ox, oy, dx, dy, cell_size, t_start, t_end):
+    """Walk the 2D grid cells crossed by a ray segment (Amanatides-Woo DDA).
+
+    Args:
+        ox: Ray origin X, relative to the grid origin
+        oy: Ray origin Y, relative to the grid origin
+        dx: Ray direction X
+        dy: Ray direction Y
+        cell_size: Grid cell size in world units
+        t_start: Ray parameter where the walk starts
+        t_end: Ray parameter where the walk stops
+
+    Yields:
+        Tuple (ix, iy, t_enter, t_exit) for every cell crossed, in ray order
+    """
+    x = ox + dx * t_start
+    y = oy + dy * t_start
+    ix = math.floor(x / cell_size)
+    iy = math.floor(y / cell_size)
+
+    if dx > 0:
+        step_x = 1
+        t_max_x = t_start + ((ix + 1) * cell_size - x) / dx
+        t_delta_x = cell_size / dx
+    elif dx < 0:
+        step_x = -1
+        t_max_x = t_start + (ix * cell_size - x) / dx
+        t_delta_x = -cell_size / dx
+    else:
+        step_x = 0
+        t_max_x = math.inf
+        t_delta_x = math.inf
+
+    if dy > 0:
+        step_y = 1
+        t_max_y = t_start + ((iy + 1) * cell_size - y) / dy
+        t_delta_y = cell_size / dy
+    elif dy < 0:
+        step_y = -1
+        t_max_y = t_start + (iy * cell_size - y) / dy
+        t_delta_y = -cell_size / dy
+    else:
+        step_y = 0
+        t_max_y = math.inf
+        t_delta_y = math.inf
+
+    t = t_start
+    while t < t_end:
+        t_next = min(t_max_x, t_max_y, t_end)
+        yield ix, iy, t, t_next
+        if t_max_x < t_max_y:
+            ix += step_x
+            t = t_max_x
+            t_max_x += t_delta_x
+        else:
+            iy += step_y
+            t = t_max_y
+            t_max_y += t_delta_y
+
+
+def _intersect_triangle(origin, direction, a, b, c):
+    """Intersect a ray with a triangle (Moller-Trumbore, two-sided).
+
+    Args:
+        origin: Ray origin as (x, y, z)
+        direction: Ray direction as (x, y, z)
+        a: First triangle vertex as (x, y, z)
+        b: Second triangle vertex as (x, y, z)
+        c: Third triangle vertex as (x, y, z)
+
+    Returns:
+        Ray parameter t of the hit, or None if the ray misses
+    """
+    e1x, e1y, e1z = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+    e2x, e2y, e2z = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+    dx, dy, dz = direction
+
+    px = dy * e2z - dz * e2y
+    py = dz * e2x - dx * e2z
+    pz = dx * e2y - dy * e2x
+    det = e1x * px + e1y * py + e1z * pz
+    if abs(det) < 1e-12:
+        return None
+
+    inv_det = 1.0 / det
+    sx, sy, sz = origin[0] - a[0], origin[1] - a[1], origin[2] - a[2]
+    u = (sx * px + sy * py + sz * pz) * inv_det
+    if u < 0.0 or u > 1.0:
+        return None
+
+    qx = sy * e1z - sz * e1y
+    qy = sz * e1x - sx * e1z
+    qz = sx * e1y - sy * e1x
+    v = (dx * qx + dy * qy + dz * qz) * inv_det
+    if v < 0.0 or u + v > 1.0:
+        return None
+
+    return (e2x * qx + e2y * qy + e2z * qz) * inv_det
+
+
+def _triangle_normal(a, b, c):
+    """Compute the upward-facing unit normal of a terrain triangle.
+
+    Args:
+        a: First vertex as (x, y, z)
+        b: Second vertex as (x, y, z)
+        c: Third vertex as (x, y, z)
+
+    Returns:
+        Vec3 unit normal with a non-negative Z component
+    """
+    normal = Vec3(b[0] - a[0], b[1] - a[1], b[2] - a[2]).cross(
+        Vec3(c[0] - a[0], c[1] - a[1], c[2] - a[2])
+    )
+    if normal.z < 0:
+        normal = -normal
+    normal.normalize()
+    return normal
+
+
+class HeightfieldRaycaster:
+    """Intersects rays directly with terrain chunk heightfields.
+
+    Drop-in replacement for TerrainRaycaster. Instead of traversing the scene
+    graph, the ray is walked across the chunk grid and then across the cells
+    of each chunk it crosses, so the cost depends on ray length rather than on
+    how much is in the scene. Chunks and cells whose height range the ray
+    cannot touch are skipped before any triangle is tested.
+    """
+
+    def __init__(self, camera, render, terrain, max_distance=None):
+        """Initialize heightfield raycaster.
+
+        Args:
+            camera: Panda3D camera NodePath
+            render: Render node (world space reference)
+            terrain: Terrain instance whose chunks are tested
+            max_distance: Maximum ray length for mouse picking (defaults to
+                the loaded terrain radius)
+        """
+        self.camera = camera
+        self.render = render
+        self.terrain = terrain
+        if max_distance is None:
+            max_distance = RENDER_DISTANCE * CHUNK_SIZE * 1.5
+        self.max_distance = max_distance
+
+    def get_terrain_hit(self, mouse_watcher):
+        """Cast ray from camera through mouse position to find terrain hit.
+
+        Args:
+            mouse_watcher: MouseWatcher node
+
+        Returns:
+            Dict with hit info or None if no hit:
+            {
+                'position': Vec3 - world position of hit,
+                'normal': Vec3 - surface normal at hit,
+                'node': NodePath - hit terrain chunk
+            }
+        """
+        ray = self.get_mouse_ray(mouse_watcher)
+        if ray is None:
+            return None
+
+        origin, direction, length = ray
+        return self.cast_ray(origin, direction, length)
+
+    def get_mouse_ray(self, mouse_watcher):
+        """Build the world-space picking ray under the mouse cursor.
+
+        Args:
+            mouse_watcher: MouseWatcher node
+
+        Returns:
+            Tuple (origin Point3, direction Vec3, length) or None if the mouse
+            is outside the window
+        """
+        if not mouse_watcher.hasMouse():
+            return None
+
+        mouse_pos = mouse_watcher.getMouse()
+        lens = self.camera.node().getLens()
+        near_point = Point3()
+        far_point = Point3()
+        if not lens.extrude(mouse_pos, near_point, far_point):
+            return None
+
+        origin = self.render.getRelativePoint(self.camera, near_point)
+        far_world = self.render.getRelativePoint(self.camera, far_point)
+        direction = Vec3(far_world - origin)
+        length = direction.length()
+        if length <= 0:
+            return None
+        direction /= length
+
+        return origin, direction, min(length, self.max_distance)
+
+    def cast_ray_from_to(self, from_pos, to_pos):
+        """Cast a ray between two points.
+
+        Args:
+            from_pos: Start position Vec3
+            to_pos: End position Vec3
+
+        Returns:
+            Hit info dict or None
+        """
+        direction = Vec3(to_pos - from_pos)
+        distance = direction.length()
+        if distance <= 0:
+            return None
+        direction /= distance
+
+        return self.cast_ray(from_pos, direction, distance)
+
+    def cast_ray(self, origin, direction, max_distance):
+        """Find the first terrain hit along a ray.
+
+        Args:
+            origin: Ray origin Vec3/Point3 in world space
+            direction: Normalized ray direction Vec3
+            max_distance: Maximum distance along the ray
+
+        Returns:
+            Hit info dict or None
+        """
+        ox, oy, oz = origin.x, origin.y, origin.z
+        dx, dy, dz = direction.x, direction.y, direction.z
+
+        for cx, cz, t0, t1 in _walk_grid(ox, oy, dx, dy, CHUNK_SIZE, 0.0, max_distance):
+            chunk = self.terrain.chunks.get((cx, cz))
+            if chunk is None or chunk.height_data is None:
+                continue
+
+            # Chunk-level cull: skip if the ray's height over this span misses
+            # the chunk's height range
+            z0 = oz + dz * t0
+            z1 = oz + dz * t1
+            if min(z0, z1) > chunk.height_data.max() or max(z0, z1) < chunk.height_data.min():
+                continue
+
+            hit = self._cast_in_chunk(chunk, (ox, oy, oz), (dx, dy, dz), t0, t1)
+            if hit is not None:
+                return hit
+
+        return None
+
+    def _cast_in_chunk(self, chunk, origin, direction, t0, t1):
+        """Walk the cells of one chunk and test their triangles.
+
+        Args:
+            chunk: TerrainChunk instance
+            origin: Ray origin as (x, y, z)
+            direction: Ray direction as (x, y, z)
+            t0: Ray parameter where the ray enters the chunk
+            t1: Ray parameter where the ray leaves the chunk
+
+        Returns:
+            Hit info dict or None
+        """
+        ox, oy, oz = origin
+        dx, dy, dz = direction
+        heights = chunk.height_data
+        res = chunk.resolution
+        spacing = chunk.size / res
+
+        for ix, iz, c0, c1 in _walk_grid(
+            ox - chunk.world_x, oy - chunk.world_z, dx, dy, spacing, t0, t1
+        ):
+            # Rounding at chunk borders can land one cell outside
+            ix = min(max(ix, 0), res - 1)
+            iz = min(max(iz, 0), res - 1)
+
+            h00 = float(heights[ix][iz])
+            h10 = float(heights[ix + 1][iz])
+            h01 = float(heights[ix][iz + 1])
+            h11 = float(heights[ix + 1][iz + 1])
+
+            # Cell-level cull against the four corner heights
+            z0 = oz + dz * c0
+            z1 = oz + dz * c1
+            if min(z0, z1) > max(h00, h10, h01, h11) or max(z0, z1) < min(
+                h00, h10, h01, h11
+            ):
+                continue
+
+            x0 = chunk.world_x + ix * spacing
+            y0 = chunk.world_z + iz * spacing
+            x1 = x0 + spacing
+            y1 = y0 + spacing
+
+            # Same split as the render mesh: diagonal from (x+1, z) to (x, z+1)
+            v0 = (x0, y0, h00)
+            v1 = (x1, y0, h10)
+            v2 = (x0, y1, h01)
+            v3 = (x1, y1, h11)
+
+            best_t = None
+            best_tri = None
+            for tri in ((v0, v1, v2), (v1, v3, v2)):
+                t = _intersect_triangle(origin, direction, *tri)
+                if t is not None and c0 - 1e-6 <= t <= c1 + 1e-6:
+                    if best_t is None or t < best_t:
+                        best_t = t
+                        best_tri = tri
+
+            if best_t is not None:
+                return {
+                    "position": Vec3(ox + dx * best_t, oy + dy * best_t, oz + dz * best_t),
+                    "normal": _triangle_normal(*best_tri),
+                    "node": chunk.node_path,
+                }
+
+        return None
@@ -0,0 +1,294 @@
+"""Shared per-frame raycast service with result caching."""
+
+from panda3d.core import ClockObject, Vec3
+
+
+# Rays whose origin and direction agree to this precision share a cache entry
+_KEY_PRECISION = 4
+
+
+def _ray_key(kind, origin, direction, mask):
+    """Build a cache key for a ray query.
+
+    Args:
+        kind: Query kind ('terrain', 'closest' or 'all')
+        origin: Ray origin Vec3
+        direction: Normalized ray direction Vec3
+        mask: Collide mask (BitMask32) or None
+
+    Returns:
+        Hashable cache key
+    """
+    return (
+        kind,
+        round(origin.x, _KEY_PRECISION),
+        round(origin.y, _KEY_PRECISION),
+        round(origin.z, _KEY_PRECISION),
+        round(direction.x, _KEY_PRECISION),
+        round(direction.y, _KEY_PRECISION),
+        round(direction.z, _KEY_PRECISION),
+        None if mask is None else mask.getWord(),
+    )
+
+
+def _copy_hit(hit):
+    """Copy a hit dict, including its vectors, so callers can't alter the cache.
+
+    Args:
+        hit: Hit dict from a raycaster
+
+    Returns:
+        New dict with position and normal copied
+    """
+    copy = dict(hit)
+    for key in ("position", "normal"):
+        value = copy.get(key)
+        if value is not None:
+            copy[key] = type(value)(value)
+    return copy
+
+
+class RaycastService:
+    """Memoizes terrain and physics raycasts for the current frame.
+
+    Exposes the same query methods as HeightfieldRaycaster and
+    BuildingRaycaster so it can be handed to tools, the brush indicator and the
+    HUD in their place. Results are cached per frame, keyed by ray origin,
+    direction and collide mask. A cached result is also reused for a query with
+    a shorter range when it still answers it: a hit closer than the new range,
+    or a miss over a range at least as long.
+    """
+
+    def __init__(self, terrain_raycaster, building_raycaster, clock=None):
+        """Initialize raycast service.
+
+        Args:
+            terrain_raycaster: HeightfieldRaycaster for terrain picking
+            building_raycaster: BuildingRaycaster for physics raycasts
+            clock: ClockObject used to detect frame changes (defaults to the
+                global clock)
+        """
+        self.terrain_raycaster = terrain_raycaster
+        self.building_raycaster = building_raycaster
+        self.render = building_raycaster.render
+        self.clock = clock if clock is not None else ClockObject.getGlobalClock()
+
+        self._frame = None
+        self._cache = {}
+
+        # Profiling counters
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _begin_query(self):
+        """Drop cached results if a new frame has started."""
+        frame = self.clock.getFrameCount()
+        if frame != self._frame:
+            self._frame = frame
+            self._cache.clear()
+
+    def _lookup(self, key, max_distance):
+        """Find a cached result that answers a query of the given range.
+
+        Args:
+            key: Cache key from _ray_key
+            max_distance: Range of the new query
+
+        Returns:
+            Tuple (cached range, result, hit distance) or None
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        cached_range, _, hit_distance = entry
+        if hit_distance is not None and hit_distance <= max_distance:
+            return entry
+        if cached_range >= max_distance:
+            # Either a miss over a longer ray, or a hit beyond our range
+            return entry
+        return None
+
+    def _store(self, key, max_distance, result, hit_distance):
+        """Cache a result, keeping whichever entry covers the longer range.
+
+        Args:
+            key: Cache key from _ray_key
+            max_distance: Range of the query
+            result: Query result
+            hit_distance: Distance to the hit, or None for a miss
+        """
+        entry = self._cache.get(key)
+        if entry is None or entry[0] < max_distance:
+            self._cache[key] = (max_distance, result, hit_distance)
+
+    def get_terrain_hit(self, mouse_watcher):
+        """Cached equivalent of HeightfieldRaycaster.get_terrain_hit.
+
+        Args:
+            mouse_watcher: MouseWatcher node
+
+        Returns:
+            Dict with position, normal and node, or None if no hit
+        """
+        self._begin_query()
+        ray = self.terrain_raycaster.get_mouse_ray(mouse_watcher)
+        if ray is None:
+            return None
+
+        origin, direction, length = ray
+        key = _ray_key("terrain", origin, direction, None)
+        entry = self._lookup(key, length)
+        if entry is not None:
+            self.cache_hits += 1
+            _, result, hit_distance = entry
+            if hit_distance is None or hit_distance > length:
+                return None
+            return _copy_hit(result)
+
+        self.cache_misses += 1
+        result = self.terrain_raycaster.cast_ray(origin, direction, length)
+        hit_distance = None
+        if result is not None:
+            hit_distance = (result["position"] - origin).length()
+        self._store(key, length, result, hit_distance)
+        return _copy_hit(result) if result is not None else None
+
+    def raycast_from_camera(self, camera, max_distance=100.0, mask=None):
+        """Cached equivalent of BuildingRaycaster.raycast_from_camera.
+
+        Args:
+            camera: Camera node
+            max_distance: Maximum ray distance
+            mask: Optional BitMask32 collide mask
+
+        Returns:
+            dict with keys: hit, position, normal, node, distance
+        """
+        cam_pos = camera.getPos(self.render)
+        forward = self.render.getRelativeVector(camera, Vec3(0, 1, 0))
+        forward.normalize()
+        return self._closest(cam_pos, forward, max_distance, mask)
+
+    def raycast(self, start_pos, end_pos, mask=None):
+        """Cached equivalent of BuildingRaycaster.raycast.
+
+        Args:
+            start_pos: Vec3 starting position
+            end_pos: Vec3 ending position
+            mask: Optional BitMask32 collide mask
+
+        Returns:
+            dict with hit information
+        """
+        direction = Vec3(end_pos - start_pos)
+        distance = direction.length()
+        if distance <= 0:
+            return self.building_raycaster.raycast(start_pos, end_pos, mask)
+        direction /= distance
+        return self._closest(start_pos, direction, distance, mask)
+
+    def raycast_all(self, start_pos, end_pos, mask=None):
+        """Cached equivalent of BuildingRaycaster.raycast_all.
+
+        Args:
+            start_pos: Vec3 starting position
+            end_pos: Vec3 ending position
+            mask: Optional BitMask32 collide mask
+
+        Returns:
+            list of hit dicts sorted by distance
+        """
+        self._begin_query()
+        direction = Vec3(end_pos - start_pos)
+        distance = direction.length()
+        if distance <= 0:
+            return self.building_raycaster.raycast_all(start_pos, end_pos, mask)
+        direction /= distance
+
+        key = _ray_key("all", start_pos, direction, mask)
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] >= distance:
+            self.cache_hits += 1
+            return [_copy_hit(h) for h in entry[1] if h["distance"] <= distance]
+
+        self.cache_misses += 1
+        hits = self.building_raycaster.raycast_all(start_pos, end_pos, mask)
+        self._cache[key] = (distance, hits, None)
+        return [_copy_hit(h) for h in hits]
+
+    def raycast_batch(self, starts, ends, mask=None):
+        """Pass-through to BuildingRaycaster.raycast_batch (not cached).
+
+        Batched rays are already a single call, so they bypass the cache.
+
+        Args:
+            starts: Array-like of shape (N, 3) with ray start positions
+            ends: Array-like of shape (N, 3) with ray end positions
+            mask: Optional BitMask32 collide mask
+
+        Returns:
+            dict of per-ray results (see BuildingRaycaster.raycast_batch)
+        """
+        return self.building_raycaster.raycast_batch(starts, ends, mask)
+
+    def _closest(self, origin, direction, max_distance, mask):
+        """Run or reuse a closest-hit physics raycast.
+
+        Args:
+            origin: Ray origin Vec3
+            direction: Normalized ray direction Vec3
+            max_distance: Maximum ray distance
+            mask: Optional BitMask32 collide mask
+
+        Returns:
+            dict with hit information
+        """
+        self._begin_query()
+        end_pos = origin + direction * max_distance
+        key = _ray_key("closest", origin, direction, mask)
+        entry = self._lookup(key, max_distance)
+        if entry is not None:
+            self.cache_hits += 1
+            _, result, hit_distance = entry
+            if hit_distance is not None and hit_distance <= max_distance:
+                return _copy_hit(result)
+            return {
+                "hit": False,
+                "position": end_pos,
+                "normal": Vec3(0, 0, 1),
+                "node": None,
+                "distance": max_distance,
+            }
+
+        self.cache_misses += 1
+        result = self.building_raycaster.raycast(origin, end_pos, mask)
+        hit_distance = result["distance"] if result["hit"] else None
+        self._store(key, max_distance, result, hit_distance)
+        return _copy_hit(result)
+
+    def invalidate(self):
+        """Drop all cached results, e.g. after the world changed mid-frame.
+
+        World and TerrainEditor call this after damage and terrain edits.
+        """
+        self._cache.clear()
+
+    def get_stats(self):
+        """Get cache counters for profiling.
+
+        Returns:
+            Dict with cache_hits, cache_misses, queries and hit_rate
+        """
+        queries = self.cache_hits + self.cache_misses
+        return {
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "queries": queries,
+            "hit_rate": self.cache_hits / queries if queries else 0.0,
+        }
+
+    def reset_stats(self):
+        """Reset the profiling counters."""
+        self.cache_hits = 0
+        self.cache_misses = 0
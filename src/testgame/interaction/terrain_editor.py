@@ -1,9 +1,16 @@
 """Terrain editing tools for modifying the game world."""
 
 import math
+
+import numpy as np
+
 from testgame.config.settings import CHUNK_SIZE, TERRAIN_RESOLUTION, MODIFIABLE_TERRAIN
 
 
+# Shapes understood by TerrainEditor.apply_stamps
+STAMP_SHAPES = ("crater", "mound", "flatten")
+
+
 class TerrainEditor:
     """Provides tools for editing terrain in real-time."""
 
@@ -17,6 +24,7 @@ class TerrainEditor:
         self.brush_size = 3.0
         self.brush_strength = 0.05  # Reduced from 0.5 for mild changes
         self.edit_mode = "raise"  # 'raise', 'lower', 'smooth'
+        self.raycast_service = None  # Optional RaycastService to invalidate on edits
 
     def modify_terrain(self, world_pos, mode=None, strength=None):
         """Modify terrain at the given world position.
@@ -121,6 +129,136 @@ class TerrainEditor:
         # Regenerate all modified chunks
         for chunk_key in modified_chunks:
             self.terrain.chunks[chunk_key].regenerate()
+        if modified_chunks:
+            self._invalidate_raycasts()
+
+    def apply_stamps(self, stamps):
+        """Apply a batch of crater/flatten stamps in a single pass.
+
+        All stamps are evaluated together against each affected chunk's height
+        array with NumPy, and every affected chunk is regenerated exactly once,
+        so a volley of impacts costs one rebuild per chunk instead of one per hit.
+
+        Args:
+            stamps: Iterable of (position, radius, depth, shape) tuples.
+                shape is 'crater' (bowl lowered by depth at the centre),
+                'mound' (raised by depth) or 'flatten' (blends heights toward
+                position.z, with depth used as the 0-1 blend strength).
+
+        Returns:
+            Number of chunks that were regenerated
+        """
+        # Check if terrain modification is enabled
+        if not MODIFIABLE_TERRAIN:
+            return 0
+
+        stamps = [s for s in stamps if s[1] > 0 and s[3] in STAMP_SHAPES]
+        if not stamps:
+            return 0
+
+        xs = np.array([s[0][0] for s in stamps], dtype=np.float64)
+        ys = np.array([s[0][1] for s in stamps], dtype=np.float64)
+        zs = np.array([s[0][2] for s in stamps], dtype=np.float64)
+        radii = np.array([s[1] for s in stamps], dtype=np.float64)
+        depths = np.array([s[2] for s in stamps], dtype=np.float64)
+        shapes = np.array([s[3] for s in stamps])
+
+        # Collect every chunk touched by at least one stamp's bounding square
+        affected = set()
+        for x, y, r in zip(xs, ys, radii):
+            for cx in range(int((x - r) // CHUNK_SIZE), int((x + r) // CHUNK_SIZE) + 1):
+                for cz in range(int((y - r) // CHUNK_SIZE), int((y + r) // CHUNK_SIZE) + 1):
+                    if (cx, cz) in self.terrain.chunks:
+                        affected.add((cx, cz))
+
+        modified_chunks = []
+        for chunk_key in affected:
+            chunk = self.terrain.chunks[chunk_key]
+            if self._stamp_chunk(chunk, xs, ys, zs, radii, depths, shapes):
+                modified_chunks.append(chunk)
+
+        # Regenerate each modified chunk once
+        for chunk in modified_chunks:
+            chunk.regenerate()
+        if modified_chunks:
+            self._invalidate_raycasts()
+
+        return len(modified_chunks)
+
+    def _invalidate_raycasts(self):
+        """Drop cached raycast hits after the terrain changed."""
+        if self.raycast_service is not None:
+            self.raycast_service.invalidate()
+
+    def _stamp_chunk(self, chunk, xs, ys, zs, radii, depths, shapes):
+        """Apply stamp arrays to one chunk's height data in place.
+
+        Vertices are evaluated at their world coordinates, so vertices shared
+        along chunk edges receive identical results in every chunk.
+
+        Args:
+            chunk: TerrainChunk instance
+            xs: Stamp centre X coordinates
+            ys: Stamp centre Y coordinates
+            zs: Stamp centre heights (flatten target)
+            radii: Stamp radii
+            depths: Stamp depths (blend strength for flatten)
+            shapes: Stamp shape names
+
+        Returns:
+            True if any vertex of the chunk was changed
+        """
+        spacing = chunk.size / chunk.resolution
+
+        # Skip stamps whose bounding square misses this chunk
+        overlap = (
+            (xs + radii >= chunk.world_x)
+            & (xs - radii <= chunk.world_x + chunk.size)
+            & (ys + radii >= chunk.world_z)
+            & (ys - radii <= chunk.world_z + chunk.size)
+        )
+        if not overlap.any():
+            return False
+
+        coords = np.arange(chunk.resolution + 1) * spacing
+        grid_x = (chunk.world_x + coords)[:, None]  # height_data is indexed [x][z]
+        grid_y = (chunk.world_z + coords)[None, :]
+
+        sel = np.nonzero(overlap)[0]
+        dx = grid_x[None, :, :] - xs[sel, None, None]
+        dy = grid_y[None, :, :] - ys[sel, None, None]
+        dist_sq = dx * dx + dy * dy
+        r_sq = (radii[sel] ** 2)[:, None, None]
+
+        # Smooth bowl falloff: 1 at the centre, 0 at the rim
+        falloff = np.clip(1.0 - dist_sq / r_sq, 0.0, None)
+        if not falloff.any():
+            return False
+
+        heights = np.asarray(chunk.height_data, dtype=np.float64)
+        sel_shapes = shapes[sel]
+        sel_depths = depths[sel][:, None, None]
+
+        # Craters and mounds accumulate additively
+        sign = np.where(sel_shapes == "crater", -1.0, 0.0) + np.where(
+            sel_shapes == "mound", 1.0, 0.0
+        )
+        heights = heights + (sign[:, None, None] * sel_depths * falloff).sum(axis=0)
+
+        # Flatten stamps blend toward their target heights, normalised so
+        # overlapping stamps never overshoot
+        is_flat = sel_shapes == "flatten"
+        if is_flat.any():
+            weights = np.clip(sel_depths[is_flat] * falloff[is_flat], 0.0, 1.0)
+            total = weights.sum(axis=0)
+            targets = (weights * zs[sel][is_flat][:, None, None]).sum(axis=0)
+            mask = total > 0
+            mean_target = targets[mask] / total[mask]
+            blend = np.minimum(total[mask], 1.0)
+            heights[mask] = heights[mask] * (1.0 - blend) + mean_target * blend
+
+        chunk.height_data[:, :] = heights
+        return True
 
     def _get_average_height(self, chunk, x, z):
         """Get average height of neighboring vertices.
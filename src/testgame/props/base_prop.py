@@ -4,6 +4,8 @@ from panda3d.core import Vec3, Vec4, NodePath, PandaNode
 from panda3d.core import GeomVertexFormat, GeomVertexData, GeomVertexWriter
 from panda3d.core import Geom, GeomTriangles, GeomNode, Shader
 from panda3d.bullet import BulletRigidBodyNode, BulletBoxShape
+
+from testgame.engine.body_registry import register_body, unregister_body
 from testgame.rendering.model_loader import get_model_loader
 import os
 
@@ -228,6 +230,7 @@ class BaseProp:
 
         # Create node path and position it
         self.physics_body = self.render.attachNewNode(body_node)
+        register_body(body_node, self)
         self.physics_body.setPos(
             self.position + Vec3(0, 0, self.PHYSICS_HALF_EXTENTS.z)
         )
@@ -289,6 +292,7 @@ class BaseProp:
         # Remove physics body
         if self.physics_body:
             self.world.removeRigidBody(self.physics_body.node())
+            unregister_body(self.physics_body.node())
             self.physics_body.removeNode()
             self.physics_body = None
 
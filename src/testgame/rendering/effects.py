@@ -2,6 +2,8 @@
 
 from panda3d.core import Vec3, Vec4, LineSegs
 
+from testgame.config.destruction_config import DESTRUCTION_DUST_DURATION
+
 
 class BulletTrail:
     """Visual bullet trail effect."""
@@ -279,6 +281,69 @@ class DebugRayVisualization:
             self.marker_node = None
 
 
+class DustPuff:
+    """Short-lived dust cloud standing in for debris of distant destruction."""
+
+    def __init__(
+        self, render, position, size, color, duration=DESTRUCTION_DUST_DURATION
+    ):
+        """Create a dust puff.
+
+        Args:
+            render: Panda3D render node
+            position: Vec3 center of the destroyed piece
+            size: Vec3 dimensions of the destroyed piece
+            color: Vec4 color of the destroyed piece
+            duration: How long the puff lasts (seconds)
+        """
+        from testgame.rendering.geometry_cache import create_box
+
+        self.render = render
+        self.duration = duration
+        self.lifetime = 0.0
+        self.is_alive = True
+
+        # Pale, translucent version of the material
+        dust_color = Vec4(
+            color.x * 0.5 + 0.4, color.y * 0.5 + 0.4, color.z * 0.5 + 0.4, 0.6
+        )
+        self.size = Vec3(size)
+        self.dust_node = create_box(self.size, dust_color, "dust_puff")
+        self.dust_node.reparentTo(render)
+        self.dust_node.setPos(position)
+        self.dust_node.setTransparency(True)
+        self.dust_node.setLightOff()
+        self.dust_node.setDepthWrite(False)
+
+    def update(self, dt):
+        """Expand and fade the puff.
+
+        Args:
+            dt: Delta time
+
+        Returns:
+            bool: True if still alive
+        """
+        self.lifetime += dt
+
+        if self.lifetime >= self.duration:
+            self.is_alive = False
+            self.remove()
+            return False
+
+        progress = self.lifetime / self.duration
+        self.dust_node.setScale(self.size * (1.0 + progress * 0.5))
+        self.dust_node.setAlphaScale(1.0 - progress)
+
+        return True
+
+    def remove(self):
+        """Remove dust puff from scene."""
+        if self.dust_node:
+            self.dust_node.removeNode()
+            self.dust_node = None
+
+
 class EffectsManager:
     """Manages visual effects."""
 
@@ -346,6 +411,21 @@ class EffectsManager:
         self.active_effects.append(flash)
         return flash
 
+    def create_dust_puff(self, position, size, color):
+        """Create a dust puff where a distant piece was destroyed.
+
+        Args:
+            position: Vec3 center of the destroyed piece
+            size: Vec3 dimensions of the destroyed piece
+            color: Vec4 color of the destroyed piece
+
+        Returns:
+            DustPuff instance
+        """
+        puff = DustPuff(self.render, position, size, color)
+        self.active_effects.append(puff)
+        return puff
+
     def update(self, dt):
         """Update all effects.
 
@@ -0,0 +1,263 @@
+"""Shared geometry for boxes and curved roofs."""
+
+import numpy as np
+from panda3d.core import (
+    Geom,
+    GeomNode,
+    GeomTriangles,
+    GeomVertexData,
+    GeomVertexFormat,
+    GeomVertexWriter,
+    NodePath,
+    Vec3,
+)
+
+# Unit cube corners (centred on the origin, 1 unit per side)
+_CORNERS = [
+    Vec3(-0.5, -0.5, -0.5),
+    Vec3(0.5, -0.5, -0.5),
+    Vec3(0.5, 0.5, -0.5),
+    Vec3(-0.5, 0.5, -0.5),  # bottom
+    Vec3(-0.5, -0.5, 0.5),
+    Vec3(0.5, -0.5, 0.5),
+    Vec3(0.5, 0.5, 0.5),
+    Vec3(-0.5, 0.5, 0.5),  # top
+]
+
+# Faces with normals (counter-clockwise winding from outside)
+_FACES = [
+    ([3, 2, 1, 0], Vec3(0, 0, -1)),  # bottom
+    ([4, 5, 6, 7], Vec3(0, 0, 1)),  # top
+    ([1, 5, 4, 0], Vec3(0, -1, 0)),  # front
+    ([3, 7, 6, 2], Vec3(0, 1, 0)),  # back
+    ([4, 7, 3, 0], Vec3(-1, 0, 0)),  # left
+    ([2, 6, 5, 1], Vec3(1, 0, 0)),  # right
+]
+
+_unit_box_geom = None
+_curved_roof_geoms = {}  # (size x, y, z, curve_amount) -> Geom
+
+# Curved roof tessellation
+ROOF_SEGMENTS_X = 12  # More segments for smoother curve
+ROOF_SEGMENTS_Y = 8
+
+
+def get_unit_box_geom():
+    """Get the shared unit-cube Geom, building it on first use.
+
+    The cube has positions and normals only; per-object colour comes from
+    NodePath.setColor, which reaches shaders as p3d_Color.
+
+    Returns:
+        Geom shared by every box in the scene
+    """
+    global _unit_box_geom
+    if _unit_box_geom is not None:
+        return _unit_box_geom
+
+    vdata = GeomVertexData("unit_box", GeomVertexFormat.getV3n3(), Geom.UHStatic)
+    vdata.setNumRows(36)
+    vertex = GeomVertexWriter(vdata, "vertex")
+    normal = GeomVertexWriter(vdata, "normal")
+
+    tris = GeomTriangles(Geom.UHStatic)
+    vtx_index = 0
+    for face_indices, face_normal in _FACES:
+        # Two triangles per face
+        for i in (0, 1, 2, 0, 2, 3):
+            vertex.addData3(_CORNERS[face_indices[i]])
+            normal.addData3(face_normal)
+            tris.addVertex(vtx_index)
+            vtx_index += 1
+    tris.closePrimitive()
+
+    geom = Geom(vdata)
+    geom.addPrimitive(tris)
+    _unit_box_geom = geom
+    return geom
+
+
+def create_box(size, color, name="box"):
+    """Create a box by instancing the shared unit cube.
+
+    Args:
+        size: Vec3 dimensions (width, depth, height)
+        color: Vec4 RGBA color
+        name: Name for the GeomNode
+
+    Returns:
+        NodePath of the (unparented) box, scaled and coloured
+    """
+    geom_node = GeomNode(name)
+    geom_node.addGeom(get_unit_box_geom())
+
+    box_np = NodePath(geom_node)
+    box_np.setScale(size)
+    box_np.setColor(color)
+    return box_np
+
+
+def attach_box(parent_np, size, color, name="box"):
+    """Create a shared-geometry box and parent it.
+
+    Args:
+        parent_np: NodePath to attach the box to
+        size: Vec3 dimensions (width, depth, height)
+        color: Vec4 RGBA color
+        name: Name for the GeomNode
+
+    Returns:
+        NodePath of the attached box
+    """
+    box_np = create_box(size, color, name)
+    box_np.reparentTo(parent_np)
+    return box_np
+
+
+def _quad_rows(a, b, c, d):
+    """Expand quads into two triangles each, with one flat normal per quad.
+
+    Args:
+        a, b, c, d: (n, 3) arrays of quad corners; triangles are (a, b, c)
+            and (a, c, d), and the normal is (b - a) x (d - a)
+
+    Returns:
+        (n * 6, 6) float array of position + normal rows
+    """
+    quad_normal = np.cross(b - a, d - a)
+    quad_normal /= np.linalg.norm(quad_normal, axis=1, keepdims=True)
+    corners = np.stack([a, b, c, a, c, d], axis=1)
+    normals = np.broadcast_to(quad_normal[:, None, :], corners.shape)
+    return np.concatenate([corners, normals], axis=2).reshape(-1, 6)
+
+
+def _edge_bottom(points, x=None, y=None, z=0.0):
+    """Project edge points down onto the flat underside.
+
+    Args:
+        points: (n, 3) array of top edge points
+        x: Optional fixed X for the projected points
+        y: Optional fixed Y for the projected points
+        z: Z of the underside
+
+    Returns:
+        (n, 3) array
+    """
+    bottom = points.copy()
+    if x is not None:
+        bottom[:, 0] = x
+    if y is not None:
+        bottom[:, 1] = y
+    bottom[:, 2] = z
+    return bottom
+
+
+def build_curved_roof_rows(size, curve_amount):
+    """Tessellate a curved roof: a parabolic top, flat underside and four sides.
+
+    Args:
+        size: Vec3 roof dimensions (width, depth, thickness)
+        curve_amount: How much upward curve at edges (0-1)
+
+    Returns:
+        (n, 6) float32 array of position + normal rows, three per triangle
+    """
+    hx, hy, hz = size[0] / 2, size[1] / 2, size[2] / 2
+    u = np.linspace(0.0, 1.0, ROOF_SEGMENTS_X + 1)
+    v = np.linspace(0.0, 1.0, ROOF_SEGMENTS_Y + 1)
+    uu, vv = np.meshgrid(u, v)  # (segments_y + 1, segments_x + 1)
+
+    # Edges curve upward along X, and slightly along Y
+    edge_x = np.abs(uu - 0.5) * 2
+    edge_y = np.abs(vv - 0.5) * 2
+    z_curve = edge_x**2 * curve_amount * hz * 3 + edge_y**2 * curve_amount * hz * 1.5
+
+    top = np.stack([(uu - 0.5) * size[0], (vv - 0.5) * size[1], hz + z_curve], -1)
+    bottom_z = -hz
+
+    underside = np.array(
+        [
+            [-hx, -hy, bottom_z],
+            [hx, -hy, bottom_z],
+            [hx, hy, bottom_z],
+            [-hx, hy, bottom_z],
+        ]
+    )
+
+    front_l, front_r = top[0, :-1], top[0, 1:]
+    back_l, back_r = top[-1, :-1], top[-1, 1:]
+    left_f, left_b = top[:-1, 0], top[1:, 0]
+    right_f, right_b = top[:-1, -1], top[1:, -1]
+
+    rows = [
+        # Curved top surface
+        _quad_rows(
+            top[:-1, :-1].reshape(-1, 3),
+            top[:-1, 1:].reshape(-1, 3),
+            top[1:, 1:].reshape(-1, 3),
+            top[1:, :-1].reshape(-1, 3),
+        ),
+        # Flat underside, facing down
+        _quad_rows(underside[[0]], underside[[3]], underside[[2]], underside[[1]]),
+        # Front (Y-) and back (Y+) sides
+        _quad_rows(
+            front_l,
+            _edge_bottom(front_l, y=-hy, z=bottom_z),
+            _edge_bottom(front_r, y=-hy, z=bottom_z),
+            front_r,
+        ),
+        _quad_rows(
+            back_l,
+            back_r,
+            _edge_bottom(back_r, y=hy, z=bottom_z),
+            _edge_bottom(back_l, y=hy, z=bottom_z),
+        ),
+        # Left (X-) and right (X+) sides
+        _quad_rows(
+            left_f,
+            left_b,
+            _edge_bottom(left_b, x=-hx, z=bottom_z),
+            _edge_bottom(left_f, x=-hx, z=bottom_z),
+        ),
+        _quad_rows(
+            right_f,
+            _edge_bottom(right_f, x=hx, z=bottom_z),
+            _edge_bottom(right_b, x=hx, z=bottom_z),
+            right_b,
+        ),
+    ]
+    return np.concatenate(rows).astype(np.float32)
+
+
+def get_curved_roof_geom(size, curve_amount):
+    """Get the shared curved roof Geom for a roof shape, building it on first use.
+
+    Like the unit cube, the roof carries positions and normals only and takes
+    its colour from NodePath.setColor, so every roof of the same shape shares
+    one Geom regardless of colour, tier or building.
+
+    Args:
+        size: Vec3 roof dimensions (width, depth, thickness)
+        curve_amount: How much upward curve at edges (0-1)
+
+    Returns:
+        Geom shared by every roof with these parameters
+    """
+    key = (float(size[0]), float(size[1]), float(size[2]), float(curve_amount))
+    geom = _curved_roof_geoms.get(key)
+    if geom is not None:
+        return geom
+
+    rows = build_curved_roof_rows(key[:3], curve_amount)
+    vdata = GeomVertexData("curved_roof", GeomVertexFormat.getV3n3(), Geom.UHStatic)
+    vdata.uncleanSetNumRows(len(rows))
+    memoryview(vdata.modifyArray(0)).cast("B")[:] = rows.tobytes()
+
+    tris = GeomTriangles(Geom.UHStatic)
+    tris.addConsecutiveVertices(0, len(rows))
+    tris.closePrimitive()
+
+    geom = Geom(vdata)
+    geom.addPrimitive(tris)
+    _curved_roof_geoms[key] = geom
+    return geom
@@ -0,0 +1,121 @@
+"""Hardware-instanced rendering for debris fragments."""
+
+from pathlib import Path
+
+import numpy as np
+from panda3d.core import (
+    GeomEnums,
+    GeomNode,
+    OmniBoundingVolume,
+    Shader,
+    Texture,
+)
+
+from testgame.config.destruction_config import DEBRIS_MAX_FRAGMENTS
+from testgame.rendering.geometry_cache import get_unit_box_geom
+
+TEXELS_PER_INSTANCE = 5  # 4 model matrix rows + color
+
+
+class InstancedDebrisRenderer:
+    """Draws every live fragment with a single instanced unit-box call.
+
+    Each frame the fragments' transforms and colors are packed into a NumPy
+    array and copied into a buffer texture that the instancing vertex shader
+    reads by gl_InstanceID. Fragments keep their own box nodes for the
+    per-node fallback; the pool hides them while this renderer is active.
+    """
+
+    def __init__(self, render, max_instances=DEBRIS_MAX_FRAGMENTS):
+        """Initialize the renderer.
+
+        Args:
+            render: Panda3D render node
+            max_instances: Maximum fragments drawn per frame
+        """
+        self.max_instances = max_instances
+        self.instance_count = 0
+
+        self._data = np.zeros((max_instances, TEXELS_PER_INSTANCE, 4), np.float32)
+
+        self.buffer = Texture("debris_instances")
+        self.buffer.setupBufferTexture(
+            max_instances * TEXELS_PER_INSTANCE,
+            Texture.T_float,
+            Texture.F_rgba32,
+            GeomEnums.UH_dynamic,
+        )
+
+        geom_node = GeomNode("debris_instanced")
+        geom_node.addGeom(get_unit_box_geom())
+        # Instances are placed by the shader, so the node's bounds mean nothing
+        geom_node.setBounds(OmniBoundingVolume())
+        geom_node.setFinal(True)
+
+        self.node_path = render.attachNewNode(geom_node)
+        self.node_path.setShader(self._load_shader())
+        self.node_path.setShaderInput("instanceData", self.buffer)
+        self.node_path.setInstanceCount(0)
+        self.node_path.hide()
+
+    @staticmethod
+    def _load_shader():
+        """Load the instancing vertex shader paired with the scene fragment shader.
+
+        Returns:
+            Shader
+        """
+        shader_dir = Path(__file__).resolve().parents[3] / "assets" / "shaders"
+        return Shader.load(
+            Shader.SL_GLSL,
+            vertex=str(shader_dir / "debris_instanced.vert"),
+            fragment=str(shader_dir / "terrain.frag"),
+        )
+
+    @staticmethod
+    def is_supported(gsg):
+        """Check whether a graphics context can run the instanced path.
+
+        Args:
+            gsg: GraphicsStateGuardian (may be None)
+
+        Returns:
+            bool: True if GLSL, buffer textures and instancing are available
+        """
+        if gsg is None:
+            return False
+        return bool(
+            gsg.getSupportsGlsl()
+            and gsg.getSupportsBufferTexture()
+            and gsg.getSupportsGeometryInstancing()
+        )
+
+    def update(self, fragments):
+        """Gather fragment transforms and upload them for this frame.
+
+        Args:
+            fragments: Iterable of live Fragment objects
+        """
+        data = self._data
+        count = 0
+        for fragment in fragments:
+            if count >= self.max_instances:
+                break
+            # The box node carries any physics interpolation offset
+            data[count, :4] = fragment.geom_np.getNetTransform().getMat()
+            data[count, 4] = fragment.color
+            count += 1
+
+        self.instance_count = count
+        if count == 0:
+            self.node_path.hide()
+            return
+
+        ram = np.frombuffer(memoryview(self.buffer.modifyRamImage()), np.float32)
+        ram[: count * TEXELS_PER_INSTANCE * 4] = data[:count].ravel()
+        self.node_path.setInstanceCount(count)
+        self.node_path.show()
+
+    def destroy(self):
+        """Remove the instanced node."""
+        self.node_path.removeNode()
@@ -207,6 +207,7 @@ class ShadowManager:
         node_path.setShaderInput(
             "useVertexColor", 0
         )  # Default to not using vertex colors
+        node_path.setShaderInput("damage", 0.0)  # Undamaged (pieces override per node)
 
         # Set SSAO uniforms
         node_path.setShaderInput("ssaoEnabled", 1 if ssao_enabled else 0)
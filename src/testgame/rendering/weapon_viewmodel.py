@@ -1,8 +1,6 @@
 """First-person weapon view models for FPS-style tool display."""
 
 from panda3d.core import Vec3, Vec4, NodePath
-from panda3d.core import GeomNode, GeomVertexFormat, GeomVertexData, GeomVertexWriter
-from panda3d.core import Geom, GeomTriangles
 from direct.interval.IntervalGlobal import (
     Sequence,
     LerpPosInterval,
@@ -11,6 +9,8 @@ from direct.interval.IntervalGlobal import (
 )
 import math
 
+from testgame.rendering.geometry_cache import create_box
+
 
 class WeaponViewModel:
     """Manages first-person weapon view models attached to camera."""
@@ -554,64 +554,4 @@ class WeaponViewModel:
         Returns:
             NodePath containing the box geometry
         """
-        vformat = GeomVertexFormat.getV3n3c4()
-        vdata = GeomVertexData("box", vformat, Geom.UHStatic)
-
-        vertex = GeomVertexWriter(vdata, "vertex")
-        normal = GeomVertexWriter(vdata, "normal")
-        color_writer = GeomVertexWriter(vdata, "color")
-
-        # Half extents
-        hx, hy, hz = size.x / 2, size.y / 2, size.z / 2
-
-        # Define 8 vertices of the box
-        vertices = [
-            Vec3(-hx, -hy, -hz),
-            Vec3(hx, -hy, -hz),
-            Vec3(hx, hy, -hz),
-            Vec3(-hx, hy, -hz),
-            Vec3(-hx, -hy, hz),
-            Vec3(hx, -hy, hz),
-            Vec3(hx, hy, hz),
-            Vec3(-hx, hy, hz),
-        ]
-
-        # Define 6 faces with normals
-        faces = [
-            ([0, 1, 2, 3], Vec3(0, 0, -1)),  # Bottom
-            ([4, 7, 6, 5], Vec3(0, 0, 1)),  # Top
-            ([0, 4, 5, 1], Vec3(0, -1, 0)),  # Front
-            ([2, 6, 7, 3], Vec3(0, 1, 0)),  # Back
-            ([0, 3, 7, 4], Vec3(-1, 0, 0)),  # Left
-            ([1, 5, 6, 2], Vec3(1, 0, 0)),  # Right
-        ]
-
-        tris = GeomTriangles(Geom.UHStatic)
-        vtx_index = 0
-
-        for face_indices, face_normal in faces:
-            # First triangle
-            for i in [0, 1, 2]:
-                vertex.addData3(vertices[face_indices[i]])
-                normal.addData3(face_normal)
-                color_writer.addData4(color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-            # Second triangle
-            for i in [0, 2, 3]:
-                vertex.addData3(vertices[face_indices[i]])
-                normal.addData3(face_normal)
-                color_writer.addData4(color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-        tris.closePrimitive()
-
-        geom = Geom(vdata)
-        geom.addPrimitive(tris)
-
-        geom_node = GeomNode("box_geom")
-        geom_node.addGeom(geom)
-
-        return NodePath(geom_node)
+        return create_box(size, color, "box_geom")
@@ -0,0 +1,188 @@
+"""Cached, immutable building layouts.
+
+A blueprint describes a building's pieces, connections and openings relative
+to its base position, independent of any physics world or building name.
+Building classes produce one per set of dimensions and Building instantiates
+pieces from it, so the procedural layout maths runs once per size instead of
+on every construction (ghost previews, example towns, save loading).
+"""
+
+from collections import namedtuple
+
+# Piece suffixes are appended to the building name: f"{name}_{suffix}".
+# Vectors and colours are stored as plain tuples so specs stay immutable.
+PieceSpec = namedtuple(
+    "PieceSpec",
+    "suffix offset size mass color piece_type curve_amount tier",
+)
+ConnectionSpec = namedtuple("ConnectionSpec", "piece_a piece_b breaking_threshold")
+OpeningSpec = namedtuple(
+    "OpeningSpec", "piece opening_type local_center size color"
+)
+
+_blueprint_cache = {}  # (class name, width, depth, height) -> BuildingBlueprint
+
+
+def _as_tuple(vec):
+    """Convert a Vec3/Vec4 (or any sequence) to a tuple of floats."""
+    return tuple(float(v) for v in vec)
+
+
+class BuildingBlueprint:
+    """Immutable description of a building layout."""
+
+    def __init__(self, blueprint_id, dimensions, pieces, connections, openings):
+        """Create a blueprint.
+
+        Args:
+            blueprint_id: Unique id (class name and dimensions)
+            dimensions: (width, depth, height) tuple the layout was built for
+            pieces: Tuple of PieceSpec
+            connections: Tuple of ConnectionSpec
+            openings: Tuple of OpeningSpec
+        """
+        self.blueprint_id = blueprint_id
+        self.dimensions = dimensions
+        self.pieces = pieces
+        self.connections = connections
+        self.openings = openings
+        self.piece_specs = {spec.suffix: spec for spec in pieces}
+
+
+class BlueprintBuilder:
+    """Collects piece, connection and opening specs for a new blueprint."""
+
+    def __init__(self, blueprint_id, dimensions):
+        """Start an empty blueprint.
+
+        Args:
+            blueprint_id: Unique id for the finished blueprint
+            dimensions: (width, depth, height) tuple
+        """
+        self.blueprint_id = blueprint_id
+        self.dimensions = dimensions
+        self._pieces = []
+        self._connections = []
+        self._openings = []
+
+    def add_piece(
+        self,
+        suffix,
+        offset,
+        size,
+        mass,
+        color,
+        piece_type="wall",
+        curve_amount=None,
+        tier=1,
+    ):
+        """Add a box piece (or a curved roof when curve_amount is given).
+
+        Args:
+            suffix: Name suffix, unique within the building
+            offset: Vec3 position relative to the building base
+            size: Vec3 dimensions
+            mass: Mass used once the piece becomes dynamic
+            color: Vec4 RGBA color
+            piece_type: Type of piece (wall, floor, roof, foundation)
+            curve_amount: Edge curve for CurvedRoofPiece, None for a box
+            tier: Roof tier number for CurvedRoofPiece
+        """
+        self._pieces.append(
+            PieceSpec(
+                suffix,
+                _as_tuple(offset),
+                _as_tuple(size),
+                float(mass),
+                _as_tuple(color),
+                piece_type,
+                curve_amount,
+                tier,
+            )
+        )
+
+    def connect(self, piece_a, piece_b, breaking_threshold=50.0):
+        """Connect two pieces by suffix.
+
+        Args:
+            piece_a: Suffix of the first piece
+            piece_b: Suffix of the second piece
+            breaking_threshold: Force required to break the constraint
+        """
+        self._connections.append(ConnectionSpec(piece_a, piece_b, breaking_threshold))
+
+    def add_opening(self, piece, opening_type, local_center, size, color=None):
+        """Add a door or window opening to a piece.
+
+        Args:
+            piece: Suffix of the piece
+            opening_type: "door" or "window"
+            local_center: Vec3 center relative to the piece
+            size: Vec3 opening size
+            color: Optional Vec4 color
+        """
+        self._openings.append(
+            OpeningSpec(
+                piece,
+                opening_type,
+                _as_tuple(local_center),
+                _as_tuple(size),
+                None if color is None else _as_tuple(color),
+            )
+        )
+
+    def build(self):
+        """Freeze the collected specs.
+
+        Returns:
+            BuildingBlueprint
+        """
+        return BuildingBlueprint(
+            self.blueprint_id,
+            self.dimensions,
+            tuple(self._pieces),
+            tuple(self._connections),
+            tuple(self._openings),
+        )
+
+
+def make_blueprint_id(building_class, width, depth, height):
+    """Build the id a blueprint is cached and saved under.
+
+    Args:
+        building_class: Building subclass
+        width: Building width
+        depth: Building depth
+        height: Building height
+
+    Returns:
+        str id such as "SimpleBuilding:10x10x8"
+    """
+    return f"{building_class.__name__}:{width:g}x{depth:g}x{height:g}"
+
+
+def get_blueprint(building_class, width, depth, height):
+    """Get the cached blueprint for a building class and size.
+
+    The class must provide a create_blueprint(width, depth, height) classmethod.
+
+    Args:
+        building_class: Building subclass
+        width: Building width
+        depth: Building depth
+        height: Building height
+
+    Returns:
+        BuildingBlueprint shared by every building of that class and size
+    """
+    key = (building_class.__name__, float(width), float(depth), float(height))
+    blueprint = _blueprint_cache.get(key)
+    if blueprint is None:
+        blueprint = building_class.create_blueprint(width, depth, height)
+        _blueprint_cache[key] = blueprint
+    return blueprint
+
+
+def clear_blueprint_cache():
+    """Drop every cached blueprint."""
+    _blueprint_cache.clear()
@@ -1,7 +1,9 @@
 """Building system with destructible physics-based structures."""
 
 import random
-from panda3d.core import Vec3, Vec4
+from collections import deque
+
+from panda3d.core import NodePath, RigidBodyCombiner, Vec3, Vec4
 from panda3d.core import GeomNode, GeomVertexFormat, GeomVertexData, GeomVertexWriter
 from panda3d.core import Geom, GeomTriangles
 from panda3d.bullet import (
@@ -10,126 +12,126 @@ from panda3d.bullet import (
     BulletGenericConstraint,
 )
 
+from testgame.config.destruction_config import (
+    AOE_MAX_CHUNKED_PIECES,
+    BUILDING_BATCH_REBUILD_DELAY,
+    BUILDING_BATCHING_ENABLED,
+    BUILDING_COMPOUND_COLLISION,
+    COMPOUND_PEEL_DAMAGE,
+    DESTRUCTION_LOD_REDUCED_CHUNKS,
+)
+from testgame.engine.body_registry import register_body, unregister_body
+from testgame.rendering.geometry_cache import attach_box, get_curved_roof_geom
+from testgame.structures.compound_collision import CompoundCollision
+from testgame.structures.destruction_lod import LOD_EFFECT, LOD_FULL, LOD_REDUCED
+from testgame.structures.prefracture import coarsen_layout, compute_fracture_layout
+
 
 class Fragment:
-    """A small fragment created when a building piece breaks."""
+    """A small fragment created when a building piece breaks.
 
-    def __init__(self, world, render, position, size, color, impulse=None):
+    The body uses a unit box shape and is sized by scaling its NodePath, so a
+    parked fragment can be respawned at any size by a DebrisPool.
+    """
+
+    MASS = 0.5  # Light fragments
+
+    def __init__(
+        self,
+        world,
+        render,
+        position=None,
+        size=None,
+        color=None,
+        impulse=None,
+        torque=None,
+    ):
         """Create a small debris fragment.
 
         Args:
             world: Bullet physics world
             render: Panda3D render node
-            position: Vec3 world position
+            position: Vec3 world position (None creates a parked fragment)
             size: Vec3 dimensions (small)
             color: Vec4 RGBA color
             impulse: Optional Vec3 impulse to apply
+            torque: Optional Vec3 torque impulse (spin)
         """
         self.world = world
         self.render = render
         self.creation_time = 0  # Will be set by building manager
         self.lifetime = 10.0  # Fragments disappear after 10 seconds
+        self.is_active = False
+        self.color = Vec4(1, 1, 1, 1)
 
-        # Create small physics cube
-        half_extents = Vec3(size.x / 2, size.y / 2, size.z / 2)
-        shape = BulletBoxShape(half_extents)
-
-        # Create rigid body
+        # Create rigid body with a unit cube shape (scaled per spawn)
         body_node = BulletRigidBodyNode(f"fragment_{id(self)}")
-        body_node.setMass(0.5)  # Light fragments
-        body_node.addShape(shape)
+        body_node.addShape(BulletBoxShape(Vec3(0.5, 0.5, 0.5)))
         body_node.setFriction(0.8)
         body_node.setRestitution(0.2)  # Some bounce
         body_node.setLinearDamping(0.5)  # Air resistance
         body_node.setAngularDamping(0.6)
 
-        # Attach to scene
-        self.body_np = render.attachNewNode(body_node)
-        self.body_np.setPos(position)
-
-        # Add to physics world
-        world.attachRigidBody(body_node)
+        self.body_np = NodePath(body_node)
 
-        # Apply impulse if provided
-        if impulse:
-            body_node.applyCentralImpulse(impulse)
-            # Add some random spin
-            torque = Vec3(
-                random.uniform(-5, 5),
-                random.uniform(-5, 5),
-                random.uniform(-5, 5),
-            )
-            body_node.applyTorqueImpulse(torque)
+        # Create simple visual geometry (inherits the body's scale)
+        self.geom_np = attach_box(
+            self.body_np, Vec3(1, 1, 1), Vec4(1, 1, 1, 1), "fragment_geom"
+        )
 
-        # Create simple visual geometry
-        self._create_visual(half_extents, color)
+        if position is not None:
+            self.spawn(position, size, color, impulse, torque)
 
-    def _create_visual(self, half_extents, color):
-        """Create simple visual geometry for fragment."""
-        vformat = GeomVertexFormat.getV3n3c4()
-        vdata = GeomVertexData("fragment_vdata", vformat, Geom.UHStatic)
+    def spawn(self, position, size, color, impulse=None, torque=None):
+        """Place the fragment in the world and set it moving.
 
-        vertex = GeomVertexWriter(vdata, "vertex")
-        normal = GeomVertexWriter(vdata, "normal")
-        color_writer = GeomVertexWriter(vdata, "color")
+        Args:
+            position: Vec3 world position
+            size: Vec3 dimensions (small)
+            color: Vec4 RGBA color
+            impulse: Optional Vec3 impulse to apply
+            torque: Optional Vec3 torque impulse (spin)
+        """
+        body_node = self.body_np.node()
 
-        # Simple box vertices
-        s = half_extents
-        vertices = [
-            Vec3(-s.x, -s.y, -s.z),
-            Vec3(s.x, -s.y, -s.z),
-            Vec3(s.x, s.y, -s.z),
-            Vec3(-s.x, s.y, -s.z),
-            Vec3(-s.x, -s.y, s.z),
-            Vec3(s.x, -s.y, s.z),
-            Vec3(s.x, s.y, s.z),
-            Vec3(-s.x, s.y, s.z),
-        ]
+        self.body_np.reparentTo(self.render)
+        self.body_np.setPosHprScale(position, Vec3(0, 0, 0), size)
+        self.geom_np.setColor(color)
+        self.color = color
 
-        faces = [
-            ([3, 2, 1, 0], Vec3(0, 0, -1)),
-            ([4, 5, 6, 7], Vec3(0, 0, 1)),
-            ([1, 5, 4, 0], Vec3(0, -1, 0)),
-            ([3, 7, 6, 2], Vec3(0, 1, 0)),
-            ([4, 7, 3, 0], Vec3(-1, 0, 0)),
-            ([2, 6, 5, 1], Vec3(1, 0, 0)),
-        ]
+        # Recompute inertia for the new size and clear leftover motion
+        body_node.setMass(self.MASS)
+        body_node.setLinearVelocity(Vec3(0, 0, 0))
+        body_node.setAngularVelocity(Vec3(0, 0, 0))
+        body_node.clearForces()
 
-        tris = GeomTriangles(Geom.UHStatic)
-        vtx_index = 0
-
-        for face_indices, face_normal in faces:
-            for i in [0, 1, 2]:
-                v = vertices[face_indices[i]]
-                vertex.addData3(v)
-                normal.addData3(face_normal)
-                color_writer.addData4(color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-            for i in [0, 2, 3]:
-                v = vertices[face_indices[i]]
-                vertex.addData3(v)
-                normal.addData3(face_normal)
-                color_writer.addData4(color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
+        # Add to physics world
+        self.world.attachRigidBody(body_node)
+        body_node.setActive(True, True)
+        self.is_active = True
 
-        tris.closePrimitive()
+        # Apply impulse and spin if provided
+        if impulse:
+            body_node.applyCentralImpulse(impulse)
+        if torque:
+            body_node.applyTorqueImpulse(torque)
 
-        geom = Geom(vdata)
-        geom.addPrimitive(tris)
+    def park(self):
+        """Take the fragment out of the world, keeping it for reuse."""
+        if not self.is_active:
+            return
 
-        geom_node = GeomNode("fragment_geom")
-        geom_node.addGeom(geom)
-        self.body_np.attachNewNode(geom_node)
+        self.world.removeRigidBody(self.body_np.node())
+        self.body_np.detachNode()
+        self.is_active = False
 
     def remove(self):
         """Remove fragment from world."""
         if self.body_np and not self.body_np.isEmpty():
             try:
-                body_node = self.body_np.node()
-                self.world.removeRigidBody(body_node)
+                if self.is_active:
+                    self.world.removeRigidBody(self.body_np.node())
+                    self.is_active = False
                 self.body_np.removeNode()
             except:
                 # Already removed or invalid - ignore
@@ -211,6 +213,7 @@ class CurvedRoofPiece:
 
         body_np = self.render.attachNewNode(body_node)
         body_np.setPos(self.position)
+        register_body(body_node, self)
 
         # Only add to physics world if not a ghost
         if not self.is_ghost:
@@ -222,240 +225,19 @@ class CurvedRoofPiece:
         return body_np
 
     def _create_curved_visual(self, parent_np, half_extents):
-        """Create curved roof visual geometry."""
-        from panda3d.core import (
-            GeomNode,
-            GeomVertexFormat,
-            GeomVertexData,
-            GeomVertexWriter,
-        )
-        from panda3d.core import Geom, GeomTriangles
-
-        vformat = GeomVertexFormat.getV3n3c4()
-        vdata = GeomVertexData(f"{self.name}_curved", vformat, Geom.UHStatic)
+        """Create curved roof visual geometry.
 
-        vertex = GeomVertexWriter(vdata, "vertex")
-        normal = GeomVertexWriter(vdata, "normal")
-        color_writer = GeomVertexWriter(vdata, "color")
-
-        # Create a curved surface using multiple segments
-        segments_x = 12  # More segments for smoother curve
-        segments_y = 8
-
-        # Generate vertices for curved roof surface
-        vertices = []
-        for i in range(segments_y + 1):
-            row = []
-            for j in range(segments_x + 1):
-                # Normalized coordinates (0 to 1)
-                u = j / segments_x
-                v = i / segments_y
-
-                # Position in local space (-half to +half)
-                x = (u - 0.5) * self.size.x
-                y = (v - 0.5) * self.size.y
-
-                # Calculate curve - edges curve upward
-                # Use a parabola for the curve
-                edge_dist = abs(u - 0.5) * 2  # 0 at center, 1 at edges
-                z_curve = edge_dist * edge_dist * self.curve_amount * half_extents.z * 3
-
-                # Also curve along Y axis slightly
-                y_edge_dist = abs(v - 0.5) * 2
-                z_curve += (
-                    y_edge_dist * y_edge_dist * self.curve_amount * half_extents.z * 1.5
-                )
-
-                z = half_extents.z + z_curve
-
-                row.append(Vec3(x, y, z))
-            vertices.append(row)
-
-        # Create triangles
-        tris = GeomTriangles(Geom.UHStatic)
-        vtx_index = 0
-
-        for i in range(segments_y):
-            for j in range(segments_x):
-                # Get four corners of quad
-                v0 = vertices[i][j]
-                v1 = vertices[i][j + 1]
-                v2 = vertices[i + 1][j + 1]
-                v3 = vertices[i + 1][j]
-
-                # Calculate normal for this quad
-                edge1 = v1 - v0
-                edge2 = v3 - v0
-                quad_normal = edge1.cross(edge2)
-                quad_normal.normalize()
-
-                # Triangle 1: v0, v1, v2
-                for v in [v0, v1, v2]:
-                    vertex.addData3(v)
-                    normal.addData3(quad_normal)
-                    color_writer.addData4(self.color)
-                    tris.addVertex(vtx_index)
-                    vtx_index += 1
-
-                # Triangle 2: v0, v2, v3
-                for v in [v0, v2, v3]:
-                    vertex.addData3(v)
-                    normal.addData3(quad_normal)
-                    color_writer.addData4(self.color)
-                    tris.addVertex(vtx_index)
-                    vtx_index += 1
-
-        # Add bottom surface (flat) - should face downward (visible from below)
-        bottom_z = -half_extents.z
-        bottom_verts = [
-            Vec3(-half_extents.x, -half_extents.y, bottom_z),
-            Vec3(half_extents.x, -half_extents.y, bottom_z),
-            Vec3(half_extents.x, half_extents.y, bottom_z),
-            Vec3(-half_extents.x, half_extents.y, bottom_z),
-        ]
-        bottom_normal = Vec3(0, 0, -1)  # Facing downward
-
-        # Bottom triangle 1 (counter-clockwise when viewed from below)
-        for v in [bottom_verts[0], bottom_verts[3], bottom_verts[2]]:
-            vertex.addData3(v)
-            normal.addData3(bottom_normal)
-            color_writer.addData4(self.color)
-            tris.addVertex(vtx_index)
-            vtx_index += 1
-
-        # Bottom triangle 2 (counter-clockwise when viewed from below)
-        for v in [bottom_verts[0], bottom_verts[2], bottom_verts[1]]:
-            vertex.addData3(v)
-            normal.addData3(bottom_normal)
-            color_writer.addData4(self.color)
-            tris.addVertex(vtx_index)
-            vtx_index += 1
-
-        # Add side walls connecting curved top to flat bottom (makes it 3D)
-        # Front edge (Y-) - facing outward (negative Y direction)
-        for j in range(segments_x):
-            top_left = vertices[0][j]
-            top_right = vertices[0][j + 1]
-            bottom_left = Vec3(top_left.x, -half_extents.y, bottom_z)
-            bottom_right = Vec3(top_right.x, -half_extents.y, bottom_z)
-
-            # Calculate normal facing outward
-            edge1 = top_right - top_left
-            edge2 = bottom_left - top_left
-            wall_normal = edge2.cross(edge1)  # Reversed cross product order
-            wall_normal.normalize()
-
-            # Triangle 1 (counter-clockwise from outside)
-            for v in [top_left, bottom_left, bottom_right]:
-                vertex.addData3(v)
-                normal.addData3(wall_normal)
-                color_writer.addData4(self.color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-            # Triangle 2
-            for v in [top_left, bottom_right, top_right]:
-                vertex.addData3(v)
-                normal.addData3(wall_normal)
-                color_writer.addData4(self.color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-        # Back edge (Y+) - facing outward (positive Y direction)
-        for j in range(segments_x):
-            top_left = vertices[segments_y][j]
-            top_right = vertices[segments_y][j + 1]
-            bottom_left = Vec3(top_left.x, half_extents.y, bottom_z)
-            bottom_right = Vec3(top_right.x, half_extents.y, bottom_z)
-
-            # Calculate normal facing outward
-            edge1 = top_right - top_left
-            edge2 = bottom_left - top_left
-            wall_normal = edge1.cross(edge2)  # Normal cross product order
-            wall_normal.normalize()
-
-            # Triangle 1 (counter-clockwise from outside)
-            for v in [top_left, top_right, bottom_right]:
-                vertex.addData3(v)
-                normal.addData3(wall_normal)
-                color_writer.addData4(self.color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-            # Triangle 2
-            for v in [top_left, bottom_right, bottom_left]:
-                vertex.addData3(v)
-                normal.addData3(wall_normal)
-                color_writer.addData4(self.color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-        # Left edge (X-) - facing outward (negative X direction)
-        for i in range(segments_y):
-            top_front = vertices[i][0]
-            top_back = vertices[i + 1][0]
-            bottom_front = Vec3(-half_extents.x, top_front.y, bottom_z)
-            bottom_back = Vec3(-half_extents.x, top_back.y, bottom_z)
-
-            # Calculate normal facing outward
-            edge1 = top_back - top_front
-            edge2 = bottom_front - top_front
-            wall_normal = edge1.cross(edge2)  # Reversed cross product order
-            wall_normal.normalize()
-
-            # Triangle 1 (counter-clockwise from outside)
-            for v in [top_front, top_back, bottom_back]:
-                vertex.addData3(v)
-                normal.addData3(wall_normal)
-                color_writer.addData4(self.color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-            # Triangle 2
-            for v in [top_front, bottom_back, bottom_front]:
-                vertex.addData3(v)
-                normal.addData3(wall_normal)
-                color_writer.addData4(self.color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-        # Right edge (X+) - facing outward (positive X direction)
-        for i in range(segments_y):
-            top_front = vertices[i][segments_x]
-            top_back = vertices[i + 1][segments_x]
-            bottom_front = Vec3(half_extents.x, top_front.y, bottom_z)
-            bottom_back = Vec3(half_extents.x, top_back.y, bottom_z)
-
-            # Calculate normal facing outward
-            edge1 = top_back - top_front
-            edge2 = bottom_front - top_front
-            wall_normal = edge2.cross(edge1)  # Normal cross product order
-            wall_normal.normalize()
-
-            # Triangle 1 (counter-clockwise from outside)
-            for v in [top_front, bottom_front, bottom_back]:
-                vertex.addData3(v)
-                normal.addData3(wall_normal)
-                color_writer.addData4(self.color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-            # Triangle 2
-            for v in [top_front, bottom_back, top_back]:
-                vertex.addData3(v)
-                normal.addData3(wall_normal)
-                color_writer.addData4(self.color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-        tris.closePrimitive()
-
-        geom = Geom(vdata)
-        geom.addPrimitive(tris)
+        The tessellated roof is shared by every roof with the same size and
+        curve; this piece only adds a node that instances it in its colour.
 
+        Args:
+            parent_np: Parent NodePath to attach to
+            half_extents: Vec3 half-extents of the roof's collision box
+        """
         geom_node = GeomNode(f"{self.name}_geom")
-        geom_node.addGeom(geom)
-        parent_np.attachNewNode(geom_node)
+        geom_node.addGeom(get_curved_roof_geom(half_extents * 2, self.curve_amount))
+        geom_np = parent_np.attachNewNode(geom_node)
+        geom_np.setColor(self.color)
 
     def add_constraint(self, other_piece, constraint):
         """Add a constraint connecting this piece to another."""
@@ -473,6 +255,7 @@ class CurvedRoofPiece:
             try:
                 body_node = self.body_np.node()
                 self.world.removeRigidBody(body_node)
+                unregister_body(body_node)
                 self.body_np.removeNode()
             except:
                 pass
@@ -555,6 +338,7 @@ class CurvedRoofPiece:
                 body_node = self.body_np.node()
                 if body_node:
                     self.world.removeRigidBody(body_node)
+                    unregister_body(body_node)
             except Exception as e:
                 print(f"Warning: Error removing rigid body from {self.name}: {e}")
                 pass
@@ -587,6 +371,9 @@ class CurvedRoofPiece:
 
         self.health -= amount
 
+        if self.parent_building is not None:
+            self.parent_building.on_piece_damaged(self)
+
         if self.health <= 0:
             # Use destroy method for cleanup
             self.destroy(create_fragments, create_chunks, impact_pos)
@@ -651,6 +438,7 @@ class BuildingPiece:
         self.destroyed_lifetime = 5.0  # Destroyed pieces disappear after 5 seconds
 
         # Create the physical piece
+        self.geom_np = None  # Box visual (set by _create_visual_geometry)
         self.body_np = self._create_physics_body()
 
     def _create_physics_body(self):
@@ -678,6 +466,7 @@ class BuildingPiece:
         # Create NodePath and attach to scene
         body_np = self.render.attachNewNode(body_node)
         body_np.setPos(self.position)
+        register_body(body_node, self)
 
         # Add to physics world
         self.world.attachRigidBody(body_node)
@@ -690,73 +479,16 @@ class BuildingPiece:
     def _create_visual_geometry(self, parent_np, half_extents):
         """Create visual mesh for the piece.
 
+        Instances the shared unit cube, scaled to the piece and tinted with
+        its colour, instead of building per-piece vertex data.
+
         Args:
             parent_np: Parent NodePath to attach to
             half_extents: Vec3 half-extents of the box
         """
-        # Create vertex data
-        vformat = GeomVertexFormat.getV3n3c4()
-        vdata = GeomVertexData(f"{self.name}_vdata", vformat, Geom.UHStatic)
-
-        vertex = GeomVertexWriter(vdata, "vertex")
-        normal = GeomVertexWriter(vdata, "normal")
-        color_writer = GeomVertexWriter(vdata, "color")
-
-        # Define box vertices (8 corners)
-        s = half_extents
-        vertices = [
-            Vec3(-s.x, -s.y, -s.z),
-            Vec3(s.x, -s.y, -s.z),
-            Vec3(s.x, s.y, -s.z),
-            Vec3(-s.x, s.y, -s.z),  # bottom
-            Vec3(-s.x, -s.y, s.z),
-            Vec3(s.x, -s.y, s.z),
-            Vec3(s.x, s.y, s.z),
-            Vec3(-s.x, s.y, s.z),  # top
-        ]
-
-        # Define faces with normals (counter-clockwise winding from outside)
-        faces = [
-            ([3, 2, 1, 0], Vec3(0, 0, -1)),  # bottom (reversed)
-            ([4, 5, 6, 7], Vec3(0, 0, 1)),  # top
-            ([1, 5, 4, 0], Vec3(0, -1, 0)),  # front (reversed)
-            ([3, 7, 6, 2], Vec3(0, 1, 0)),  # back (reversed)
-            ([4, 7, 3, 0], Vec3(-1, 0, 0)),  # left (reversed)
-            ([2, 6, 5, 1], Vec3(1, 0, 0)),  # right (reversed)
-        ]
-
-        # Build geometry
-        tris = GeomTriangles(Geom.UHStatic)
-        vtx_index = 0
-
-        for face_indices, face_normal in faces:
-            # Two triangles per face
-            for i in [0, 1, 2]:
-                v = vertices[face_indices[i]]
-                vertex.addData3(v)
-                normal.addData3(face_normal)
-                color_writer.addData4(self.color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-            for i in [0, 2, 3]:
-                v = vertices[face_indices[i]]
-                vertex.addData3(v)
-                normal.addData3(face_normal)
-                color_writer.addData4(self.color)
-                tris.addVertex(vtx_index)
-                vtx_index += 1
-
-        tris.closePrimitive()
-
-        # Create geometry
-        geom = Geom(vdata)
-        geom.addPrimitive(tris)
-
-        # Create node and attach
-        geom_node = GeomNode(f"{self.name}_geom")
-        geom_node.addGeom(geom)
-        parent_np.attachNewNode(geom_node)
+        self.geom_np = attach_box(
+            parent_np, half_extents * 2, self.color, f"{self.name}_geom"
+        )
 
     def add_constraint(self, other_piece, constraint):
         """Add a constraint connecting this piece to another.
@@ -959,45 +691,6 @@ class BuildingPiece:
 
             opening_np.setTransparency(TransparencyAttrib.MAlpha)
 
-    def _apply_color_to_geometry(self, new_color):
-        """Apply a new color to all vertices in the piece's geometry.
-
-        Args:
-            new_color: Vec4 RGBA color to apply
-        """
-        # Find the GeomNode child
-        geom_node_path = None
-        for child in self.body_np.getChildren():
-            if isinstance(child.node(), GeomNode):
-                geom_node_path = child
-                break
-
-        if not geom_node_path:
-            return
-
-        geom_node = geom_node_path.node()
-
-        # Update all geoms in the node
-        for i in range(geom_node.getNumGeoms()):
-            geom = geom_node.modifyGeom(i)
-            vdata = geom.modifyVertexData()
-
-            # Make vertex data writable
-            if vdata.getUsageHint() == Geom.UHStatic:
-                # Create a modifiable copy
-                new_vdata = GeomVertexData(vdata)
-                new_vdata.setUsageHint(Geom.UHDynamic)
-                geom.setVertexData(new_vdata)
-                vdata = new_vdata
-
-            # Update color data
-            color_writer = GeomVertexWriter(vdata, "color")
-            num_vertices = vdata.getNumRows()
-
-            for v in range(num_vertices):
-                color_writer.setRow(v)
-                color_writer.setData4(new_color)
-
     def add_bullet_hole(self, world_impact_pos):
         """Add a black bullet hole mark at the impact position.
 
@@ -1160,6 +853,9 @@ class BuildingPiece:
 
         self.health -= amount
 
+        if self.parent_building is not None:
+            self.parent_building.on_piece_damaged(self)
+
         # Update color to show damage (reduce saturation)
         health_ratio = max(0.0, self.health / self.max_health)
         self._update_damage_color(health_ratio)
@@ -1194,28 +890,14 @@ class BuildingPiece:
     def _update_damage_color(self, health_ratio):
         """Update the visual color of the piece based on health.
 
-        Reduces saturation as health decreases, making the piece appear more gray/desaturated.
+        Sets the per-node "damage" shader input, which the scene shader uses
+        to desaturate the piece, so vertex data stays static and shared.
 
         Args:
             health_ratio: Health ratio from 0.0 (dead) to 1.0 (full health)
         """
-        # Convert RGB to grayscale (perceived brightness)
-        gray = 0.299 * self.color.x + 0.587 * self.color.y + 0.114 * self.color.z
-
-        # Interpolate between original color (healthy) and grayscale (damaged)
-        # At full health: use original color
-        # At zero health: use mostly grayscale with slight hint of original color
-        saturation = 0.2 + (0.8 * health_ratio)  # Range from 0.2 to 1.0
-
-        new_color = Vec4(
-            gray + (self.color.x - gray) * saturation,
-            gray + (self.color.y - gray) * saturation,
-            gray + (self.color.z - gray) * saturation,
-            self.color.w,
-        )
-
-        # Update the geometry colors
-        self._apply_color_to_geometry(new_color)
+        if self.geom_np is not None and not self.geom_np.isEmpty():
+            self.geom_np.setShaderInput("damage", 1.0 - health_ratio)
 
     def destroy(self, create_fragments=True, create_chunks=True, impact_pos=None):
         """Destroy this piece and remove all constraints.
@@ -1239,54 +921,171 @@ class BuildingPiece:
         if self.piece_type == "chunk":
             create_chunks = False
 
-        # Create both fragments and chunks (while node still exists to get position/velocity)
-        fragments = []
-        chunks = []
-
-        if create_fragments:
-            fragments = self._create_fragments()
-
-        if create_chunks:
-            chunks = self._create_chunks(impact_pos=impact_pos)
+        # Snapshot the motion state while the node still exists
+        piece_pos = self.body_np.getPos()
+        piece_velocity = self.body_np.node().getLinearVelocity()
+
+        # Far-away destruction spawns less debris
+        level = LOD_FULL
+        lod = getattr(self.parent_building, "destruction_lod", None)
+        if lod is not None and (create_fragments or create_chunks):
+            pool = self.parent_building.debris_pool
+            level = lod.select(piece_pos, pool.load if pool is not None else 0.0)
+            if level == LOD_EFFECT:
+                create_fragments = create_chunks = False
+                lod.spawn_effect(piece_pos, self.size, self.color)
+            elif level == LOD_REDUCED:
+                create_fragments = False
+
+        layout = self._take_fracture_layout() if create_chunks else None
+        if layout is not None and level == LOD_REDUCED:
+            layout = coarsen_layout(layout, DESTRUCTION_LOD_REDUCED_CHUNKS)
+
+        scheduler = getattr(self.parent_building, "destruction_scheduler", None)
+        debris = []
+        if scheduler is not None and (create_fragments or create_chunks):
+            # Spawn debris over the next frames within the scheduler's budget
+            scheduler.schedule(
+                self.parent_building,
+                self._spawn_deferred_debris,
+                piece_pos,
+                piece_velocity,
+                create_fragments,
+                create_chunks,
+                impact_pos,
+                layout,
+            )
+        else:
+            debris = self._spawn_debris(
+                piece_pos,
+                piece_velocity,
+                create_fragments,
+                create_chunks,
+                impact_pos,
+                layout,
+            )
 
         # NOW remove the original piece from the physics world and scene
         body_node = self.body_np.node()
         self.world.removeRigidBody(body_node)
+        unregister_body(body_node)
         self.body_np.removeNode()
 
         print(f"Building piece {self.name} destroyed and replaced with debris!")
 
-        # Return both fragments and chunks
+        # Return both fragments and chunks (empty when deferred)
+        return debris
+
+    def _spawn_debris(
+        self,
+        piece_pos,
+        piece_velocity,
+        create_fragments,
+        create_chunks,
+        impact_pos,
+        layout=None,
+    ):
+        """Create fragments and chunks from a snapshot of this piece.
+
+        Args:
+            piece_pos: Vec3 position of the piece when it was destroyed
+            piece_velocity: Vec3 linear velocity when it was destroyed
+            create_fragments: If True, create debris fragments
+            create_chunks: If True, create destructible chunks
+            impact_pos: Vec3 world position of impact
+            layout: Optional FractureLayout taken when the piece was destroyed
+
+        Returns:
+            List of fragments followed by chunks
+        """
+        fragments = []
+        chunks = []
+
+        if create_fragments:
+            fragments = self._create_fragments(piece_pos, piece_velocity)
+
+        if create_chunks:
+            chunks = self._create_chunks(
+                impact_pos=impact_pos,
+                piece_pos=piece_pos,
+                piece_velocity=piece_velocity,
+                layout=layout,
+            )
+
         return fragments + chunks
 
-    def _create_fragments(self):
+    def _spawn_deferred_debris(
+        self,
+        piece_pos,
+        piece_velocity,
+        create_fragments,
+        create_chunks,
+        impact_pos,
+        layout=None,
+    ):
+        """Scheduler job: spawn debris and release the chunks immediately.
+
+        The building's stability pass already ran when the piece was
+        destroyed, so chunks are made dynamic here instead of waiting for it.
+
+        Args:
+            piece_pos: Vec3 position of the piece when it was destroyed
+            piece_velocity: Vec3 linear velocity when it was destroyed
+            create_fragments: If True, create debris fragments
+            create_chunks: If True, create destructible chunks
+            impact_pos: Vec3 world position of impact
+            layout: Optional FractureLayout taken when the piece was destroyed
+        """
+        debris = self._spawn_debris(
+            piece_pos,
+            piece_velocity,
+            create_fragments,
+            create_chunks,
+            impact_pos,
+            layout,
+        )
+        if self.parent_building is None:
+            return
+
+        for item in debris:
+            if isinstance(item, BuildingPiece):
+                self.parent_building.release_piece(item)
+
+    def _create_fragments(self, piece_pos=None, piece_velocity=None):
         """Create debris fragments from this piece.
 
+        Args:
+            piece_pos: Optional snapshot position (defaults to the live body)
+            piece_velocity: Optional snapshot velocity (defaults to the live body)
+
         Returns:
             List of Fragment objects
         """
         fragments = []
-        num_fragments = random.randint(4, 8)  # 4-8 fragments
+        rng = self._destruction_rng()
+        num_fragments = rng.randint(4, 8)  # 4-8 fragments
+        debris_pool = getattr(self.parent_building, "debris_pool", None)
 
         # Get current position and velocity
-        piece_pos = self.body_np.getPos()
-        piece_node = self.body_np.node()
-        piece_velocity = piece_node.getLinearVelocity()
+        if piece_pos is None:
+            piece_pos = self.body_np.getPos()
+        if piece_velocity is None:
+            piece_velocity = self.body_np.node().getLinearVelocity()
 
         # Create fragments scattered around the piece
         for i in range(num_fragments):
             # Random size (smaller than the original piece)
             fragment_size = Vec3(
-                random.uniform(0.3, 0.8),
-                random.uniform(0.3, 0.8),
-                random.uniform(0.3, 0.8),
+                rng.uniform(0.3, 0.8),
+                rng.uniform(0.3, 0.8),
+                rng.uniform(0.3, 0.8),
             )
 
             # Random position around the piece
             offset = Vec3(
-                random.uniform(-self.size.x / 2, self.size.x / 2),
-                random.uniform(-self.size.y / 2, self.size.y / 2),
-                random.uniform(-self.size.z / 2, self.size.z / 2),
+                rng.uniform(-self.size.x / 2, self.size.x / 2),
+                rng.uniform(-self.size.y / 2, self.size.y / 2),
+                rng.uniform(-self.size.z / 2, self.size.z / 2),
             )
             fragment_pos = piece_pos + offset
 
@@ -1294,8 +1093,9 @@ class BuildingPiece:
             impulse_direction = (
                 offset.normalized() if offset.length() > 0.1 else Vec3(0, 0, 1)
             )
-            impulse_strength = random.uniform(5, 15)
+            impulse_strength = rng.uniform(5, 15)
             impulse = impulse_direction * impulse_strength
+            torque = Vec3(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5))
 
             # Add piece's current velocity to impulse
             if piece_velocity.length() > 0.1:
@@ -1309,104 +1109,94 @@ class BuildingPiece:
                 self.color.w,
             )
 
-            # Create fragment
-            fragment = Fragment(
-                self.world,
-                self.render,
-                fragment_pos,
-                fragment_size,
-                fragment_color,
-                impulse,
-            )
+            # Create fragment (recycled from the world's pool when available)
+            if debris_pool is not None:
+                fragment = debris_pool.spawn_fragment(
+                    fragment_pos, fragment_size, fragment_color, impulse, torque
+                )
+            else:
+                fragment = Fragment(
+                    self.world,
+                    self.render,
+                    fragment_pos,
+                    fragment_size,
+                    fragment_color,
+                    impulse,
+                    torque,
+                )
             fragments.append(fragment)
 
         print(f"Created {len(fragments)} fragments")
         return fragments
 
-    def _create_chunks(self, impact_pos=None):
+    def _destruction_rng(self):
+        """Get the random stream this piece's destruction draws from.
+
+        Returns:
+            The building's seeded Random, or the random module for orphan pieces
+        """
+        if self.parent_building is None:
+            return random
+        return self.parent_building.destruction_rng
+
+    def _take_fracture_layout(self):
+        """Get this piece's chunk layout, prefractured if one is ready.
+
+        Returns:
+            FractureLayout
+        """
+        prefracturer = getattr(self.parent_building, "prefracturer", None)
+        if prefracturer is not None:
+            return prefracturer.take(self)
+        size = (self.size.x, self.size.y, self.size.z)
+        return compute_fracture_layout(size, self._destruction_rng().getrandbits(32))
+
+    def _create_chunks(
+        self, impact_pos=None, piece_pos=None, piece_velocity=None, layout=None
+    ):
         """Create chunks wall.
 
         Splits the wall into 2-4 larger physics-enabled chunks that fall realistically.
         Chunks are BuildingPiece objects, so they can also be damaged and break further.
+        Split axis, chunk sizes and impulses come from a FractureLayout, normally
+        computed ahead of time by the building's Prefracturer.
 
         Args:
             impact_pos: Vec3 world position of impact (center of radial cracks)
+            piece_pos: Optional snapshot position (defaults to the live body)
+            piece_velocity: Optional snapshot velocity (defaults to the live body)
+            layout: Optional FractureLayout (taken from the prefracturer if None)
 
         Returns:
             List of BuildingPiece objects (destructible chunks)
         """
         chunks = []
-
-        # Determine how many chunks based on piece size
-        # Larger pieces break into more chunks
-        size_factor = (self.size.x + self.size.y + self.size.z) / 3
-        if size_factor > 5:
-            num_chunks = random.randint(3, 4)
-        else:
-            num_chunks = random.randint(2, 3)
+        if layout is None:
+            layout = self._take_fracture_layout()
 
         # Get current position and velocity
-        piece_pos = self.body_np.getPos()
-        piece_node = self.body_np.node()
-        piece_velocity = piece_node.getLinearVelocity()
-
-        # Determine dominant dimension (largest axis)
-        if self.size.x >= self.size.y and self.size.x >= self.size.z:
-            # Wall is wide (X-axis) - split horizontally
-            split_axis = "x"
-            chunk_width = self.size.x / num_chunks
-            chunk_size_base = Vec3(chunk_width * 0.9, self.size.y, self.size.z)
-            spacing = chunk_width
-        elif self.size.y >= self.size.x and self.size.y >= self.size.z:
-            # Wall is deep (Y-axis) - split along depth
-            split_axis = "y"
-            chunk_depth = self.size.y / num_chunks
-            chunk_size_base = Vec3(self.size.x, chunk_depth * 0.9, self.size.z)
-            spacing = chunk_depth
-        else:
-            # Wall is tall (Z-axis) - split vertically
-            split_axis = "z"
-            chunk_height = self.size.z / num_chunks
-            chunk_size_base = Vec3(self.size.x, self.size.y, chunk_height * 0.9)
-            spacing = chunk_height
-
-        # Create chunks along the split axis
-        for i in range(num_chunks):
-            # Calculate position along split axis
-            if split_axis == "x":
-                offset_along_axis = -self.size.x / 2 + spacing * (i + 0.5)
-                chunk_offset = Vec3(offset_along_axis, 0, 0)
-            elif split_axis == "y":
-                offset_along_axis = -self.size.y / 2 + spacing * (i + 0.5)
-                chunk_offset = Vec3(0, offset_along_axis, 0)
-            else:  # z
-                offset_along_axis = -self.size.z / 2 + spacing * (i + 0.5)
-                chunk_offset = Vec3(0, 0, offset_along_axis)
-
-            chunk_pos = piece_pos + chunk_offset
-
-            # Add slight random variation to chunk size
-            chunk_size = Vec3(
-                chunk_size_base.x * random.uniform(0.95, 1.0),
-                chunk_size_base.y * random.uniform(0.95, 1.0),
-                chunk_size_base.z * random.uniform(0.95, 1.0),
-            )
-
-            # Chunks have same color as original piece (slightly darker)
-            chunk_color = Vec4(
-                self.color.x * 0.95,
-                self.color.y * 0.95,
-                self.color.z * 0.95,
-                self.color.w,
-            )
+        if piece_pos is None:
+            piece_pos = self.body_np.getPos()
+        if piece_velocity is None:
+            piece_velocity = self.body_np.node().getLinearVelocity()
+
+        # Chunks have same color as original piece (slightly darker)
+        chunk_color = Vec4(
+            self.color.x * 0.95,
+            self.color.y * 0.95,
+            self.color.z * 0.95,
+            self.color.w,
+        )
+        chunk_mass = 5.0  # Heavier than fragments
+        prefracturer = getattr(self.parent_building, "prefracturer", None)
 
+        for i, template in enumerate(layout.chunks):
             # Create chunk as a BuildingPiece (so it can be damaged)
-            chunk_mass = 5.0  # Heavier than fragments
             chunk = BuildingPiece(
                 self.world,
                 self.render,
-                chunk_pos,
-                chunk_size,
+                piece_pos + Vec3(*template.offset),
+                Vec3(*template.size),
                 chunk_mass,
                 chunk_color,
                 f"{self.name}_chunk_{i}",
@@ -1421,50 +1211,25 @@ class BuildingPiece:
             # Register chunk with parent building so it can be damaged
             if self.parent_building:
                 self.parent_building.add_piece(chunk)
+                if self.parent_building.debris_pool is not None:
+                    self.parent_building.debris_pool.track_chunk(chunk)
+            if prefracturer is not None:
+                prefracturer.request(chunk)
 
-            # Apply outward impulse (perpendicular to split axis)
-            if split_axis == "x":
-                # Push chunks apart along Y and Z
-                impulse_dir = Vec3(
-                    random.uniform(-2, 2),
-                    random.uniform(-5, 5),
-                    random.uniform(-3, 3),
-                )
-            elif split_axis == "y":
-                impulse_dir = Vec3(
-                    random.uniform(-5, 5),
-                    random.uniform(-2, 2),
-                    random.uniform(-3, 3),
-                )
-            else:  # z
-                impulse_dir = Vec3(
-                    random.uniform(-5, 5),
-                    random.uniform(-5, 5),
-                    random.uniform(-2, 2),
-                )
-
-            impulse_strength = random.uniform(10, 20)
-            impulse = impulse_dir.normalized() * impulse_strength
-
-            # Add parent velocity
+            # Outward impulse plus the parent's velocity, and some random spin
+            impulse = Vec3(*template.impulse)
             if piece_velocity.length() > 0.1:
                 impulse += piece_velocity * 0.7
 
-            # Apply impulse to chunk
             chunk_node = chunk.body_np.node()
             chunk_node.applyCentralImpulse(impulse)
-
-            # Add some random spin
-            torque = Vec3(
-                random.uniform(-10, 10),
-                random.uniform(-10, 10),
-                random.uniform(-10, 10),
-            )
-            chunk_node.applyTorqueImpulse(torque)
+            chunk_node.applyTorqueImpulse(Vec3(*template.torque))
 
             chunks.append(chunk)
 
-        print(f"Created {len(chunks)} destructible chunks along {split_axis}-axis")
+        print(
+            f"Created {len(chunks)} destructible chunks along {layout.split_axis}-axis"
+        )
 
         return chunks
 
@@ -1482,6 +1247,7 @@ class BuildingPiece:
             try:
                 body_node = self.body_np.node()
                 self.world.removeRigidBody(body_node)
+                unregister_body(body_node)
                 # Remove from scene
                 self.body_np.removeNode()
             except:
@@ -1546,6 +1312,25 @@ class Building:
         self.pieces = []
         self.piece_map = {}  # name -> piece lookup
         self.fragments = []  # Debris fragments
+        self.adjacency = {}  # piece name -> set of connected piece names
+        self.piece_index = None  # World-level PieceSpatialIndex (set by World)
+        self.destruction_scheduler = None  # DestructionScheduler (set by World)
+        self.debris_pool = None  # World-wide DebrisPool (set by World)
+        self.render_batch_np = None  # Flattened visuals of intact static pieces
+        self._batched = set()  # Pieces currently drawn by the batch
+        self._batch_holders = {}  # piece -> its node under the batch combiner
+        self._batch_dirty = False  # Batch still holds collapsed, split-out pieces
+        self._batch_split_time = None  # When the batch was last seen changing
+        self.compound = None  # Shared static CompoundCollision body
+        self.blueprint = None  # BuildingBlueprint the pieces were built from
+        self.prefracturer = None  # World-wide Prefracturer (set by World)
+        self.destruction_lod = None  # World-wide DestructionLOD (set by World)
+        self.destruction_rng = random.Random()  # Seeded stream shared by World
+        self.structural_solver = None  # Optional StructuralSolver (set by World)
+        self.physics_manager = None  # Optional PhysicsManager (set by World)
+        # id -> (constraint, piece, other) for constraints Bullet may break
+        self._watched_constraints = {}
+        self._detached_constraints = {}  # id -> constraint removed while compounded
 
     def add_piece(self, piece):
         """Add a piece to this building.
@@ -1555,9 +1340,269 @@ class Building:
         """
         self.pieces.append(piece)
         self.piece_map[piece.name] = piece
+        self.adjacency.setdefault(piece.name, set())
         # Set parent building reference if not already set
         if piece.parent_building is None:
             piece.parent_building = self
+        if self.piece_index is not None:
+            self.piece_index.insert(piece)
+
+    def attach_piece_index(self, piece_index):
+        """Register this building's pieces with a world spatial index.
+
+        Args:
+            piece_index: PieceSpatialIndex shared by the world
+        """
+        self.piece_index = piece_index
+        for piece in self.pieces:
+            if piece.is_destroyed:
+                continue
+            piece_index.insert(piece)
+            if piece.body_np.node().getMass() > 0:
+                piece_index.mark_dynamic(piece)
+
+    def _unindex_piece(self, piece):
+        """Drop a piece from the spatial index, connectivity graph and debris pool.
+
+        Args:
+            piece: Piece being destroyed or removed
+        """
+        if self.piece_index is not None:
+            self.piece_index.remove(piece)
+        if self.debris_pool is not None:
+            self.debris_pool.release_chunk(piece)
+        self.unbatch_piece(piece)
+        self.peel_piece(piece)
+        if self.prefracturer is not None:
+            self.prefracturer.discard(piece)
+        for constraint_info in piece.constraints:
+            self._watched_constraints.pop(id(constraint_info["constraint"]), None)
+
+        neighbors = self.adjacency.pop(piece.name, ())
+        for neighbor in neighbors:
+            self.adjacency.get(neighbor, set()).discard(piece.name)
+        # Load it carried moves to its neighbours
+        if self.structural_solver is not None:
+            self.structural_solver.mark(self, [piece.name, *neighbors])
+
+    def _can_batch(self, piece):
+        """Check whether a piece can be drawn as part of the building batch.
+
+        Args:
+            piece: Piece to check
+
+        Returns:
+            bool: True for intact, undamaged, static pieces
+        """
+        return (
+            not piece.is_destroyed
+            and piece.body_np is not None
+            and not piece.body_np.isEmpty()
+            and piece.body_np.node().getMass() == 0
+            and piece.health >= piece.max_health
+        )
+
+    def build_render_batch(self):
+        """Merge the visuals of all intact static pieces into one batch.
+
+        Called once the building is complete. Pieces that are later damaged,
+        destroyed or made dynamic are split back out by unbatch_piece().
+        """
+        if not BUILDING_BATCHING_ENABLED:
+            return
+        self._batched = {piece for piece in self.pieces if self._can_batch(piece)}
+        self._rebuild_render_batch()
+
+    def unbatch_piece(self, piece):
+        """Split a piece out of the batch so it draws with its own nodes.
+
+        The piece's share of the merged geometry is collapsed in place, so
+        the batch is not rebuilt here; flush_render_batch() drops the
+        collapsed geometry later.
+
+        Args:
+            piece: Piece that was damaged, destroyed or released
+        """
+        if piece not in self._batched:
+            return
+        self._batched.discard(piece)
+        holder = self._batch_holders.pop(piece, None)
+        if holder is not None and not holder.isEmpty():
+            holder.setScale(0)  # The combiner follows its children's transforms
+        if piece.body_np is not None and not piece.body_np.isEmpty():
+            piece.body_np.show()
+        self._batch_dirty = True
+        self._batch_split_time = None
+
+    def flush_render_batch(self, current_time):
+        """Rebuild the batch once pieces have stopped being split out of it.
+
+        Waits until no piece has been split out for
+        BUILDING_BATCH_REBUILD_DELAY seconds, so sustained damage to one
+        building does not rebuild it every frame.
+
+        Args:
+            current_time: Current game time in seconds
+
+        Returns:
+            bool: True if the batch was rebuilt
+        """
+        if not self._batch_dirty:
+            return False
+        if self._batch_split_time is None:
+            self._batch_split_time = current_time
+            return False
+        if current_time - self._batch_split_time < BUILDING_BATCH_REBUILD_DELAY:
+            return False
+        self._rebuild_render_batch()
+        return True
+
+    def _rebuild_render_batch(self):
+        """Copy batched pieces' visuals under one combiner and merge them."""
+        if self.render_batch_np is not None:
+            self.render_batch_np.removeNode()
+            self.render_batch_np = None
+        self._batch_holders.clear()
+        self._batch_dirty = False
+        self._batch_split_time = None
+
+        if not self._batched:
+            return
+
+        # Merges its children into one Geom per state, but keeps each child's
+        # transform live so a piece can be collapsed without a rebuild
+        combiner = RigidBodyCombiner(f"{self.name}_batch")
+        batch_np = self.render.attachNewNode(combiner)
+        for piece in self._batched:
+            holder = batch_np.attachNewNode(piece.name)
+            holder.setMat(piece.body_np.getMat(self.render))
+            for child in piece.body_np.getChildren():
+                child.copyTo(holder)
+            piece.body_np.hide()
+            self._batch_holders[piece] = holder
+
+        combiner.collect()
+        self.render_batch_np = batch_np
+
+    def build_compound_collision(self):
+        """Move intact static pieces into one shared compound body.
+
+        Constraints touching those pieces are taken out of the world while
+        their bodies are, and restored by peel_piece() once both ends have
+        their own bodies again.
+        """
+        if not BUILDING_COMPOUND_COLLISION or self.compound is not None:
+            return
+
+        pieces = [piece for piece in self.pieces if self._can_batch(piece)]
+        if len(pieces) < 2:
+            return
+
+        self.compound = CompoundCollision(
+            self.world, self.render, f"{self.name}_collision"
+        )
+        for piece in pieces:
+            for constraint_info in piece.constraints:
+                constraint = constraint_info["constraint"]
+                if id(constraint) not in self._detached_constraints:
+                    self.world.removeConstraint(constraint)
+                    self._detached_constraints[id(constraint)] = constraint
+        # One broadphase insert for the whole building
+        self.compound.add(pieces)
+
+    def peel_piece(self, piece):
+        """Give a compounded piece its own rigid body again.
+
+        Args:
+            piece: Piece to peel off the shared body
+        """
+        if self.compound is None or not self.compound.remove(piece):
+            return
+
+        # Restore constraints whose other end also has its own body
+        for constraint_info in piece.constraints:
+            other = constraint_info["piece"]
+            if other.is_destroyed or other in self.compound:
+                continue
+            constraint = self._detached_constraints.pop(
+                id(constraint_info["constraint"]), None
+            )
+            if constraint is not None:
+                self.world.attachConstraint(constraint)
+
+    def on_piece_damaged(self, piece):
+        """Handle a piece losing health.
+
+        The piece leaves the shared render batch, leaves the compound body past
+        the peel threshold, and gets its chunk layout queued for prefracture.
+
+        Args:
+            piece: Piece whose health just dropped
+        """
+        self.unbatch_piece(piece)
+        # Damage weakens the piece as a support
+        if self.structural_solver is not None:
+            self.structural_solver.mark(self, (piece.name,))
+        if piece.health <= piece.max_health * (1.0 - COMPOUND_PEEL_DAMAGE):
+            self.peel_piece(piece)
+        # Lay out its chunks now, so breaking it only builds them
+        if (
+            self.prefracturer is not None
+            and piece.health > 0
+            and isinstance(piece, BuildingPiece)
+        ):
+            self.prefracturer.request(piece)
+
+    def build_from_blueprint(self, blueprint):
+        """Instantiate every piece, connection and opening of a blueprint.
+
+        Args:
+            blueprint: BuildingBlueprint laid out relative to self.position
+        """
+        self.blueprint = blueprint
+        for spec in blueprint.pieces:
+            position = self.position + Vec3(*spec.offset)
+            name = f"{self.name}_{spec.suffix}"
+            if spec.curve_amount is not None:
+                piece = CurvedRoofPiece(
+                    self.world,
+                    self.render,
+                    position,
+                    Vec3(*spec.size),
+                    spec.mass,
+                    Vec4(*spec.color),
+                    name,
+                    parent_building=self,
+                    curve_amount=spec.curve_amount,
+                    tier=spec.tier,
+                )
+            else:
+                piece = BuildingPiece(
+                    self.world,
+                    self.render,
+                    position,
+                    Vec3(*spec.size),
+                    spec.mass,
+                    Vec4(*spec.color),
+                    name,
+                    spec.piece_type,
+                )
+            self.add_piece(piece)
+
+        for connection in blueprint.connections:
+            self.connect_pieces(
+                f"{self.name}_{connection.piece_a}",
+                f"{self.name}_{connection.piece_b}",
+                breaking_threshold=connection.breaking_threshold,
+            )
+
+        for opening in blueprint.openings:
+            self.piece_map[f"{self.name}_{opening.piece}"].add_opening(
+                opening.opening_type,
+                Vec3(*opening.local_center),
+                Vec3(*opening.size),
+                color=None if opening.color is None else Vec4(*opening.color),
+            )
 
     def connect_pieces(self, piece1_name, piece2_name, breaking_threshold=50.0):
         """Create a constraint between two pieces.
@@ -1606,22 +1651,151 @@ class Building:
         piece1.add_constraint(piece2, constraint)
         piece2.add_constraint(piece1, constraint)
 
-    def check_stability(self):
-        """Check all pieces for stability and make unsupported ones dynamic."""
-        unstable_pieces = []
+        # Record the connection in the adjacency graph
+        self.adjacency.setdefault(piece1_name, set()).add(piece2_name)
+        self.adjacency.setdefault(piece2_name, set()).add(piece1_name)
 
-        for piece in self.pieces:
-            if not piece.is_destroyed and not piece.is_stable():
-                unstable_pieces.append(piece)
+    def find_unsupported_pieces(self):
+        """Find intact pieces with no connection path to a foundation.
+
+        Runs a single multi-source BFS from every intact foundation over the
+        adjacency graph, so the cost is linear in pieces plus connections.
+
+        Returns:
+            List of unsupported pieces
+        """
+        intact = {
+            name: piece
+            for name, piece in self.piece_map.items()
+            if not piece.is_destroyed
+        }
+
+        frontier = deque(name for name, piece in intact.items() if piece.is_foundation)
+        reached = set(frontier)
+        while frontier:
+            name = frontier.popleft()
+            for neighbor in self.adjacency.get(name, ()):
+                if neighbor not in reached and neighbor in intact:
+                    reached.add(neighbor)
+                    frontier.append(neighbor)
+
+        return [piece for name, piece in intact.items() if name not in reached]
+
+    def find_unsupported_component(self, piece_name):
+        """Find the intact pieces connected to one piece, if none is a foundation.
+
+        Args:
+            piece_name: Name of a piece in the component
+
+        Returns:
+            List of pieces in the component, or an empty list when it is supported
+        """
+        start = self.piece_map.get(piece_name)
+        if start is None or start.is_destroyed:
+            return []
+
+        frontier = deque([piece_name])
+        reached = {piece_name}
+        while frontier:
+            piece = self.piece_map[frontier.popleft()]
+            if piece.is_foundation:
+                return []  # Supported, stop early
+            for neighbor in self.adjacency.get(piece.name, ()):
+                other = self.piece_map.get(neighbor)
+                if neighbor not in reached and other and not other.is_destroyed:
+                    reached.add(neighbor)
+                    frontier.append(neighbor)
+
+        # Keep piece order, not set order, so releases replay identically
+        return [piece for name, piece in self.piece_map.items() if name in reached]
+
+    def check_stability(self, piece_names=None):
+        """Make pieces that lost their path to a foundation dynamic.
+
+        Args:
+            piece_names: Optional names whose components alone are checked;
+                the whole building is checked when None
+        """
+        if piece_names is None:
+            unsupported = self.find_unsupported_pieces()
+        else:
+            unsupported = []
+            for name in sorted(piece_names):
+                unsupported.extend(self.find_unsupported_component(name))
 
         # Make unstable pieces dynamic so they fall
-        for piece in unstable_pieces:
+        for piece in unsupported:
+            if piece.body_np.node().getMass() > 0:
+                continue  # Already falling
+
             print(f"Piece {piece.name} is unsupported and collapsing!")
-            body_node = piece.body_np.node()
-            body_node.setMass(piece.mass)  # Make it dynamic
-            body_node.setActive(True, True)
+            self.release_piece(piece)
             # Don't destroy them - let them fall naturally
 
+    def process_broken_constraints(self):
+        """Drop connections Bullet broke and re-check the pieces they joined.
+
+        Bullet reports a broken constraint only by disabling it once its
+        applied impulse exceeds the breaking threshold. Only constraints on
+        dynamic pieces can carry load, so only those are watched; each sweep
+        costs one check per watched constraint, not per piece.
+
+        Returns:
+            int: Number of broken constraints processed
+        """
+        broken = [
+            entry
+            for entry in self._watched_constraints.values()
+            if not entry[0].isEnabled()
+        ]
+        if not broken:
+            return 0
+
+        affected = set()
+        for constraint, piece, other in broken:
+            del self._watched_constraints[id(constraint)]
+            self.world.removeConstraint(constraint)
+            for owner in (piece, other):
+                owner.constraints = [
+                    info
+                    for info in owner.constraints
+                    if info["constraint"] is not constraint
+                ]
+            self.adjacency.get(piece.name, set()).discard(other.name)
+            self.adjacency.get(other.name, set()).discard(piece.name)
+            affected.update((piece.name, other.name))
+            print(f"Connection between {piece.name} and {other.name} broke")
+
+        self.check_stability(affected)
+        return len(broken)
+
+    def release_piece(self, piece):
+        """Make a static piece dynamic so physics takes over.
+
+        Args:
+            piece: Piece to release
+        """
+        self.peel_piece(piece)
+        body_node = piece.body_np.node()
+        body_node.setMass(piece.mass)  # Make it dynamic
+        body_node.setActive(True, True)
+        if self.piece_index is not None:
+            self.piece_index.mark_dynamic(piece)
+        if self.physics_manager is not None:
+            self.physics_manager.track(piece.body_np)
+        self.unbatch_piece(piece)
+        # It no longer rests on (or holds up) its neighbours
+        if self.structural_solver is not None:
+            neighbors = self.adjacency.get(piece.name, ())
+            self.structural_solver.mark(self, [piece.name, *neighbors])
+
+        # Its connections now carry load and can be broken by Bullet
+        for constraint_info in piece.constraints:
+            constraint = constraint_info["constraint"]
+            self._watched_constraints.setdefault(
+                id(constraint), (constraint, piece, constraint_info["piece"])
+            )
+
     def damage_piece(
         self,
         piece_name,
@@ -1656,12 +1830,62 @@ class Building:
         )
 
         if destroyed:
+            self._unindex_piece(piece)
             # Fragments are already stored in self.fragments by take_damage()
             # Check if other pieces are now unstable
             self.check_stability()
 
         return destroyed
 
+    def damage_pieces(
+        self,
+        damage_map,
+        create_fragments=False,
+        create_chunks=True,
+        impact_pos=None,
+        max_chunked=AOE_MAX_CHUNKED_PIECES,
+    ):
+        """Apply damage to several pieces with a single stability pass.
+
+        Pieces are processed from most to least damaged. Only the first
+        max_chunked destroyed pieces break into chunks and fragments, the
+        rest simply disappear, which bounds the debris spawned by one blast.
+
+        Args:
+            damage_map: Dict of piece name -> damage amount
+            create_fragments: If True, create debris for chunked pieces
+            create_chunks: If True, create destructible chunks
+            impact_pos: Vec3 world position of the blast centre
+            max_chunked: Maximum destroyed pieces that spawn debris
+
+        Returns:
+            List of names of destroyed pieces
+        """
+        destroyed = []
+        ordered = sorted(damage_map.items(), key=lambda item: item[1], reverse=True)
+
+        for piece_name, amount in ordered:
+            piece = self.piece_map.get(piece_name)
+            if piece is None or piece.is_destroyed:
+                continue
+
+            spawn_debris = len(destroyed) < max_chunked
+            if piece.take_damage(
+                amount,
+                create_fragments=create_fragments and spawn_debris,
+                create_chunks=create_chunks and spawn_debris,
+                impact_pos=impact_pos,
+            ):
+                self._unindex_piece(piece)
+                destroyed.append(piece_name)
+
+        # One sweep settles every support lost in the blast and releases
+        # all the chunks it spawned together
+        if destroyed:
+            self.check_stability()
+
+        return destroyed
+
     def get_piece_at_position(self, position, max_distance=2.0):
         """Find the closest piece to a position.
 
@@ -1695,41 +1919,13 @@ class Building:
             dt: Delta time since last update
             current_time: Current game time in seconds
         """
-        # Clean up old fragments
-        fragments_to_remove = []
+        # Fragments are expired by the world's DebrisPool
 
-        for fragment in self.fragments:
-            # Check if fragment has expired
-            if hasattr(fragment, "lifetime") and hasattr(fragment, "creation_time"):
-                if (
-                    fragment.creation_time > 0
-                    and (current_time - fragment.creation_time) > fragment.lifetime
-                ):
-                    fragments_to_remove.append(fragment)
-
-        # Also enforce hard limit on total fragments (remove oldest if too many)
-        max_fragments = 100  # Hard limit to prevent excessive accumulation
-        if len(self.fragments) > max_fragments:
-            # Sort by creation time and remove oldest
-            sorted_fragments = sorted(
-                [f for f in self.fragments if hasattr(f, "creation_time")],
-                key=lambda f: f.creation_time,
-            )
-            excess_count = len(self.fragments) - max_fragments
-            fragments_to_remove.extend(sorted_fragments[:excess_count])
+        # Keep the connectivity graph in step with constraints Bullet broke
+        self.process_broken_constraints()
 
-        # Remove expired/excess fragments safely
-        for fragment in fragments_to_remove:
-            try:
-                if hasattr(fragment, "remove"):
-                    fragment.remove()
-                if fragment in self.fragments:
-                    self.fragments.remove(fragment)
-            except Exception as e:
-                print(f"Warning: Error removing fragment: {e}")
-                # Still try to remove from list
-                if fragment in self.fragments:
-                    self.fragments.remove(fragment)
+        # Drop split-out pieces from the batch once damage has died down
+        self.flush_render_batch(current_time)
 
         # Clean up destroyed pieces that have exceeded their lifetime
         pieces_to_remove = []
@@ -1745,11 +1941,7 @@ class Building:
                 print(
                     f"Removing destroyed piece {piece.name} after {piece.destroyed_lifetime}s"
                 )
-                piece.remove_from_world()
-                if piece in self.pieces:
-                    self.pieces.remove(piece)
-                if piece.name in self.piece_map:
-                    del self.piece_map[piece.name]
+                self.remove_piece(piece)
             except Exception as e:
                 print(f"Warning: Error removing destroyed piece {piece.name}: {e}")
                 # Still try to remove from lists
@@ -1769,12 +1961,43 @@ class Building:
         pieces_to_remove = [p for p in self.pieces if p.is_destroyed]
 
         for piece in pieces_to_remove:
-            piece.remove_from_world()
+            self.remove_piece(piece)
+
+    def remove_piece(self, piece):
+        """Remove a piece from the world and from this building.
+
+        Args:
+            piece: Piece to remove
+        """
+        # Unindex first so a compounded piece is peeled before its body goes
+        self._unindex_piece(piece)
+        piece.remove_from_world()
+        if piece in self.pieces:
             self.pieces.remove(piece)
+        if self.piece_map.get(piece.name) is piece:
             del self.piece_map[piece.name]
 
     def destroy(self):
         """Completely destroy this building and remove all pieces."""
+        # Drop debris still waiting to spawn
+        if self.destruction_scheduler is not None:
+            self.destruction_scheduler.discard(self)
+        if self.structural_solver is not None:
+            self.structural_solver.discard(self)
+
+        # Hand every piece its own body back before tearing them down
+        if self.compound is not None:
+            self.compound.destroy()
+            self.compound = None
+        self._detached_constraints.clear()
+        self._watched_constraints.clear()
+
+        if self.render_batch_np is not None:
+            self.render_batch_np.removeNode()
+            self.render_batch_np = None
+        self._batched.clear()
+        self._batch_holders.clear()
+
         # Remove all constraints first
         for piece in self.pieces:
             for constraint_data in piece.constraints:
@@ -1784,6 +2007,7 @@ class Building:
 
         # Remove all pieces
         for piece in self.pieces:
+            self._unindex_piece(piece)
             if not piece.is_destroyed:
                 piece.remove_from_world()
 
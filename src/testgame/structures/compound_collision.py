@@ -0,0 +1,137 @@
+"""Shared static collision body for a building's intact pieces."""
+
+from panda3d.bullet import BulletRigidBodyNode
+
+from testgame.engine.body_registry import register_body, unregister_body
+
+
+class CompoundCollision:
+    """One static rigid body holding the box shapes of many pieces.
+
+    Each intact static piece contributes its own collision shape as a child
+    of the compound, and its individual body is taken out of the physics
+    world, so a building costs a single broadphase proxy. Pieces are peeled
+    back into their own bodies when they need to behave individually.
+
+    Child order mirrors Bullet's btCompoundShape, which removes a child by
+    moving the last child into its slot. This keeps piece_for_child() in step
+    with the child index reported by ray results.
+    """
+
+    def __init__(self, world, render, name):
+        """Create an empty compound body.
+
+        Args:
+            world: Bullet physics world
+            render: Panda3D render node
+            name: Node name
+        """
+        self.world = world
+        self.render = render
+
+        body_node = BulletRigidBodyNode(name)
+        body_node.setMass(0)
+        body_node.setFriction(0.9)
+        body_node.setRestitution(0.05)  # Match building pieces
+        register_body(body_node, self)
+
+        self.body_np = render.attachNewNode(body_node)
+        self.attached = False
+        self._children = []  # child index -> (piece, shape)
+        self._shapes = {}  # piece -> list of shapes it contributed
+
+    def __len__(self):
+        return len(self._shapes)
+
+    def __contains__(self, piece):
+        return piece in self._shapes
+
+    def add(self, pieces):
+        """Move pieces' collision into the compound.
+
+        The compound is re-inserted into the broadphase once per call, so
+        pass a whole building's pieces together rather than one at a time.
+
+        Args:
+            pieces: Iterable of static BuildingPiece or CurvedRoofPiece
+        """
+        compound = self.body_np.node()
+        added = False
+        for piece in pieces:
+            if piece in self._shapes:
+                continue
+
+            piece_node = piece.body_np.node()
+            body_transform = piece.body_np.getTransform(self.render)
+            shapes = []
+            for i in range(piece_node.getNumShapes()):
+                shape = piece_node.getShape(i)
+                transform = body_transform.compose(piece_node.getShapeTransform(i))
+                compound.addShape(shape, transform)
+                self._children.append((piece, shape))
+                shapes.append(shape)
+            self._shapes[piece] = shapes
+            self.world.removeRigidBody(piece_node)
+            added = True
+
+        if not added:
+            return
+        # Static bodies only get their broadphase bounds computed on attach,
+        # so re-attach to cover the new children
+        if self.attached:
+            self.world.removeRigidBody(compound)
+        self.world.attachRigidBody(compound)
+        self.attached = True
+
+    def remove(self, piece):
+        """Peel a piece back out into its own rigid body.
+
+        Args:
+            piece: Piece previously passed to add()
+
+        Returns:
+            bool: True if the piece was part of the compound
+        """
+        shapes = self._shapes.pop(piece, None)
+        if shapes is None:
+            return False
+
+        compound = self.body_np.node()
+        for shape in shapes:
+            compound.removeShape(shape)
+            # Same swap-with-last removal Bullet applies to its children
+            index = next(
+                i for i, child in enumerate(self._children) if child[1] is shape
+            )
+            self._children[index] = self._children[-1]
+            self._children.pop()
+
+        self.world.attachRigidBody(piece.body_np.node())
+
+        if not self._shapes and self.attached:
+            self.world.removeRigidBody(compound)
+            self.attached = False
+        return True
+
+    def piece_for_child(self, index):
+        """Resolve a compound child index (a ray result's triangle index).
+
+        Args:
+            index: Child index
+
+        Returns:
+            Owning piece or None
+        """
+        if 0 <= index < len(self._children):
+            return self._children[index][0]
+        return None
+
+    def destroy(self):
+        """Peel every piece back out and remove the compound body."""
+        for piece in list(self._shapes):
+            self.remove(piece)
+        if self.attached:
+            self.world.removeRigidBody(self.body_np.node())
+            self.attached = False
+        unregister_body(self.body_np.node())
+        self.body_np.removeNode()
@@ -0,0 +1,374 @@
+"""World-wide pool and budget for destruction debris."""
+
+import heapq
+import time
+from collections import OrderedDict
+
+from testgame.config.destruction_config import (
+    DEBRIS_CHUNK_BYTES,
+    DEBRIS_FRAGMENT_BYTES,
+    DEBRIS_MAX_CHUNKS,
+    DEBRIS_MAX_FRAGMENTS,
+    DEBRIS_MEMORY_BUDGET,
+    DEBRIS_PREWARM_FRAGMENTS,
+    DEBRIS_SETTLED_CHUNK_LIFETIME,
+    DEBRIS_SETTLE_FRAMES,
+    DEBRIS_SETTLE_SPEED,
+)
+from testgame.structures.building import Fragment
+from testgame.structures.settled_debris import SettledDebrisField
+
+
+class DebrisPool:
+    """Recycles fragment bodies and caps live debris across all buildings.
+
+    Fragments are created once and parked when they expire, so sustained
+    destruction reuses the same rigid bodies and nodes. Expiry is driven by a
+    heap of (expire_time, sequence) entries. When a count cap or the memory
+    budget is exceeded, the oldest debris is recycled first.
+
+    Debris that comes to rest stops being simulated: it is baked into a
+    SettledDebrisField, fragment bodies are parked and chunk pieces removed.
+    """
+
+    def __init__(
+        self,
+        world,
+        render,
+        max_fragments=DEBRIS_MAX_FRAGMENTS,
+        max_chunks=DEBRIS_MAX_CHUNKS,
+        memory_budget=DEBRIS_MEMORY_BUDGET,
+        prewarm=DEBRIS_PREWARM_FRAGMENTS,
+        clock=time.time,
+    ):
+        """Initialize the pool.
+
+        Args:
+            world: Bullet physics world
+            render: Panda3D render node
+            max_fragments: Maximum live fragments
+            max_chunks: Maximum live chunks
+            memory_budget: Maximum bytes of live debris
+            prewarm: Number of fragments to create up front
+            clock: Function returning the current time in seconds
+        """
+        self.world = world
+        self.render = render
+        self.max_fragments = max_fragments
+        self.max_chunks = max_chunks
+        self.memory_budget = memory_budget
+        self.clock = clock
+
+        self._free = [Fragment(world, render) for _ in range(prewarm)]
+        self._fragments = OrderedDict()  # fragment -> spawn sequence (oldest first)
+        self._chunks = OrderedDict()  # chunk -> spawn sequence (oldest first)
+        self._expiry = []  # heap of (expire_time, sequence, fragment)
+        self._sequence = 0
+        self._rest_frames = {}  # debris -> consecutive resting frames
+        self.settled = SettledDebrisField(world, render)
+        self.renderer = None  # Optional InstancedDebrisRenderer
+        self.physics_manager = None  # Optional PhysicsManager (set by World)
+        self.fragments_created = prewarm
+
+    def set_renderer(self, renderer):
+        """Draw fragments through an instanced renderer instead of their own nodes.
+
+        Args:
+            renderer: InstancedDebrisRenderer, or None for per-node rendering
+        """
+        if self.renderer is not None and renderer is None:
+            self.renderer.destroy()
+        self.renderer = renderer
+
+        for fragment in list(self._fragments) + self._free:
+            self._apply_render_mode(fragment)
+
+    def _apply_render_mode(self, fragment):
+        """Show or hide a fragment's own box depending on the render mode.
+
+        Args:
+            fragment: Fragment to update
+        """
+        if self.renderer is None:
+            fragment.geom_np.show()
+        else:
+            fragment.geom_np.hide()
+
+    @property
+    def bytes_in_use(self):
+        """Approximate memory held by live debris."""
+        return (
+            len(self._fragments) * DEBRIS_FRAGMENT_BYTES
+            + len(self._chunks) * DEBRIS_CHUNK_BYTES
+        )
+
+    @property
+    def load(self):
+        """How full the pool is, from 0 (empty) to 1 (at a budget limit)."""
+        return min(
+            1.0,
+            max(
+                len(self._fragments) / max(self.max_fragments, 1),
+                len(self._chunks) / max(self.max_chunks, 1),
+                self.bytes_in_use / max(self.memory_budget, 1),
+            ),
+        )
+
+    def _next_sequence(self):
+        self._sequence += 1
+        return self._sequence
+
+    def spawn_fragment(self, position, size, color, impulse=None, torque=None):
+        """Spawn a fragment, reusing a parked one when possible.
+
+        Args:
+            position: Vec3 world position
+            size: Vec3 dimensions
+            color: Vec4 RGBA color
+            impulse: Optional Vec3 impulse to apply
+            torque: Optional Vec3 torque impulse (spin)
+
+        Returns:
+            Fragment now live in the world
+        """
+        if len(self._fragments) >= self.max_fragments:
+            self._recycle_oldest_fragment()
+        self._enforce_budget(DEBRIS_FRAGMENT_BYTES)
+
+        if self._free:
+            fragment = self._free.pop()
+        else:
+            fragment = Fragment(self.world, self.render)
+            self._apply_render_mode(fragment)
+            self.fragments_created += 1
+
+        self._physics_call(
+            self._spawn_and_track, fragment, position, size, color, impulse, torque
+        )
+
+        now = self.clock()
+        sequence = self._next_sequence()
+        fragment.creation_time = now
+        fragment.pool_sequence = sequence
+        self._fragments[fragment] = sequence
+        heapq.heappush(self._expiry, (now + fragment.lifetime, sequence, fragment))
+        return fragment
+
+    def _physics_call(self, function, *args):
+        """Change the physics world, deferred while a threaded step runs.
+
+        Args:
+            function: Callable that touches the physics world
+            *args: Arguments passed to it
+        """
+        if self.physics_manager is not None:
+            self.physics_manager.call(function, *args)
+        else:
+            function(*args)
+
+    def _spawn_and_track(self, fragment, position, size, color, impulse, torque):
+        """Put a fragment into the world and draw it from physics poses."""
+        fragment.spawn(position, size, color, impulse, torque)
+        if self.physics_manager is not None:
+            self.physics_manager.track(fragment.body_np)
+
+    def track_chunk(self, chunk):
+        """Count a chunk piece against the debris caps.
+
+        Args:
+            chunk: BuildingPiece spawned as debris
+        """
+        if len(self._chunks) >= self.max_chunks:
+            self._evict_oldest_chunk()
+        self._enforce_budget(DEBRIS_CHUNK_BYTES)
+        self._chunks[chunk] = self._next_sequence()
+
+    def release_chunk(self, chunk):
+        """Stop tracking a chunk that was destroyed or removed.
+
+        Args:
+            chunk: Piece that may or may not be tracked
+        """
+        self._chunks.pop(chunk, None)
+        self._rest_frames.pop(chunk, None)
+
+    def _park(self, fragment):
+        """Return a live fragment to the free list.
+
+        Args:
+            fragment: Fragment to park
+        """
+        if self._fragments.pop(fragment, None) is None:
+            return
+        self._rest_frames.pop(fragment, None)
+        self._physics_call(fragment.park)
+        self._free.append(fragment)
+
+    def _recycle_oldest_fragment(self):
+        """Park the longest-lived fragment."""
+        if self._fragments:
+            self._park(next(iter(self._fragments)))
+
+    def _evict_oldest_chunk(self):
+        """Remove the longest-lived chunk from its building."""
+        if not self._chunks:
+            return
+        chunk, _ = self._chunks.popitem(last=False)
+        self._rest_frames.pop(chunk, None)
+        building = chunk.parent_building
+        if building is not None:
+            building.remove_piece(chunk)
+        else:
+            chunk.remove_from_world()
+
+    def _enforce_budget(self, incoming_bytes):
+        """Recycle the oldest debris until a new item fits the memory budget.
+
+        Args:
+            incoming_bytes: Footprint of the item about to be added
+        """
+        while self.bytes_in_use + incoming_bytes > self.memory_budget:
+            oldest_fragment = next(iter(self._fragments.values()), None)
+            oldest_chunk = next(iter(self._chunks.values()), None)
+            if oldest_fragment is None and oldest_chunk is None:
+                return
+            if oldest_chunk is None or (
+                oldest_fragment is not None and oldest_fragment < oldest_chunk
+            ):
+                self._recycle_oldest_fragment()
+            else:
+                self._evict_oldest_chunk()
+
+    def _has_settled(self, item, body_node):
+        """Track how long a debris body has been at rest.
+
+        Args:
+            item: Fragment or chunk
+            body_node: Its rigid body node
+
+        Returns:
+            bool: True once the body is asleep or has rested long enough
+        """
+        if not body_node.isActive():
+            self._rest_frames.pop(item, None)
+            return True
+
+        if (
+            body_node.getLinearVelocity().length() > DEBRIS_SETTLE_SPEED
+            or body_node.getAngularVelocity().length() > DEBRIS_SETTLE_SPEED
+        ):
+            self._rest_frames.pop(item, None)
+            return False
+
+        frames = self._rest_frames.get(item, 0) + 1
+        if frames >= DEBRIS_SETTLE_FRAMES:
+            self._rest_frames.pop(item, None)
+            return True
+        self._rest_frames[item] = frames
+        return False
+
+    def settle_resting(self):
+        """Bake debris that has come to rest into static, merged storage.
+
+        Returns:
+            int: Number of fragments and chunks settled
+        """
+        settled = 0
+        for fragment in list(self._fragments):
+            body_np = fragment.body_np
+            if not self._has_settled(fragment, body_np.node()):
+                continue
+            self.settled.add(
+                body_np.getPos(),
+                body_np.getHpr(),
+                body_np.getScale(),
+                fragment.geom_np.getColor(),
+                fragment.creation_time + fragment.lifetime,
+            )
+            self._park(fragment)
+            settled += 1
+
+        for chunk in list(self._chunks):
+            if chunk.is_destroyed:
+                continue
+            body_node = chunk.body_np.node()
+            if body_node.getMass() > 0 and self._has_settled(chunk, body_node):
+                self._settle_chunk(chunk)
+                settled += 1
+
+        return settled
+
+    def _settle_chunk(self, chunk):
+        """Bake a resting chunk into the settled field and remove its piece.
+
+        Args:
+            chunk: BuildingPiece at rest
+        """
+        body_np = chunk.body_np
+        self.settled.add(
+            body_np.getPos(),
+            body_np.getHpr(),
+            chunk.size,
+            chunk.color,
+            self.clock() + DEBRIS_SETTLED_CHUNK_LIFETIME,
+        )
+        if self.physics_manager is not None:
+            self.physics_manager.untrack(body_np)
+
+        self.release_chunk(chunk)
+        building = chunk.parent_building
+        if building is not None:
+            building.remove_piece(chunk)
+        else:
+            chunk.remove_from_world()
+
+    def update(self, current_time=None):
+        """Expire fragments, settle resting debris and refresh settled batches.
+
+        Args:
+            current_time: Current time in seconds (defaults to the pool clock)
+
+        Returns:
+            int: Number of fragments parked by expiry
+        """
+        if current_time is None:
+            current_time = self.clock()
+
+        parked = 0
+        while self._expiry and self._expiry[0][0] <= current_time:
+            _, sequence, fragment = heapq.heappop(self._expiry)
+            # Skip entries for fragments recycled early and respawned since
+            if self._fragments.get(fragment) == sequence:
+                self._park(fragment)
+                parked += 1
+
+        self.settle_resting()
+        self.settled.update(current_time)
+
+        if self.renderer is not None:
+            self.renderer.update(self._fragments)
+        return parked
+
+    def clear(self):
+        """Park every live fragment and forget tracked chunks."""
+        for fragment in list(self._fragments):
+            self._park(fragment)
+        self._expiry.clear()
+        self._chunks.clear()
+        self._rest_frames.clear()
+        self.settled.clear()
+
+    def get_stats(self):
+        """Get debris usage counters.
+
+        Returns:
+            Dict with live/free counts and estimated bytes in use
+        """
+        return {
+            "fragments": len(self._fragments),
+            "free_fragments": len(self._free),
+            "chunks": len(self._chunks),
+            "settled": len(self.settled),
+            "fragments_created": self.fragments_created,
+            "bytes_in_use": self.bytes_in_use,
+        }
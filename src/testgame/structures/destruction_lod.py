@@ -0,0 +1,81 @@
+"""Detail level for destruction debris based on viewer distance and debris load."""
+
+from testgame.config.destruction_config import (
+    DESTRUCTION_LOD_EFFECT_DISTANCE,
+    DESTRUCTION_LOD_FULL_DISTANCE,
+    DESTRUCTION_LOD_LOAD_WEIGHT,
+)
+
+LOD_FULL = 0  # Chunks and fragments
+LOD_REDUCED = 1  # Fewer, larger chunks; no fragments
+LOD_EFFECT = 2  # No debris, just a short-lived dust effect
+
+
+class DestructionLOD:
+    """Chooses how much debris a destroyed piece spawns.
+
+    Destruction close to the viewer gets full debris. Farther away pieces
+    break into a couple of large chunks, and beyond that they only leave a
+    dust puff. The busier the debris pool, the closer both thresholds move.
+    """
+
+    def __init__(
+        self,
+        full_distance=DESTRUCTION_LOD_FULL_DISTANCE,
+        effect_distance=DESTRUCTION_LOD_EFFECT_DISTANCE,
+        load_weight=DESTRUCTION_LOD_LOAD_WEIGHT,
+    ):
+        """Initialize the LOD policy.
+
+        Args:
+            full_distance: Distance up to which destruction gets full debris
+            effect_distance: Distance beyond which destruction spawns no debris
+            load_weight: How strongly debris load pulls the distances in
+        """
+        self.full_distance = full_distance
+        self.effect_distance = effect_distance
+        self.load_weight = load_weight
+        self.viewer_pos = None  # No viewer yet: everything gets full detail
+        self.effect_callback = None  # callable(position, size, color) for LOD_EFFECT
+        self.counts = [0, 0, 0]  # Destructions per level
+
+    def set_viewer(self, position):
+        """Update the position distances are measured from.
+
+        Args:
+            position: Vec3 camera (or player) position
+        """
+        self.viewer_pos = position
+
+    def select(self, position, debris_load=0.0):
+        """Pick the detail level for a destruction.
+
+        Args:
+            position: Vec3 world position of the destroyed piece
+            debris_load: Debris pool load from 0 (empty) to 1 (full)
+
+        Returns:
+            int: LOD_FULL, LOD_REDUCED or LOD_EFFECT
+        """
+        level = LOD_FULL
+        if self.viewer_pos is not None:
+            scale = 1.0 / (1.0 + debris_load * self.load_weight)
+            distance = (position - self.viewer_pos).length()
+            if distance > self.effect_distance * scale:
+                level = LOD_EFFECT
+            elif distance > self.full_distance * scale:
+                level = LOD_REDUCED
+
+        self.counts[level] += 1
+        return level
+
+    def spawn_effect(self, position, size, color):
+        """Show the stand-in effect for a destruction that spawns no debris.
+
+        Args:
+            position: Vec3 world position of the destroyed piece
+            size: Vec3 piece dimensions
+            color: Vec4 piece color
+        """
+        if self.effect_callback is not None:
+            self.effect_callback(position, size, color)
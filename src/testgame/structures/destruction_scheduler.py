@@ -0,0 +1,89 @@
+"""Frame-budgeted queue for deferred destruction work."""
+
+import time
+from collections import deque
+
+from testgame.config.destruction_config import DESTRUCTION_FRAME_BUDGET_MS
+
+
+class DestructionScheduler:
+    """Spreads debris spawning for destroyed pieces across frames.
+
+    A destroyed piece is removed from physics and the scene immediately; the
+    expensive part (building chunk and fragment bodies) is queued here and
+    drained by process() each frame until the time budget is used up.
+    """
+
+    def __init__(self, budget_ms=DESTRUCTION_FRAME_BUDGET_MS, clock=time.perf_counter):
+        """Initialize the scheduler.
+
+        Args:
+            budget_ms: Default time budget per process() call in milliseconds
+            clock: Function returning the current time in seconds
+        """
+        self.budget_ms = budget_ms
+        self.clock = clock
+        self._queue = deque()  # (owner, callback, args)
+        self.jobs_processed = 0
+
+    def __len__(self):
+        return len(self._queue)
+
+    def schedule(self, owner, callback, *args):
+        """Queue a unit of destruction work.
+
+        Args:
+            owner: Object the work belongs to (used by discard())
+            callback: Function to call
+            *args: Arguments passed to the callback
+        """
+        self._queue.append((owner, callback, args))
+
+    def process(self, budget_ms=None):
+        """Run queued work until the time budget is spent.
+
+        At least one job runs per call so the queue always makes progress.
+
+        Args:
+            budget_ms: Time budget in milliseconds (defaults to self.budget_ms)
+
+        Returns:
+            int: Number of jobs run
+        """
+        if budget_ms is None:
+            budget_ms = self.budget_ms
+
+        deadline = self.clock() + budget_ms / 1000.0
+        processed = 0
+        while self._queue:
+            _, callback, args = self._queue.popleft()
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Warning: Destruction job failed: {e}")
+            processed += 1
+            if self.clock() >= deadline:
+                break
+
+        self.jobs_processed += processed
+        return processed
+
+    def flush(self):
+        """Run every queued job regardless of budget.
+
+        Returns:
+            int: Number of jobs run
+        """
+        return self.process(budget_ms=float("inf"))
+
+    def discard(self, owner):
+        """Drop pending work belonging to an owner (e.g. a removed building).
+
+        Args:
+            owner: Owner passed to schedule()
+        """
+        self._queue = deque(job for job in self._queue if job[0] is not owner)
+
+    def clear(self):
+        """Drop all pending work."""
+        self._queue.clear()
@@ -0,0 +1,181 @@
+"""Chunk layouts for building pieces, planned ahead of destruction."""
+
+import random
+from collections import namedtuple
+
+# Offsets are relative to the piece centre; vectors are plain tuples so a
+# layout can be built and compared without touching Panda3D.
+ChunkTemplate = namedtuple("ChunkTemplate", "offset size impulse torque")
+FractureLayout = namedtuple("FractureLayout", "split_axis chunks")
+
+
+def compute_fracture_layout(size, seed):
+    """Decide how a piece breaks into chunks.
+
+    Larger pieces break into more chunks, split along their longest axis,
+    and every chunk gets a slightly varied size, an outward impulse
+    perpendicular to the split axis and a random spin.
+
+    Args:
+        size: (x, y, z) dimensions of the piece
+        seed: Seed for this layout's random variation
+
+    Returns:
+        FractureLayout
+    """
+    rng = random.Random(seed)
+    size_x, size_y, size_z = size
+
+    size_factor = (size_x + size_y + size_z) / 3
+    if size_factor > 5:
+        num_chunks = rng.randint(3, 4)
+    else:
+        num_chunks = rng.randint(2, 3)
+
+    # Split along the dominant dimension
+    if size_x >= size_y and size_x >= size_z:
+        split_axis = 0
+    elif size_y >= size_x and size_y >= size_z:
+        split_axis = 1
+    else:
+        split_axis = 2
+
+    spacing = size[split_axis] / num_chunks
+    base_size = list(size)
+    base_size[split_axis] = spacing * 0.9
+
+    # Chunks fly apart mostly across the split axis
+    impulse_range = [5, 5, 3]
+    impulse_range[split_axis] = 2
+
+    chunks = []
+    for i in range(num_chunks):
+        offset = [0.0, 0.0, 0.0]
+        offset[split_axis] = -size[split_axis] / 2 + spacing * (i + 0.5)
+
+        chunk_size = tuple(extent * rng.uniform(0.95, 1.0) for extent in base_size)
+
+        direction = [rng.uniform(-r, r) for r in impulse_range]
+        length = sum(d * d for d in direction) ** 0.5 or 1.0
+        strength = rng.uniform(10, 20)
+        impulse = tuple(d / length * strength for d in direction)
+
+        torque = tuple(rng.uniform(-10, 10) for _ in range(3))
+        chunks.append(ChunkTemplate(tuple(offset), chunk_size, impulse, torque))
+
+    return FractureLayout("xyz"[split_axis], tuple(chunks))
+
+
+def coarsen_layout(layout, max_chunks):
+    """Merge neighbouring chunks of a layout into at most max_chunks larger ones.
+
+    Args:
+        layout: FractureLayout
+        max_chunks: Maximum number of chunks to keep
+
+    Returns:
+        FractureLayout with merged chunks (the same layout if already small)
+    """
+    count = len(layout.chunks)
+    if count <= max_chunks:
+        return layout
+
+    axis = "xyz".index(layout.split_axis)
+    merged = []
+    for group_index in range(max_chunks):
+        group = layout.chunks[
+            group_index * count // max_chunks : (group_index + 1) * count // max_chunks
+        ]
+        offset = list(group[0].offset)
+        offset[axis] = sum(chunk.offset[axis] for chunk in group) / len(group)
+        size = [max(chunk.size[i] for chunk in group) for i in range(3)]
+        size[axis] = sum(chunk.size[axis] for chunk in group)
+        first = group[0]
+        merged.append(
+            ChunkTemplate(tuple(offset), tuple(size), first.impulse, first.torque)
+        )
+    return FractureLayout(layout.split_axis, tuple(merged))
+
+
+class Prefracturer:
+    """Plans chunk layouts for pieces before they are destroyed.
+
+    Pieces are queued when they are first damaged (or spawned as chunks) and
+    their layout is computed right then, so destroying a piece only has to
+    instantiate chunks that are already laid out. Seeds are drawn from rng in
+    queue order, so a seeded world breaks every piece the same way however
+    long it takes to break. Layouts are computed on the main thread: each is
+    a few dozen microseconds of pure Python, which a worker thread would only
+    contend with the main thread for under the GIL.
+    """
+
+    def __init__(self, rng=None):
+        """Initialize the prefracturer.
+
+        Args:
+            rng: Random instance seeds are drawn from (defaults to the
+                random module)
+        """
+        self.rng = rng if rng is not None else random
+        self._pending = {}  # piece -> FractureLayout
+        self.layouts_planned = 0  # Layouts computed ahead, when the piece was queued
+        self.layouts_unplanned = 0  # Layouts for pieces that were never queued
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __contains__(self, piece):
+        return piece in self._pending
+
+    def request(self, piece):
+        """Compute a piece's layout if it does not have one yet.
+
+        Args:
+            piece: BuildingPiece that may break soon
+        """
+        if piece not in self._pending:
+            self._pending[piece] = self._compute(piece)
+
+    def take(self, piece):
+        """Get a piece's layout.
+
+        Args:
+            piece: BuildingPiece being destroyed
+
+        Returns:
+            FractureLayout
+        """
+        layout = self._pending.pop(piece, None)
+        if layout is None:
+            self.layouts_unplanned += 1
+            return self._compute(piece)
+        self.layouts_planned += 1
+        return layout
+
+    def _compute(self, piece):
+        """Lay out a piece's chunks from the next seed.
+
+        Args:
+            piece: BuildingPiece to lay out
+
+        Returns:
+            FractureLayout
+        """
+        size = (piece.size.x, piece.size.y, piece.size.z)
+        return compute_fracture_layout(size, self.rng.getrandbits(32))
+
+    def discard(self, piece):
+        """Forget a piece's prepared layout.
+
+        Args:
+            piece: Piece that was removed
+        """
+        self._pending.pop(piece, None)
+
+    def clear(self):
+        """Forget every prepared layout."""
+        self._pending.clear()
+
+    def shutdown(self):
+        """Forget every prepared layout when the world is torn down."""
+        self.clear()
@@ -0,0 +1,197 @@
+"""Static, merged storage for debris that has come to rest."""
+
+import heapq
+import math
+
+from panda3d.bullet import BulletBoxShape, BulletRigidBodyNode
+from panda3d.core import NodePath, TransformState
+
+from testgame.config.destruction_config import (
+    DEBRIS_SETTLE_CELL_SIZE,
+    DEBRIS_SETTLED_PER_CELL,
+)
+from testgame.rendering.geometry_cache import attach_box
+
+
+class _DebrisCell:
+    """One area of settled debris: a static compound body and a flat batch."""
+
+    def __init__(self, world, render, name):
+        """Create an empty cell.
+
+        Args:
+            world: Bullet physics world
+            render: Panda3D render node
+            name: Node name
+        """
+        self.world = world
+        self.body_np = render.attachNewNode(BulletRigidBodyNode(name))
+        self.body_np.node().setFriction(0.8)
+        self.visual_np = None
+        self.entries = []  # dicts in settle order (oldest first)
+        self.attached = False
+
+    def add(self, entry):
+        """Add a settled box as a child shape of the static body.
+
+        The shape collides once reattach() has run.
+
+        Args:
+            entry: Dict with pos, hpr, size and color
+        """
+        shape = BulletBoxShape(entry["size"] * 0.5)
+        entry["shape"] = shape
+        self.body_np.node().addShape(
+            shape, TransformState.makePosHpr(entry["pos"], entry["hpr"])
+        )
+        self.entries.append(entry)
+
+    def remove(self, entry):
+        """Drop a settled box from the body.
+
+        Args:
+            entry: Entry previously passed to add()
+        """
+        self.body_np.node().removeShape(entry["shape"])
+        self.entries.remove(entry)
+        entry["removed"] = True
+        if not self.entries and self.attached:
+            self.world.removeRigidBody(self.body_np.node())
+            self.attached = False
+
+    def reattach(self):
+        """Re-insert the body so its broadphase bounds cover every shape."""
+        body_node = self.body_np.node()
+        # Static bodies only get their broadphase bounds computed on attach
+        if self.attached:
+            self.world.removeRigidBody(body_node)
+        self.world.attachRigidBody(body_node)
+        self.attached = True
+
+    def rebuild_visual(self):
+        """Flatten every settled box in the cell into a single batch."""
+        if self.visual_np is not None:
+            self.visual_np.removeNode()
+            self.visual_np = None
+
+        if self.entries:
+            self.visual_np = self.body_np.attachNewNode("settled_debris_geom")
+            for entry in self.entries:
+                box = attach_box(self.visual_np, entry["size"], entry["color"])
+                box.setPosHpr(entry["pos"], entry["hpr"])
+            self.visual_np.flattenStrong()
+
+    def destroy(self):
+        """Remove the cell's body and visuals."""
+        if self.attached:
+            self.world.removeRigidBody(self.body_np.node())
+            self.attached = False
+        self.body_np.removeNode()
+
+
+class SettledDebrisField:
+    """Merges resting debris into per-area static bodies and render batches.
+
+    Each grid cell owns one static rigid body whose child shapes are the
+    settled boxes, so resting debris costs one broadphase entry per area and
+    nothing in the solver. Cells that changed are re-attached and their
+    visuals rebuilt and flattened once per update, so boxes settled since the
+    last update collide and draw from then on.
+    """
+
+    def __init__(
+        self,
+        world,
+        render,
+        cell_size=DEBRIS_SETTLE_CELL_SIZE,
+        max_per_cell=DEBRIS_SETTLED_PER_CELL,
+    ):
+        """Initialize the field.
+
+        Args:
+            world: Bullet physics world
+            render: Panda3D render node
+            cell_size: World units per merged area
+            max_per_cell: Settled boxes kept per area before the oldest is dropped
+        """
+        self.world = world
+        self.render = render
+        self.cell_size = cell_size
+        self.max_per_cell = max_per_cell
+        self._cells = {}  # (ix, iy) -> _DebrisCell
+        self._expiry = []  # heap of (expire_time, sequence, cell key, entry)
+        self._dirty = set()  # keys of cells changed since the last update
+        self._sequence = 0
+
+    def __len__(self):
+        return sum(len(cell.entries) for cell in self._cells.values())
+
+    def add(self, pos, hpr, size, color, expire_time):
+        """Store a settled box.
+
+        Args:
+            pos: Vec3 world position
+            hpr: Vec3 world orientation
+            size: Vec3 box dimensions
+            color: Vec4 RGBA color
+            expire_time: Time after which the box disappears
+        """
+        key = (
+            math.floor(pos.x / self.cell_size),
+            math.floor(pos.y / self.cell_size),
+        )
+        cell = self._cells.get(key)
+        if cell is None:
+            name = f"settled_debris_{key[0]}_{key[1]}"
+            cell = _DebrisCell(self.world, self.render, name)
+            self._cells[key] = cell
+
+        if len(cell.entries) >= self.max_per_cell:
+            cell.remove(cell.entries[0])
+
+        entry = {
+            "pos": pos,
+            "hpr": hpr,
+            "size": size,
+            "color": color,
+            "removed": False,
+        }
+        cell.add(entry)
+        self._dirty.add(key)
+
+        self._sequence += 1
+        heapq.heappush(self._expiry, (expire_time, self._sequence, key, entry))
+
+    def update(self, current_time):
+        """Drop expired boxes, then re-attach and rebuild the changed cells.
+
+        Args:
+            current_time: Current time in seconds
+        """
+        while self._expiry and self._expiry[0][0] <= current_time:
+            _, _, key, entry = heapq.heappop(self._expiry)
+            cell = self._cells.get(key)
+            # Entries dropped by the per-cell cap are already gone
+            if cell is not None and not entry["removed"]:
+                cell.remove(entry)
+                self._dirty.add(key)
+
+        for key in self._dirty:
+            cell = self._cells.get(key)
+            if cell is None:
+                continue
+            if not cell.entries:
+                cell.destroy()
+                del self._cells[key]
+            else:
+                cell.reattach()
+                cell.rebuild_visual()
+        self._dirty.clear()
+
+    def clear(self):
+        """Remove all settled debris."""
+        for cell in self._cells.values():
+            cell.destroy()
+        self._cells.clear()
+        self._expiry.clear()
+        self._dirty.clear()
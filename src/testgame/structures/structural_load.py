@@ -0,0 +1,334 @@
+"""Load propagation from roofs and walls down to foundations."""
+
+import time
+
+import numpy as np
+
+from testgame.config.destruction_config import (
+    STRUCTURAL_FRAME_BUDGET_MS,
+    STRUCTURAL_LEVEL_TOLERANCE,
+    STRUCTURAL_STRENGTH,
+)
+
+
+def propagate_loads(weights, sources, targets, shares, loads=None, mask=None):
+    """Add to each piece's weight the load passed down from the pieces it holds.
+
+    Jacobi iteration over the support graph: every pass hands each piece's
+    current load to its supporters in proportion to the edge shares. Support
+    edges always point downward, so the loads settle after as many passes as
+    the graph has levels.
+
+    Args:
+        weights: (n,) array of piece weights
+        sources: (e,) array of supported piece indices
+        targets: (e,) array of supporting piece indices
+        shares: (e,) array with the fraction of the source's load each edge carries
+        loads: Optional (n,) array of previous loads to start from
+        mask: Optional (n,) bool array; only these loads are recomputed and
+            the rest are held fixed
+
+    Returns:
+        (n,) array of total load carried by each piece
+    """
+    count = len(weights)
+    loads = weights.copy() if loads is None else loads.copy()
+
+    for _ in range(count + 1):
+        passed = np.bincount(targets, weights=loads[sources] * shares, minlength=count)
+        new_loads = weights + passed
+        if mask is not None:
+            new_loads = np.where(mask, new_loads, loads)
+        if np.allclose(new_loads, loads):
+            return new_loads
+        loads = new_loads
+    return loads
+
+
+def _carries_load(piece):
+    """Check whether a piece is part of the standing structure."""
+    return (
+        not piece.is_destroyed
+        and piece.body_np is not None
+        and not piece.body_np.isEmpty()
+        and piece.body_np.node().getMass() == 0
+    )
+
+
+class SupportGraph:
+    """Which pieces of a building rest on which, plus their current state.
+
+    The edges are found once from the standing pieces' heights; afterwards
+    only the state of pieces the solver is told about is refreshed.
+    """
+
+    def __init__(self, building, level_tolerance):
+        """Build the graph from a building's standing pieces.
+
+        Args:
+            building: Building to describe
+            level_tolerance: Height difference before a neighbour counts as below
+        """
+        self.pieces = [piece for piece in building.pieces if _carries_load(piece)]
+        self.index = {piece.name: i for i, piece in enumerate(self.pieces)}
+
+        heights = np.array([piece.body_np.getZ() for piece in self.pieces])
+        self.weights = np.array([float(piece.mass) for piece in self.pieces])
+        self.footprints = np.array(
+            [piece.size.x * piece.size.y for piece in self.pieces]
+        )
+        self.foundation = np.array(
+            [piece.is_foundation for piece in self.pieces], dtype=bool
+        )
+
+        sources = []
+        targets = []
+        for i, piece in enumerate(self.pieces):
+            if piece.is_foundation:
+                continue  # Foundations pass their load to the ground
+            for neighbor in building.adjacency.get(piece.name, ()):
+                j = self.index.get(neighbor)
+                if j is not None and heights[j] < heights[i] - level_tolerance:
+                    sources.append(i)
+                    targets.append(j)
+        self.sources = np.array(sources, dtype=np.intp)
+        self.targets = np.array(targets, dtype=np.intp)
+
+        self.standing = np.ones(len(self.pieces), dtype=bool)
+        self.health = np.ones(len(self.pieces))
+        self.loads = np.zeros(len(self.pieces))
+        self.refresh(np.arange(len(self.pieces)))
+
+    def __len__(self):
+        return len(self.pieces)
+
+    def refresh(self, indices):
+        """Re-read whether some pieces still stand and how healthy they are.
+
+        Args:
+            indices: Array of piece indices
+        """
+        for i in indices:
+            piece = self.pieces[i]
+            self.standing[i] = _carries_load(piece)
+            self.health[i] = max(piece.health, 0.0) / piece.max_health
+
+    def affected_by(self, indices):
+        """Find the pieces whose load can change when some pieces change.
+
+        Load only flows downward, so that is the changed pieces plus every
+        piece below them along support edges.
+
+        Args:
+            indices: Array of changed piece indices
+
+        Returns:
+            (n,) bool array
+        """
+        affected = np.zeros(len(self.pieces), dtype=bool)
+        frontier = np.zeros(len(self.pieces), dtype=bool)
+        frontier[indices] = True
+        live_edges = self.standing[self.targets]
+        while frontier.any():
+            affected |= frontier
+            reached = np.zeros(len(self.pieces), dtype=bool)
+            reached[self.targets[frontier[self.sources] & live_edges]] = True
+            frontier = reached & ~affected
+        return affected
+
+    def solve(self, mask):
+        """Recompute the loads of masked pieces, keeping the others.
+
+        Args:
+            mask: (n,) bool array of pieces to recompute
+
+        Returns:
+            (n,) array of loads
+        """
+        live_edges = self.standing[self.sources] & self.standing[self.targets]
+        # Each piece splits its load evenly between its standing supporters
+        supporters = np.bincount(
+            self.sources[live_edges], minlength=len(self.pieces)
+        )
+        shares = np.where(live_edges, 1.0, 0.0)
+        if len(shares):
+            shares /= np.maximum(supporters[self.sources], 1)
+
+        weights = np.where(self.standing, self.weights, 0.0)
+        self.loads = propagate_loads(
+            weights, self.sources, self.targets, shares, self.loads, mask
+        )
+        return self.loads
+
+
+class StructuralSolver:
+    """Fails building supports that carry more load than they can hold.
+
+    Every standing piece passes its weight, plus whatever rests on it, evenly
+    to the connected pieces below it. A piece's capacity is its footprint
+    times the strength, scaled by its remaining health, and the most
+    overloaded piece fails. Pieces with nothing below them (cantilevers)
+    keep their load, and foundations are treated as ground.
+
+    Damage marks the pieces it touches; each frame the solver recomputes
+    only the loads below marked pieces, building by building, until its
+    time budget is spent.
+    """
+
+    def __init__(
+        self,
+        strength=STRUCTURAL_STRENGTH,
+        level_tolerance=STRUCTURAL_LEVEL_TOLERANCE,
+        budget_ms=STRUCTURAL_FRAME_BUDGET_MS,
+        clock=time.perf_counter,
+    ):
+        """Initialize the solver.
+
+        Args:
+            strength: Load a piece carries per unit of footprint area
+            level_tolerance: Height difference before a neighbour counts as below
+            budget_ms: Default time budget per update() call in milliseconds
+            clock: Function returning the current time in seconds
+        """
+        self.strength = strength
+        self.level_tolerance = level_tolerance
+        self.budget_ms = budget_ms
+        self.clock = clock
+        self._graphs = {}  # building -> SupportGraph
+        self._dirty = {}  # building -> set of changed piece names
+        self.pieces_solved = 0
+        self.pieces_failed = 0
+
+    def __len__(self):
+        return len(self._dirty)
+
+    def mark(self, building, piece_names):
+        """Queue pieces whose state changed for re-solving.
+
+        Args:
+            building: Building the pieces belong to
+            piece_names: Iterable of piece names
+        """
+        self._dirty.setdefault(building, set()).update(piece_names)
+
+    def mark_building(self, building):
+        """Rebuild a building's support graph and queue all of it.
+
+        The graph is built here, when the building is added, so per-frame
+        updates only pay for solving.
+
+        Args:
+            building: Building to solve
+        """
+        self._graphs[building] = SupportGraph(building, self.level_tolerance)
+        self.mark(building, building.piece_map)
+
+    def discard(self, building):
+        """Forget a building (e.g. one being removed).
+
+        Args:
+            building: Building to forget
+        """
+        self._dirty.pop(building, None)
+        self._graphs.pop(building, None)
+
+    def clear(self):
+        """Forget every building."""
+        self._dirty.clear()
+        self._graphs.clear()
+
+    def get_graph(self, building):
+        """Get a building's support graph, building it on first use.
+
+        Args:
+            building: Building
+
+        Returns:
+            SupportGraph
+        """
+        graph = self._graphs.get(building)
+        if graph is None:
+            graph = SupportGraph(building, self.level_tolerance)
+            self._graphs[building] = graph
+        return graph
+
+    def update(self, budget_ms=None):
+        """Re-solve marked buildings until the time budget is spent.
+
+        At least one building is solved per call so work always progresses.
+
+        Args:
+            budget_ms: Time budget in milliseconds (defaults to self.budget_ms)
+
+        Returns:
+            int: Number of pieces that failed
+        """
+        if budget_ms is None:
+            budget_ms = self.budget_ms
+
+        deadline = self.clock() + budget_ms / 1000.0
+        failed = 0
+        solved = 0
+        while self._dirty:
+            if solved and self.clock() >= deadline:
+                break
+            building = next(iter(self._dirty))
+            names = self._dirty.pop(building)
+            if self.solve(building, names):
+                failed += 1
+            solved += 1
+        return failed
+
+    def flush(self):
+        """Solve every marked building regardless of budget.
+
+        Returns:
+            int: Number of pieces that failed
+        """
+        return self.update(budget_ms=float("inf"))
+
+    def compute_capacities(self, graph):
+        """Get how much load each piece of a graph can carry.
+
+        Args:
+            graph: SupportGraph
+
+        Returns:
+            (n,) array; foundations have infinite capacity
+        """
+        capacities = self.strength * graph.footprints * graph.health
+        return np.where(graph.foundation, np.inf, capacities)
+
+    def solve(self, building, piece_names):
+        """Recompute loads below changed pieces and fail the worst overload.
+
+        Args:
+            building: Building the pieces belong to
+            piece_names: Names of pieces whose state changed
+
+        Returns:
+            bool: True if a piece failed
+        """
+        graph = self.get_graph(building)
+        indices = [graph.index[name] for name in piece_names if name in graph.index]
+        if not indices:
+            return False
+
+        graph.refresh(indices)
+        affected = graph.affected_by(indices)
+        loads = graph.solve(affected)
+        self.pieces_solved += int(affected.sum())
+
+        capacities = self.compute_capacities(graph)
+        candidates = affected & graph.standing & ~graph.foundation
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(candidates, loads / capacities, 0.0)
+        worst = int(np.argmax(ratios)) if len(ratios) else 0
+        if not len(ratios) or ratios[worst] <= 1.0:
+            return False
+
+        piece = graph.pieces[worst]
+        self.pieces_failed += 1
+        # Destroying it marks its neighbours again, so failures cascade
+        building.damage_piece(piece.name, piece.health + 1.0)
+        return True
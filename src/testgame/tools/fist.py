@@ -40,10 +40,7 @@ class FistTool(Tool):
             )
 
             if physics_hit["hit"]:
-                hit_pos = physics_hit["position"]
-                damaged = self.world.damage_building_at_position(
-                    hit_pos, damage=self.damage_per_hit
-                )
+                damaged = self.world.damage_at_hit(physics_hit, damage=self.damage_per_hit)
 
                 if damaged:
                     print(
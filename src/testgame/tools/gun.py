@@ -66,8 +66,8 @@ class GunTool(Tool):
             if physics_hit["hit"]:
                 end_pos = physics_hit["position"]
                 hit_something = True
-                damaged = self.world.damage_building_at_position(
-                    end_pos, damage=self.damage_per_shot
+                damaged = self.world.damage_at_hit(
+                    physics_hit, damage=self.damage_per_shot
                 )
                 print(f"Gun HIT building at distance {physics_hit['distance']:.2f}")
         elif hit_info and hit_info.get("position"):
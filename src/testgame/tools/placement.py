@@ -693,14 +693,15 @@ class PlacementTool(Tool):
                 name=f"{building_type_name}_{building_count}",
             )
 
-            # Add building to world
-            self.world.add_building(new_building)
-
-            # Rotate building to match preview
+            # Rotate building to match preview (before adding, so the world
+            # indexes the final piece transforms)
             self._apply_rotation_to_building_instance(
                 new_building, self.current_rotation_deg, self.ghost_position
             )
 
+            # Add building to world
+            self.world.add_building(new_building)
+
             print(
                 f"Placed building at {self.ghost_position} (size: {self.building_width}x{self.building_depth}x{self.building_height})"
             )
@@ -9,17 +9,19 @@ from testgame.tools.base import ToolType
 class HUD:
     """Manages the in-game heads-up display."""
 
-    def __init__(self, aspect2d, render=None):
+    def __init__(self, aspect2d, render=None, raycast_service=None):
         """Initialize HUD.
 
         Args:
             aspect2d: Panda3D aspect2d node for 2D overlay
             render: Panda3D render node (optional, for minimap)
+            raycast_service: RaycastService (optional, for raycast cache stats)
         """
         self.visible = True
         self.elements = []
         self.aspect2d = aspect2d
         self.render = render
+        self.raycast_service = raycast_service
 
         # Health bar (bottom-left)
         self.health_bar_bg = self._create_bar(
@@ -157,6 +159,17 @@ class HUD:
         self.fps_update_timer = 0.0
         self.fps_update_interval = 0.5  # Update every 0.5 seconds
 
+        # Raycast cache counters (below FPS)
+        self.raycast_text = OnscreenText(
+            text="",
+            pos=(-1.3, 0.85),
+            scale=0.035,
+            fg=(0.7, 0.9, 0.7, 1),
+            align=TextNode.ALeft,
+            mayChange=True,
+        )
+        self._last_raycast_stats = None
+
     def _create_bar(self, x, y, width, height, color):
         """Create a colored rectangular bar.
 
@@ -206,6 +219,7 @@ class HUD:
             self.fps_update_timer += dt
             if self.fps_update_timer >= self.fps_update_interval:
                 self.fps_text.setText(f"FPS: {int(fps)}")
+                self.update_raycast_stats()
                 self.fps_update_timer = 0.0
 
         # Update compass
@@ -216,6 +230,18 @@ class HUD:
         # if player_pos is not None:
         #     self.update_minimap(player_pos)
 
+    def update_raycast_stats(self):
+        """Show raycast cache hits/misses since the previous refresh."""
+        if not self.raycast_service:
+            return
+
+        stats = self.raycast_service.get_stats()
+        last = self._last_raycast_stats or {"cache_hits": 0, "cache_misses": 0}
+        hits = stats["cache_hits"] - last["cache_hits"]
+        misses = stats["cache_misses"] - last["cache_misses"]
+        self._last_raycast_stats = stats
+        self.raycast_text.setText(f"Rays: {misses} cast, {hits} cached")
+
     def set_tool_name(self, tool_name):
         """Update tool display.
 
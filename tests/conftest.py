@@ -0,0 +1,34 @@
+"""Shared fixtures for headless world tests."""
+
+import pytest
+from panda3d.bullet import BulletWorld
+from panda3d.core import NodePath, Vec3
+
+from testgame.engine.world import World
+from testgame.structures.simple_building import SimpleBuilding
+
+
+@pytest.fixture
+def make_world():
+    """Factory for headless worlds without generated content."""
+
+    def make():
+        return World(NodePath("render"), BulletWorld(), auto_generate=False)
+
+    return make
+
+
+@pytest.fixture
+def world(make_world):
+    """A headless world without generated content."""
+    return make_world()
+
+
+@pytest.fixture
+def house(world):
+    """A SimpleBuilding named "house" at the origin, added to the world."""
+    building = SimpleBuilding(
+        world.bullet_world, world.render, Vec3(0, 0, 0), name="house"
+    )
+    world.add_building(building)
+    return building
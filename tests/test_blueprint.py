@@ -0,0 +1,115 @@
+"""Tests for cached building blueprints and blueprint-relative saves."""
+
+import json
+
+from panda3d.core import Vec3
+
+from testgame.engine.world_serializer import WorldSerializer
+from testgame.structures.blueprint import get_blueprint
+from testgame.structures.japanese_building import JapaneseBuilding
+from testgame.structures.simple_building import SimpleBuilding
+
+
+def test_blueprints_are_cached_per_size(world):
+    """Test that buildings of one class and size share a blueprint."""
+    a = SimpleBuilding(world.bullet_world, world.render, Vec3(0, 0, 0), name="a")
+    b = SimpleBuilding(world.bullet_world, world.render, Vec3(40, 0, 0), name="b")
+    c = SimpleBuilding(
+        world.bullet_world, world.render, Vec3(80, 0, 0), 12, 10, 8, name="c"
+    )
+
+    assert a.blueprint is b.blueprint
+    assert a.blueprint is get_blueprint(SimpleBuilding, 10, 10, 8)
+    assert c.blueprint is not a.blueprint
+    assert len(a.pieces) == len(a.blueprint.pieces)
+    assert b.piece_map["b_wall_back"].body_np.getPos() == Vec3(40, 5, 4)
+    print("✓ Blueprints cached by class and dimensions")
+
+
+def test_japanese_blueprint_builds_roof_tiers(world):
+    """Test that curved roof specs become CurvedRoofPieces."""
+    building = JapaneseBuilding(world.bullet_world, world.render, Vec3(0, 0, 0))
+
+    roof = building.piece_map["japanese_building_roof_upper"]
+    assert roof.tier == 3
+    assert roof.curve_amount == 1.0
+    assert "japanese_building_roof_middle" in building.adjacency[roof.name]
+    print("✓ Japanese blueprint builds curved roofs")
+
+
+def test_save_stores_only_blueprint_differences(world, make_world):
+    """Test that saves list removed and changed pieces and load them back."""
+    building = SimpleBuilding(world.bullet_world, world.render, Vec3(0, 0, 0))
+    world.add_building(building)
+    building.damage_piece("simple_building_wall_left", 30, create_chunks=False)
+    building.damage_piece("simple_building_wall_back", 1000, create_chunks=False)
+
+    serializer = WorldSerializer()
+    data = json.loads(json.dumps(serializer._serialize_buildings(world.buildings)))
+    saved = data[0]
+    assert saved["blueprint"] == "SimpleBuilding:10x10x8"
+    assert saved["removed"] == ["wall_back"]
+    assert [p["name"] for p in saved["pieces"]] == ["simple_building_wall_left"]
+
+    loaded_world = make_world()
+    serializer._deserialize_buildings(data, loaded_world)
+    loaded = loaded_world.buildings[0]
+    assert "simple_building_wall_back" not in loaded.piece_map
+    assert len(loaded.pieces) == len(building.blueprint.pieces) - 1
+    assert loaded.piece_map["simple_building_wall_left"].health == 70
+    print("✓ Save stores blueprint differences only")
+
+
+def test_chunk_max_health_survives_save(world, make_world):
+    """Test that a weaker debris chunk keeps its own max health after loading."""
+    from panda3d.core import Vec4
+
+    from testgame.structures.building import BuildingPiece
+
+    building = SimpleBuilding(world.bullet_world, world.render, Vec3(0, 0, 0))
+    world.add_building(building)
+    chunk = BuildingPiece(
+        world.bullet_world, world.render, Vec3(20, 0, 1), Vec3(1, 1, 1), 5.0,
+        Vec4(0.5, 0.5, 0.5, 1), "simple_building_wall_left_chunk_0", "wall",
+        building,
+    )
+    chunk.health = chunk.max_health = 40.0
+    building.add_piece(chunk)
+
+    serializer = WorldSerializer()
+    data = json.loads(json.dumps(serializer._serialize_buildings(world.buildings)))
+    loaded_world = make_world()
+    serializer._deserialize_buildings(data, loaded_world)
+
+    loaded = loaded_world.buildings[0]
+    restored = loaded.piece_map[chunk.name]
+    assert restored.max_health == 40.0 and restored.health == 40.0
+    assert restored in loaded._batched  # Undamaged, so still batched
+    print("✓ Chunk max health survives save and load")
+
+
+def test_rotated_building_saves_no_pieces(world, make_world):
+    """Test that an undamaged placed building at a heading saves as a blueprint."""
+    from testgame.tools.placement import PlacementTool
+
+    building = SimpleBuilding(world.bullet_world, world.render, Vec3(20, 10, 0))
+    # Turn it the way the placement tool does for a placed building
+    PlacementTool._apply_rotation_to_building_instance(
+        None, building, 30.0, building.position
+    )
+    world.add_building(building)
+
+    serializer = WorldSerializer()
+    data = json.loads(json.dumps(serializer._serialize_buildings(world.buildings)))
+    assert data[0]["pieces"] == []
+    assert data[0]["removed"] == []
+
+    loaded_world = make_world()
+    serializer._deserialize_buildings(data, loaded_world)
+    loaded = loaded_world.buildings[0]
+    for piece in building.pieces:
+        restored = loaded.piece_map[piece.name].body_np
+        assert restored.getPos().almostEqual(piece.body_np.getPos(), 1e-4)
+        assert restored.getQuat().almostSameDirection(piece.body_np.getQuat(), 1e-4)
+    assert serializer._serialize_buildings(loaded_world.buildings)[0]["pieces"] == []
+    print("✓ Rotated building saves only its blueprint")
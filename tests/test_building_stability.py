@@ -0,0 +1,97 @@
+"""Tests for the connectivity-graph stability check."""
+
+from panda3d.bullet import BulletWorld
+from panda3d.core import NodePath, Vec3, Vec4
+
+from testgame.structures.building import Building, BuildingPiece
+
+
+def make_tower(levels=5):
+    """Create a column of stacked blocks on a foundation."""
+    world = BulletWorld()
+    render = NodePath("render")
+    building = Building(world, render, Vec3(0, 0, 0), name="tower")
+    color = Vec4(0.5, 0.5, 0.5, 1)
+
+    names = []
+    for i in range(levels):
+        piece_type = "foundation" if i == 0 else "wall"
+        name = f"tower_{i}"
+        building.add_piece(
+            BuildingPiece(
+                world, render, Vec3(0, 0, i * 2 + 1), Vec3(2, 2, 2), 100, color,
+                name, piece_type, building,
+            )
+        )
+        if names:
+            building.connect_pieces(names[-1], name)
+        names.append(name)
+    return building, names
+
+
+def test_intact_tower_is_supported():
+    """Test that every connected piece reaches the foundation."""
+    building, _ = make_tower()
+
+    assert building.find_unsupported_pieces() == []
+    print("✓ Intact tower fully supported")
+
+
+def test_only_disconnected_pieces_collapse():
+    """Test that destroying a middle block drops only the blocks above it."""
+    building, names = make_tower()
+
+    building.damage_piece(names[2], 10000, create_chunks=False)
+
+    def is_dynamic(name):
+        return building.piece_map[name].body_np.node().getMass() > 0
+
+    assert not is_dynamic(names[0]) and not is_dynamic(names[1])
+    assert is_dynamic(names[3]) and is_dynamic(names[4])
+    assert names[2] not in building.adjacency
+    assert names[2] not in building.adjacency[names[1]]
+    print("✓ Only unreachable pieces collapse")
+
+
+def test_area_damage_runs_one_stability_pass(monkeypatch):
+    """Test that a blast destroying several pieces checks stability once."""
+    building, names = make_tower()
+    calls = []
+    original = building.check_stability
+    monkeypatch.setattr(
+        building, "check_stability", lambda: calls.append(1) or original()
+    )
+
+    destroyed = building.damage_pieces(
+        {names[1]: 10000, names[2]: 10000, names[3]: 10}, max_chunked=1
+    )
+
+    assert destroyed == [names[1], names[2]] or destroyed == [names[2], names[1]]
+    assert len(calls) == 1
+    # Only one destroyed piece was allowed to break into chunks
+    chunks = [name for name in building.piece_map if "_chunk_" in name]
+    assert chunks and all(name.startswith(destroyed[0]) for name in chunks)
+    assert building.piece_map[names[3]].body_np.node().getMass() > 0
+    print("✓ Area damage settles with a single stability pass")
+
+
+def test_broken_constraints_update_graph_and_release_component():
+    """Test that a constraint Bullet breaks is dropped and its component re-checked."""
+    building, names = make_tower()
+    building.world.setGravity(0, 0, -9.81)
+    middle = building.piece_map[names[3]]
+    for info in middle.constraints:
+        info["constraint"].setBreakingThreshold(0.5)
+
+    building.release_piece(middle)
+    for _ in range(30):
+        building.world.doPhysics(1 / 60.0)
+
+    assert building.process_broken_constraints() == 2
+    assert building.adjacency[middle.name] == set()
+    assert middle.constraints == []
+    # The top block lost its only path down; the lower blocks are untouched
+    assert building.piece_map[names[4]].body_np.node().getMass() > 0
+    assert building.piece_map[names[2]].body_np.node().getMass() == 0
+    assert building.process_broken_constraints() == 0
+    print("✓ Broken constraints update the graph")
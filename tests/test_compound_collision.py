@@ -0,0 +1,83 @@
+"""Tests for the shared compound collision body of intact buildings."""
+
+from panda3d.core import Vec3
+
+from testgame.engine.body_registry import get_body_owner
+from testgame.interaction.building_raycast import BuildingRaycaster
+
+
+def test_intact_building_uses_one_body(world, house):
+    """Test that intact pieces collapse into a single static body."""
+    assert len(house.compound) == len(house.pieces)
+    assert world.bullet_world.getNumRigidBodies() == 1
+    print("✓ Intact building shares one body")
+
+
+def test_ray_resolves_compound_child_to_piece(world, house):
+    """Test that a hit on the compound damages the piece behind the child."""
+    wall = house.piece_map["house_wall_back"]
+    raycaster = BuildingRaycaster(world.bullet_world, world.render)
+
+    target = wall.body_np.getPos()
+    hit = raycaster.raycast(target + Vec3(0, 20, 0), target)
+    assert get_body_owner(hit["node"]) is house.compound
+    assert house.compound.piece_for_child(hit["shape_index"]) is wall
+
+    health = wall.health
+    assert world.damage_at_hit(hit, damage=10)
+    assert wall.health == health - 10
+    assert wall in house.compound
+    print("✓ Compound child resolves to its piece")
+
+
+def test_heavy_damage_peels_piece(world, house):
+    """Test that damage past the threshold gives a piece its own body back."""
+    wall = house.piece_map["house_wall_left"]
+    other = house.piece_map["house_wall_right"]
+
+    house.damage_piece(wall.name, wall.max_health * 0.6, create_chunks=False)
+    assert wall not in house.compound
+    assert world.bullet_world.getNumRigidBodies() == 2
+
+    # Remaining children still map to the right pieces after the swap-remove
+    for index in range(house.compound.body_np.node().getNumShapes()):
+        assert house.compound.piece_for_child(index) is not wall
+    raycaster = BuildingRaycaster(world.bullet_world, world.render)
+    target = other.body_np.getPos()
+    hit = raycaster.raycast(target + Vec3(20, 0, 0), target)
+    assert house.compound.piece_for_child(hit["shape_index"]) is other
+
+    house.destroy()
+    assert world.bullet_world.getNumRigidBodies() == 0
+    print("✓ Damaged piece peeled out of the compound")
+
+
+class CountingWorld:
+    """BulletWorld wrapper that counts rigid body attaches."""
+
+    def __init__(self, world):
+        self.world = world
+        self.attached = []
+
+    def attachRigidBody(self, node):
+        self.attached.append(node.getName())
+        self.world.attachRigidBody(node)
+
+    def __getattr__(self, name):
+        return getattr(self.world, name)
+
+
+def test_compound_attaches_once_per_add(house):
+    """Test that adding a building's pieces inserts the compound only once."""
+    from testgame.structures.compound_collision import CompoundCollision
+
+    pieces = list(house.compound._shapes)
+    house.compound.destroy()
+
+    world = CountingWorld(house.world)
+    compound = CompoundCollision(world, house.render, "batch_collision")
+    compound.add(pieces)
+
+    assert world.attached == ["batch_collision"]
+    assert len(compound) == len(pieces)
+    print("✓ Compound attaches once for a batch of pieces")
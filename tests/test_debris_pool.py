@@ -0,0 +1,176 @@
+"""Tests for the world-wide debris pool."""
+
+from panda3d.bullet import BulletWorld
+from panda3d.core import NodePath, Point3, Vec3, Vec4
+
+from testgame.structures.debris_pool import DebrisPool
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_pool(**kwargs):
+    """Create a pool on an empty physics world."""
+    clock = FakeClock()
+    world = BulletWorld()
+    pool = DebrisPool(world, NodePath("render"), clock=clock, **kwargs)
+    return pool, world, clock
+
+
+def spawn(pool, x=0.0):
+    """Spawn a fragment at a given x position."""
+    return pool.spawn_fragment(
+        Vec3(x, 0, 5), Vec3(0.5, 0.5, 0.5), Vec4(1, 1, 1, 1), Vec3(0, 0, 1)
+    )
+
+
+def test_fragments_reach_steady_state():
+    """Test that repeated spawning reuses prewarmed bodies under the cap."""
+    pool, world, _ = make_pool(max_fragments=8, prewarm=8)
+
+    first = [spawn(pool, i) for i in range(8)]
+    more = [spawn(pool, i) for i in range(40)]
+
+    assert pool.fragments_created == 8
+    assert world.getNumRigidBodies() == 8
+    assert set(more) <= set(first)
+    print("✓ Fragment allocation reaches steady state")
+
+
+def test_expiry_parks_fragments():
+    """Test that expired fragments leave the world and return to the pool."""
+    pool, world, clock = make_pool(prewarm=4)
+    fragment = spawn(pool)
+
+    clock.now += fragment.lifetime / 2
+    assert pool.update() == 0
+    clock.now += fragment.lifetime
+    assert pool.update() == 1
+
+    assert world.getNumRigidBodies() == 0
+    assert pool.get_stats()["free_fragments"] == 4
+    print("✓ Expired fragments are parked")
+
+
+def test_memory_budget_recycles_oldest():
+    """Test that the byte budget recycles the oldest fragment first."""
+    from testgame.config.destruction_config import DEBRIS_FRAGMENT_BYTES
+
+    pool, _, _ = make_pool(memory_budget=DEBRIS_FRAGMENT_BYTES * 3, prewarm=0)
+    oldest = spawn(pool, 0)
+    spawn(pool, 1)
+    spawn(pool, 2)
+    spawn(pool, 3)
+
+    assert pool.get_stats()["fragments"] == 3
+    assert not oldest.is_active or oldest.body_np.getX() == 3
+    assert pool.fragments_created == 3
+    print("✓ Memory budget recycles the oldest debris")
+
+
+def test_resting_fragments_merge_into_static_area():
+    """Test that resting fragments become one static body and one batch."""
+    from testgame.config.destruction_config import DEBRIS_SETTLE_FRAMES
+
+    pool, world, clock = make_pool(prewarm=4)
+    for i in range(3):
+        pool.spawn_fragment(Vec3(i, 0, 0.25), Vec3(0.5, 0.5, 0.5), Vec4(1, 0, 0, 1))
+
+    for _ in range(DEBRIS_SETTLE_FRAMES):
+        pool.update()
+
+    assert pool.get_stats()["fragments"] == 0
+    assert len(pool.settled) == 3
+    assert world.getNumRigidBodies() == 1
+    assert world.getRigidBody(0).getMass() == 0
+    assert world.getRigidBody(0).getNumShapes() == 3
+
+    cell = next(iter(pool.settled._cells.values()))
+    assert cell.visual_np.findAllMatches("**/+GeomNode").getNumPaths() == 1
+
+    # Settled debris still disappears when its lifetime runs out
+    clock.now += 60
+    pool.update()
+    assert len(pool.settled) == 0
+    assert world.getNumRigidBodies() == 0
+    print("✓ Resting fragments merge into static debris")
+
+
+def test_every_settled_box_in_a_cell_collides():
+    """Test that boxes added to an existing cell get broadphase bounds."""
+    pool, world, clock = make_pool(prewarm=0)
+    size = Vec3(1, 1, 1)
+    color = Vec4(1, 1, 1, 1)
+    pool.settled.add(Vec3(1, 1, 0.5), Vec3(0, 0, 0), size, color, clock.now + 60)
+    pool.settled.update(clock.now)
+    pool.settled.add(Vec3(10, 10, 0.5), Vec3(0, 0, 0), size, color, clock.now + 60)
+    pool.settled.update(clock.now)
+
+    assert len(pool.settled._cells) == 1
+    for x, y in ((1, 1), (10, 10)):
+        hit = world.rayTestClosest(Point3(x, y, 10), Point3(x, y, -10))
+        assert hit.hasHit()
+        assert abs(hit.getHitPos().z - 1.0) < 1e-4
+    print("✓ Every settled box in a cell collides")
+
+
+def test_resting_chunks_are_baked_and_removed():
+    """Test that a resting chunk joins the settled field and loses its body."""
+    from testgame.config.destruction_config import DEBRIS_SETTLE_FRAMES
+    from testgame.structures.building import Building, BuildingPiece
+
+    pool, world, _ = make_pool(prewarm=0)
+    building = Building(world, pool.render, Vec3(0, 0, 0), name="ruin")
+    building.debris_pool = pool
+    chunk = BuildingPiece(
+        world, pool.render, Vec3(0, 0, 1), Vec3(1, 1, 1), 5.0,
+        Vec4(0.5, 0.5, 0.5, 1), "ruin_chunk", "wall", building,
+    )
+    building.add_piece(chunk)
+    building.release_piece(chunk)
+    pool.track_chunk(chunk)
+
+    for _ in range(DEBRIS_SETTLE_FRAMES):
+        pool.update()
+
+    assert pool.get_stats()["chunks"] == 0
+    assert "ruin_chunk" not in building.piece_map
+    assert chunk.body_np.isEmpty()
+    assert len(pool.settled) == 1
+    assert world.getNumRigidBodies() == 1  # Just the settled area
+    print("✓ Resting chunks are baked into static debris")
+
+
+def test_instanced_renderer_packs_fragment_transforms():
+    """Test that live fragments are packed into the instance buffer."""
+    import numpy as np
+
+    from testgame.rendering.instanced_debris import InstancedDebrisRenderer
+
+    pool, _, _ = make_pool(prewarm=4)
+    renderer = InstancedDebrisRenderer(pool.render, max_instances=8)
+    pool.set_renderer(renderer)
+
+    fragment = pool.spawn_fragment(
+        Vec3(1, 2, 3), Vec3(0.5, 1, 2), Vec4(0.2, 0.4, 0.6, 1)
+    )
+    pool.update()
+
+    assert renderer.instance_count == 1
+    assert fragment.geom_np.isHidden()
+    ram = np.frombuffer(memoryview(renderer.buffer.getRamImage()), np.float32)
+    instance = ram[:20].reshape(5, 4)
+    assert np.allclose(np.diag(instance[:3, :3]), [0.5, 1, 2])
+    assert np.allclose(instance[3, :3], [1, 2, 3])
+    assert np.allclose(instance[4], [0.2, 0.4, 0.6, 1])
+
+    pool.set_renderer(None)
+    assert not fragment.geom_np.isHidden()
+    print("✓ Instance buffer holds fragment transforms and colors")
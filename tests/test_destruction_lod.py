@@ -0,0 +1,61 @@
+"""Tests for distance-based destruction detail."""
+
+from panda3d.core import Vec3
+
+from testgame.structures.destruction_lod import (
+    LOD_EFFECT,
+    LOD_FULL,
+    LOD_REDUCED,
+    DestructionLOD,
+)
+from testgame.structures.prefracture import coarsen_layout, compute_fracture_layout
+
+
+def test_level_follows_distance_and_load():
+    """Test that distance picks the level and debris load pulls thresholds in."""
+    lod = DestructionLOD(full_distance=20, effect_distance=50, load_weight=1.0)
+    assert lod.select(Vec3(500, 0, 0)) == LOD_FULL  # No viewer yet
+
+    lod.set_viewer(Vec3(0, 0, 0))
+    assert lod.select(Vec3(10, 0, 0)) == LOD_FULL
+    assert lod.select(Vec3(30, 0, 0)) == LOD_REDUCED
+    assert lod.select(Vec3(90, 0, 0)) == LOD_EFFECT
+    # A full debris pool halves both distances
+    assert lod.select(Vec3(15, 0, 0), debris_load=1.0) == LOD_REDUCED
+    assert lod.select(Vec3(30, 0, 0), debris_load=1.0) == LOD_EFFECT
+    print("✓ LOD level follows distance and load")
+
+
+def test_coarsened_layout_covers_the_piece():
+    """Test that merged chunks are fewer, larger and span the same axis."""
+    layout = compute_fracture_layout((12.0, 0.5, 8.0), seed=3)
+    coarse = coarsen_layout(layout, 2)
+
+    assert len(coarse.chunks) == 2
+    assert coarse.split_axis == layout.split_axis
+    total = sum(chunk.size[0] for chunk in layout.chunks)
+    assert abs(sum(chunk.size[0] for chunk in coarse.chunks) - total) < 1e-9
+    assert coarse.chunks[0].offset[0] < 0 < coarse.chunks[1].offset[0]
+    assert coarsen_layout(coarse, 2) is coarse
+    print("✓ Coarsened layout keeps the piece's extent")
+
+
+def test_distant_destruction_spawns_less_debris(world, house):
+    """Test that far walls get few chunks and very far walls only an effect."""
+    effects = []
+    world.destruction_lod.effect_callback = lambda pos, size, color: effects.append(pos)
+
+    world.destruction_lod.set_viewer(Vec3(0, 40, 4))  # Reduced range of the back wall
+    house.damage_piece("house_wall_back", 1000, create_fragments=True)
+    world.destruction_scheduler.flush()
+    chunks = [p for p in house.pieces if "_chunk_" in p.name]
+    assert 1 <= len(chunks) <= 2
+    assert world.debris_pool.get_stats()["fragments"] == 0
+
+    world.destruction_lod.set_viewer(Vec3(500, 0, 0))
+    house.damage_piece("house_wall_left", 1000, create_fragments=True)
+    world.destruction_scheduler.flush()
+    assert not any(p.name.startswith("house_wall_left_chunk") for p in house.pieces)
+    assert len(effects) == 1
+    world.prefracturer.shutdown()
+    print("✓ Distant destruction is cheaper")
@@ -0,0 +1,37 @@
+"""Tests for seeded, replayable destruction."""
+
+from testgame.engine.destruction_replay import Blast, PieceHit, run_destruction_replay
+from testgame.structures.japanese_building import JapaneseBuilding
+from testgame.structures.simple_building import SimpleBuilding
+
+BUILDINGS = [
+    (SimpleBuilding, (0, 0, 0), "house"),
+    (JapaneseBuilding, (30, 0, 0), "temple"),
+]
+SCRIPT = [
+    PieceHit(0, "house_wall_back", 1000),
+    PieceHit(5, "house_wall_left", 1000),
+    Blast(10, (30, 0, 3), 6.0, 400),
+    PieceHit(20, "house_roof", 1000),
+]
+
+
+def test_same_seed_replays_identically():
+    """Test that a damage script replays with identical pieces and debris."""
+    first = run_destruction_replay(BUILDINGS, SCRIPT, seed=1234, frames=60)
+    second = run_destruction_replay(BUILDINGS, SCRIPT, seed=1234, frames=60)
+
+    assert any("_chunk_" in piece[0] for piece in first.pieces)
+    assert first.debris["fragments_created"] > 0
+    assert first.pieces == second.pieces
+    assert first.debris == second.debris
+    print("✓ Seeded destruction replays identically")
+
+
+def test_different_seed_breaks_differently():
+    """Test that the seed, not fixed values, drives the destruction."""
+    first = run_destruction_replay(BUILDINGS, SCRIPT, seed=1, frames=30)
+    second = run_destruction_replay(BUILDINGS, SCRIPT, seed=2, frames=30)
+
+    assert first.pieces != second.pieces
+    print("✓ Different seeds give different debris")
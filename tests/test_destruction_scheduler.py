@@ -0,0 +1,53 @@
+"""Tests for frame-budgeted destruction."""
+
+from testgame.structures.destruction_scheduler import DestructionScheduler
+
+
+class StepClock:
+    """Clock that advances one millisecond per reading."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 0.001
+        return self.now
+
+
+def test_process_respects_budget():
+    """Test that a call stops once the budget is spent but always progresses."""
+    scheduler = DestructionScheduler(budget_ms=3.0, clock=StepClock())
+    ran = []
+    for i in range(10):
+        scheduler.schedule(None, ran.append, i)
+
+    assert scheduler.process() == 3
+    assert scheduler.process(budget_ms=0) == 1
+    assert scheduler.flush() == 6
+    assert ran == list(range(10))
+    print("✓ Scheduler stays within its budget")
+
+
+def test_destroyed_piece_spawns_debris_later(world, house):
+    """Test that destruction is immediate but chunk spawning is deferred."""
+    wall = house.piece_map["house_wall_back"]
+
+    assert house.damage_piece(wall.name, 10000)
+    assert wall.body_np.isEmpty()
+    assert not any("_chunk_" in name for name in house.piece_map)
+    assert len(world.destruction_scheduler) == 1
+
+    world.destruction_scheduler.flush()
+    chunks = [p for name, p in house.piece_map.items() if "_chunk_" in name]
+    assert chunks
+    assert all(chunk.body_np.node().getMass() > 0 for chunk in chunks)
+    print("✓ Debris spawns on a later frame and falls")
+
+
+def test_destroying_building_drops_pending_debris(world, house):
+    """Test that removing a building discards its queued work."""
+    house.damage_piece("house_wall_back", 10000)
+    house.destroy()
+
+    assert len(world.destruction_scheduler) == 0
+    print("✓ Pending debris discarded with its building")
@@ -0,0 +1,72 @@
+"""Tests for shared box and roof geometry."""
+
+from panda3d.core import NodePath, Vec3, Vec4
+
+from testgame.rendering.geometry_cache import (
+    attach_box,
+    get_curved_roof_geom,
+    get_unit_box_geom,
+)
+
+
+def test_boxes_share_one_geom():
+    """Test that boxes instance the same Geom with their own scale and colour."""
+    root = NodePath("root")
+    small = attach_box(root, Vec3(1, 2, 3), Vec4(1, 0, 0, 1))
+    large = attach_box(root, Vec3(10, 0.5, 4), Vec4(0, 1, 0, 1))
+
+    assert small.node().getGeom(0) == large.node().getGeom(0)
+    assert small.node().getGeom(0) == get_unit_box_geom()
+    assert get_unit_box_geom().getVertexData().getNumRows() == 36
+
+    bounds_min, bounds_max = large.getTightBounds()
+    assert (bounds_max - bounds_min).almostEqual(Vec3(10, 0.5, 4), 1e-4)
+    assert small.getColor() == Vec4(1, 0, 0, 1)
+    print("✓ Boxes share geometry")
+
+
+def test_damage_sets_shader_input_without_touching_geometry():
+    """Test that damage tint is a per-node input on the shared geometry."""
+    from panda3d.bullet import BulletWorld
+
+    from testgame.structures.building import BuildingPiece
+
+    piece = BuildingPiece(
+        BulletWorld(), NodePath("render"), Vec3(0, 0, 0), Vec3(4, 0.5, 3), 100,
+        Vec4(0.8, 0.3, 0.2, 1), "wall",
+    )
+    piece.take_damage(25)
+
+    assert piece.geom_np.getShaderInput("damage").getVector().x == 0.25
+    assert piece.geom_np.node().getGeom(0) == get_unit_box_geom()
+    print("✓ Damage tint leaves geometry shared")
+
+
+def test_identical_roofs_share_one_geom():
+    """Test that same-shaped roofs across buildings reuse one tessellation."""
+    from panda3d.bullet import BulletWorld
+    from panda3d.core import GeomNode
+
+    from testgame.structures.japanese_building import JapaneseBuilding
+
+    world = BulletWorld()
+    render = NodePath("render")
+    a = JapaneseBuilding(world, render, Vec3(0, 0, 0), name="a")
+    b = JapaneseBuilding(world, render, Vec3(30, 0, 0), name="b")
+
+    def roof_geom(building, tier):
+        roof = building.piece_map[f"{building.name}_roof_{tier}"]
+        return roof.body_np.find(f"**/{roof.name}_geom").node().getGeom(0)
+
+    assert roof_geom(a, "main") == roof_geom(b, "main")
+    assert roof_geom(a, "upper") == roof_geom(b, "upper")
+    assert roof_geom(a, "main") != roof_geom(a, "upper")
+
+    geom = get_curved_roof_geom(Vec3(6, 5, 0.3), 1.0)
+    assert geom == roof_geom(a, "upper")
+    roof_np = NodePath(GeomNode("roof"))
+    roof_np.node().addGeom(geom)
+    bounds_min, bounds_max = roof_np.getTightBounds()
+    assert abs(bounds_min.z + 0.15) < 1e-5  # Flat underside
+    assert abs(bounds_max.z - (0.15 + 0.15 * 4.5)) < 1e-5  # Curved-up corners
+    print("✓ Identical roofs share geometry")
@@ -0,0 +1,111 @@
+"""Tests for the heightfield terrain raycaster."""
+
+import random
+
+import numpy as np
+from panda3d.core import Vec3
+
+from testgame.interaction.heightfield_raycast import (
+    HeightfieldRaycaster,
+    _intersect_triangle,
+)
+
+
+class FakeChunk:
+    """Minimal stand-in for TerrainChunk with random heights."""
+
+    def __init__(self, chunk_x, chunk_z, rng, size=32, resolution=16):
+        self.size = size
+        self.resolution = resolution
+        self.world_x = chunk_x * size
+        self.world_z = chunk_z * size
+        self.height_data = rng.uniform(0.0, 6.0, (resolution + 1, resolution + 1))
+        self.node_path = f"chunk_{chunk_x}_{chunk_z}"
+
+
+class FakeTerrain:
+    """Terrain holding a 3x3 block of fake chunks with shared edges."""
+
+    def __init__(self, seed=1):
+        rng = np.random.default_rng(seed)
+        self.chunks = {}
+        for cx in range(-1, 2):
+            for cz in range(-1, 2):
+                self.chunks[(cx, cz)] = FakeChunk(cx, cz, rng)
+
+        # Make shared edge vertices match like real terrain
+        for (cx, cz), chunk in self.chunks.items():
+            if (cx - 1, cz) in self.chunks:
+                chunk.height_data[0, :] = self.chunks[(cx - 1, cz)].height_data[-1, :]
+            if (cx, cz - 1) in self.chunks:
+                chunk.height_data[:, 0] = self.chunks[(cx, cz - 1)].height_data[:, -1]
+
+
+def brute_force_distance(terrain, origin, direction, max_distance):
+    """Test every terrain triangle and return the nearest hit distance."""
+    best = None
+    o = (origin.x, origin.y, origin.z)
+    d = (direction.x, direction.y, direction.z)
+    for chunk in terrain.chunks.values():
+        spacing = chunk.size / chunk.resolution
+        h = chunk.height_data
+        for ix in range(chunk.resolution):
+            for iz in range(chunk.resolution):
+                x0 = chunk.world_x + ix * spacing
+                y0 = chunk.world_z + iz * spacing
+                v0 = (x0, y0, h[ix][iz])
+                v1 = (x0 + spacing, y0, h[ix + 1][iz])
+                v2 = (x0, y0 + spacing, h[ix][iz + 1])
+                v3 = (x0 + spacing, y0 + spacing, h[ix + 1][iz + 1])
+                for tri in ((v0, v1, v2), (v1, v3, v2)):
+                    t = _intersect_triangle(o, d, *tri)
+                    if t is not None and 0 <= t <= max_distance:
+                        if best is None or t < best:
+                            best = t
+    return best
+
+
+def test_matches_brute_force():
+    """Test that DDA traversal finds the same first hit as testing everything."""
+    terrain = FakeTerrain()
+    raycaster = HeightfieldRaycaster(None, None, terrain)
+    rng = random.Random(7)
+
+    for _ in range(25):
+        origin = Vec3(rng.uniform(-30, 60), rng.uniform(-30, 60), rng.uniform(10, 30))
+        direction = Vec3(rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-1, -0.1))
+        direction.normalize()
+
+        hit = raycaster.cast_ray(origin, direction, 200.0)
+        expected = brute_force_distance(terrain, origin, direction, 200.0)
+
+        if expected is None:
+            assert hit is None
+        else:
+            assert hit is not None
+            assert abs((hit["position"] - origin).length() - expected) < 1e-4
+            assert hit["normal"].z > 0
+
+    print("✓ Heightfield raycast matches brute force")
+
+
+def test_cast_ray_from_to_respects_segment_length():
+    """Test that cast_ray_from_to stops at the end point."""
+    terrain = FakeTerrain()
+    raycaster = HeightfieldRaycaster(None, None, terrain)
+
+    hit = raycaster.cast_ray_from_to(Vec3(5, 5, 50), Vec3(5, 5, -10))
+    assert hit is not None
+    assert hit["node"] == "chunk_0_0"
+
+    assert raycaster.cast_ray_from_to(Vec3(5, 5, 50), Vec3(5, 5, 20)) is None
+    print("✓ cast_ray_from_to implemented")
+
+
+def test_miss_outside_loaded_chunks():
+    """Test that rays over unloaded terrain report no hit."""
+    terrain = FakeTerrain()
+    raycaster = HeightfieldRaycaster(None, None, terrain)
+
+    assert raycaster.cast_ray_from_to(Vec3(500, 500, 50), Vec3(500, 500, -50)) is None
+    print("✓ Unloaded chunks are skipped")
@@ -0,0 +1,217 @@
+"""Tests for fixed-step physics, interpolation and step budgeting."""
+
+from panda3d.bullet import (
+    BulletBoxShape,
+    BulletPlaneShape,
+    BulletRigidBodyNode,
+    BulletWorld,
+)
+from panda3d.core import NodePath, Vec3
+
+from testgame.engine.physics_manager import PhysicsManager
+
+STEP = 1.0 / 60
+
+
+def make_scene(height=10.0):
+    """Create a world with a ground plane and one falling box with a visual."""
+    world = BulletWorld()
+    world.setGravity(Vec3(0, 0, -9.81))
+    render = NodePath("render")
+
+    ground = BulletRigidBodyNode("ground")
+    ground.addShape(BulletPlaneShape(Vec3(0, 0, 1), 0))
+    render.attachNewNode(ground)
+    world.attachRigidBody(ground)
+
+    box = BulletRigidBodyNode("box")
+    box.setMass(1.0)
+    box.addShape(BulletBoxShape(Vec3(0.5, 0.5, 0.5)))
+    box_np = render.attachNewNode(box)
+    box_np.setZ(height)
+    world.attachRigidBody(box)
+    visual = box_np.attachNewNode("box_visual")
+    return world, render, box_np, visual
+
+
+def test_accumulator_runs_whole_steps():
+    """Test that frame time turns into fixed steps with the remainder kept."""
+    world, _, _, _ = make_scene()
+    physics = PhysicsManager(world, step_size=STEP)
+
+    assert physics.update(STEP * 0.5) == 0
+    assert abs(physics.alpha - 0.5) < 1e-6
+    assert physics.update(STEP * 2.0) == 2
+    assert abs(physics.alpha - 0.5) < 1e-6
+    assert physics.total_steps == 2
+    print("✓ Accumulator runs fixed steps and keeps the remainder")
+
+
+def test_slow_steps_lower_the_substep_limit():
+    """Test that expensive steps cap steps per frame and drop the backlog."""
+    world, _, _, _ = make_scene()
+    now = [0.0]
+
+    def clock():
+        now[0] += 0.002  # Each step measures 2 ms
+        return now[0]
+
+    physics = PhysicsManager(world, step_size=STEP, frame_budget_ms=4.0, clock=clock)
+    physics.update(STEP)
+    assert physics.substep_limit == 2
+
+    assert physics.update(0.2) == 2  # 12 steps of frame time, only 2 afforded
+    assert physics.accumulator < STEP
+    assert physics.dropped_time > 0
+    print("✓ Substeps drop when steps run long")
+
+
+def test_visuals_are_interpolated_between_steps():
+    """Test that a tracked body's visual sits between its last two states."""
+    world, render, box_np, visual = make_scene()
+    physics = PhysicsManager(world, step_size=STEP)
+    physics.track(box_np)
+
+    physics.update(STEP * 3)
+    before = box_np.getZ()
+    physics.update(STEP * 1.5)
+    after = box_np.getZ()
+
+    assert after < before
+    assert after < visual.getZ(render) < before
+    assert visual.getPos(render).x == box_np.getX()
+
+    # Parking the body forgets it and puts the visual back on its body
+    box_np.detachNode()
+    physics.update(STEP)
+    assert physics.get_stats()["tracked_bodies"] == 0
+    assert visual.getPos() == Vec3(0, 0, 0)
+    print("✓ Visuals interpolate without moving the body")
+
+
+def test_stats_report_bodies_and_contacts():
+    """Test that stats count awake bodies and ground contacts."""
+    world, _, _, _ = make_scene(height=0.5)
+    physics = PhysicsManager(world, step_size=STEP)
+    physics.update(STEP * 5)
+
+    stats = physics.get_stats()
+    assert stats["rigid_bodies"] == 2
+    assert stats["active_bodies"] >= 1
+    assert stats["contacts"] > 0
+    assert stats["steps"] == 5 and stats["average_step_ms"] >= 0
+    print("✓ Stats report bodies, contacts and timings")
+
+
+def test_threaded_steps_publish_on_sync():
+    """Test that a threaded step lands at sync and queued changes wait for it."""
+    world, render, box_np, visual = make_scene()
+    physics = PhysicsManager(world, step_size=STEP, threaded=True)
+    physics.track(box_np)
+
+    try:
+        start = visual.getZ(render)
+        assert physics.update(STEP * 3) == 3
+
+        pushed = []
+        physics.call(pushed.append, "after step")
+        assert pushed == []  # Held until the worker is done
+
+        physics.sync()
+        assert pushed == ["after step"]
+        assert physics.total_steps == 3
+        assert box_np.getZ() < visual.getZ(render) < start  # Previous step's pose
+    finally:
+        physics.shutdown()
+    print("✓ Threaded steps publish poses and queued calls at sync")
+
+
+def test_threaded_mode_matches_inline_stepping():
+    """Test that stepping on the worker thread gives the same simulation."""
+    positions = []
+    for threaded in (False, True):
+        world, _, box_np, _ = make_scene()
+        physics = PhysicsManager(world, step_size=STEP, threaded=threaded)
+        for _ in range(30):
+            physics.update(STEP)
+        physics.shutdown()
+        positions.append(box_np.getPos())
+
+    assert positions[0] == positions[1]
+    assert positions[1].z < 10.0
+    print("✓ Threaded stepping matches inline stepping")
+
+
+def run_collapse(threaded):
+    """Destroy walls between threaded steps and return where the pieces end."""
+    from testgame.engine.world import World
+    from testgame.structures.simple_building import SimpleBuilding
+
+    world, render, _, _ = make_scene()
+    physics = PhysicsManager(world, step_size=STEP, threaded=threaded)
+    now = [0.0]
+    game_world = World(
+        render,
+        world,
+        auto_generate=False,
+        seed=5,
+        clock=lambda: now[0],
+        physics_manager=physics,
+    )
+    game_world.add_building(SimpleBuilding(world, render, Vec3(20, 0, 0), name="h"))
+
+    destroyed = 0
+    for frame in range(40):
+        # Spawn all queued debris, not as much as a wall-clock budget allows
+        game_world.destruction_scheduler.flush()
+        game_world.update(STEP)
+        physics.update(STEP)
+        now[0] += STEP
+        if frame == 3:
+            # An input handler firing while the batch is in flight
+            for name in ("h_wall_back", "h_wall_left"):
+                piece = game_world.buildings[0].piece_map[name]
+                destroyed += game_world.damage_building_at_position(
+                    piece.body_np.getPos(), damage=500
+                )
+
+    physics.shutdown()
+    positions = sorted(
+        (piece.name, tuple(piece.body_np.getPos()))
+        for building in game_world.buildings
+        for piece in building.pieces
+        if not piece.body_np.isEmpty()
+    )
+    return destroyed, positions
+
+
+def test_damage_during_threaded_step_is_deterministic():
+    """Test that destroying pieces while a batch runs matches inline stepping."""
+    inline = run_collapse(threaded=False)
+    assert inline[0] == 2
+    assert run_collapse(threaded=True) == inline
+    print("✓ Damage during a threaded step matches inline stepping")
+
+
+def test_worker_errors_reach_sync():
+    """Test that a failed step is raised by sync() instead of being hidden."""
+    world, _, _, _ = make_scene()
+    physics = PhysicsManager(world, step_size=STEP, threaded=True)
+
+    def broken_step():
+        raise RuntimeError("step failed")
+
+    physics.step = broken_step
+    physics.update(STEP)
+    pushed = []
+    physics.call(pushed.append, "queued")
+
+    try:
+        physics.sync()
+    except RuntimeError as e:
+        assert str(e) == "step failed"
+    else:
+        raise AssertionError("sync() swallowed the worker error")
+    assert pushed == ["queued"]
+    physics.shutdown()
+    print("✓ Worker errors are raised by sync()")
@@ -0,0 +1,84 @@
+"""Tests for the building piece spatial index."""
+
+import pytest
+from panda3d.core import Vec3
+
+from testgame.engine.piece_index import PieceSpatialIndex
+from testgame.structures.simple_building import SimpleBuilding
+
+
+@pytest.fixture
+def houses(world):
+    """Add two buildings to the headless world."""
+    for i in range(2):
+        building = SimpleBuilding(
+            world.bullet_world, world.render, Vec3(i * 40, 0, 0), name=f"house_{i}"
+        )
+        world.add_building(building)
+    return world.buildings
+
+
+def test_index_tracks_all_pieces(world, houses):
+    """Test that adding buildings indexes every piece."""
+    total = sum(len(b.pieces) for b in houses)
+
+    assert len(world.piece_index) == total
+    print("✓ All pieces indexed")
+
+
+def test_nearest_matches_surface_hit(world, houses):
+    """Test that a point on a wall's face resolves to that wall."""
+    building = houses[1]
+    wall = building.piece_map["house_1_wall_back"]
+
+    # Point on the outer face of the back wall
+    surface = wall.body_np.getPos() + Vec3(0, wall.size.y / 2, 0)
+    assert world.piece_index.query_nearest(surface, 1.0) is wall
+    assert world.piece_index.query_nearest(Vec3(500, 500, 0), 1.0) is None
+    print("✓ Nearest query resolves surface hits")
+
+
+def test_removed_and_moved_pieces_update(world, houses):
+    """Test incremental updates for destroyed and moving pieces."""
+    building = houses[0]
+    wall = building.piece_map["house_0_wall_back"]
+
+    building.damage_piece(wall.name, 1000, create_chunks=False)
+    assert wall not in world.piece_index
+
+    index = PieceSpatialIndex(cell_size=4.0)
+    piece = building.piece_map["house_0_wall_left"]
+    index.insert(piece)
+    piece.body_np.setPos(Vec3(200, 200, 5))
+    index.update(piece)
+    assert index.query_nearest(Vec3(200, 200, 5), 1.0) is piece
+    assert index.query_nearest(Vec3(0, 0, 5), 10.0) is None
+    print("✓ Index follows removals and moves")
+
+
+def test_damage_at_hit_resolves_hit_body(world, houses):
+    """Test that damage_at_hit damages the exact body the ray hit."""
+    from testgame.interaction.building_raycast import BuildingRaycaster
+
+    wall = houses[0].piece_map["house_0_wall_back"]
+    raycaster = BuildingRaycaster(world.bullet_world, world.render)
+
+    target = wall.body_np.getPos()
+    hit = raycaster.raycast(target + Vec3(0, 20, 0), target)
+    assert hit["hit"]
+
+    health = wall.health
+    assert world.damage_at_hit(hit, damage=10)
+    assert wall.health == health - 10
+    print("✓ Hit body resolves directly to its piece")
+
+
+def test_radius_ties_are_ordered_by_name(world, houses):
+    """Test that pieces at equal distances come back in a stable order."""
+    center = houses[0].piece_map["house_0_foundation"].body_np.getPos()
+    results = world.piece_index.query_radius(center, 8.0)
+    distances = [dist for _, dist in results]
+
+    assert len(set(distances)) < len(distances)  # The blast has ties to break
+    assert results == sorted(results, key=lambda item: (item[1], item[0].name))
+    print("✓ Radius ties ordered by name")
@@ -0,0 +1,84 @@
+"""Tests for prefractured chunk layouts."""
+
+from panda3d.core import Vec3
+
+from testgame.structures.prefracture import Prefracturer, compute_fracture_layout
+
+
+def test_layout_splits_along_longest_axis():
+    """Test that layouts are seeded and tile the piece along its longest axis."""
+    layout = compute_fracture_layout((10.0, 0.5, 8.0), seed=7)
+
+    assert layout == compute_fracture_layout((10.0, 0.5, 8.0), seed=7)
+    assert layout.split_axis == "x"
+    assert len(layout.chunks) in (3, 4)
+    for chunk in layout.chunks:
+        assert abs(chunk.offset[0]) < 5.0 and chunk.offset[1:] == (0.0, 0.0)
+        assert chunk.size[0] <= 10.0 / len(layout.chunks) * 0.9
+        assert 0.5 * 0.95 <= chunk.size[1] <= 0.5
+    print("✓ Layout splits along the longest axis")
+
+
+def test_damaged_piece_breaks_with_prepared_layout(world, house):
+    """Test that a damaged piece's layout is ready when it is destroyed."""
+    prefracturer = world.prefracturer
+    wall = house.piece_map["house_wall_back"]
+
+    house.damage_piece(wall.name, 40)
+    assert wall in prefracturer
+    expected = prefracturer._pending[wall]
+
+    house.damage_piece(wall.name, 100)
+    world.destruction_scheduler.flush()
+
+    chunks = [p for p in house.pieces if p.name.startswith("house_wall_back_chunk")]
+    assert len(chunks) == len(expected.chunks)
+    assert prefracturer.layouts_planned == 1 and prefracturer.layouts_unplanned == 0
+    assert wall not in prefracturer
+    # New chunks are queued so they can break again just as cheaply
+    assert all(chunk in prefracturer for chunk in chunks)
+    prefracturer.shutdown()
+    print("✓ Destruction uses the prefractured layout")
+
+
+class FakePiece:
+    """Piece stand-in with just a size."""
+
+    def __init__(self, x):
+        self.size = Vec3(x, 0.5, 3.0)
+
+
+def test_layouts_follow_queue_order():
+    """Test that layouts depend on when pieces were queued, not when they break."""
+    import random
+
+    pieces = [FakePiece(4.0 + i) for i in range(3)]
+    layouts = []
+    for order in (pieces, pieces[::-1]):
+        prefracturer = Prefracturer(rng=random.Random(11))
+        for piece in pieces:
+            prefracturer.request(piece)
+        layouts.append({piece: prefracturer.take(piece) for piece in order})
+
+    assert layouts[0] == layouts[1]
+    print("✓ Layouts follow queue order")
+
+
+def test_take_uses_layout_computed_on_request(monkeypatch):
+    """Test that breaking a queued piece does no layout work."""
+    import random
+
+    from testgame.structures import prefracture
+
+    prefracturer = Prefracturer(rng=random.Random(3))
+    piece = FakePiece(6.0)
+    prefracturer.request(piece)
+    layout = prefracturer._pending[piece]
+
+    def fail(size, seed):
+        raise AssertionError("layout computed when the piece broke")
+
+    monkeypatch.setattr(prefracture, "compute_fracture_layout", fail)
+    assert prefracturer.take(piece) is layout
+    assert prefracturer.layouts_planned == 1
+    print("✓ Queued pieces break with their precomputed layout")
@@ -0,0 +1,138 @@
+"""Tests for the per-frame raycast cache."""
+
+from panda3d.core import Point3, Vec3
+
+from testgame.interaction.raycast_service import RaycastService
+
+
+class FakeClock:
+    """Clock with a manually advanced frame counter."""
+
+    def __init__(self):
+        self.frame = 0
+
+    def getFrameCount(self):
+        return self.frame
+
+
+class FakeBuildingRaycaster:
+    """Counts physics raycasts; everything hits a wall 10 units away."""
+
+    def __init__(self):
+        self.render = None
+        self.calls = 0
+
+    def raycast(self, start_pos, end_pos, mask=None):
+        self.calls += 1
+        direction = end_pos - start_pos
+        length = direction.length()
+        direction.normalize()
+        if length >= 10.0:
+            return {
+                "hit": True,
+                "position": start_pos + direction * 10.0,
+                "normal": Vec3(0, -1, 0),
+                "node": "wall",
+                "distance": 10.0,
+            }
+        return {
+            "hit": False,
+            "position": end_pos,
+            "normal": Vec3(0, 0, 1),
+            "node": None,
+            "distance": length,
+        }
+
+
+class FakeTerrainRaycaster:
+    """Counts terrain casts for a fixed mouse ray."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_mouse_ray(self, mouse_watcher):
+        return Point3(0, 0, 10), Vec3(0, 0, -1), 100.0
+
+    def cast_ray(self, origin, direction, max_distance):
+        self.calls += 1
+        return {"position": Vec3(0, 0, 0), "normal": Vec3(0, 0, 1), "node": "chunk"}
+
+
+def make_service():
+    """Create a service wired to fakes."""
+    clock = FakeClock()
+    service = RaycastService(FakeTerrainRaycaster(), FakeBuildingRaycaster(), clock)
+    return service, clock
+
+
+def test_duplicate_queries_hit_cache():
+    """Test that identical rays in one frame run a single query."""
+    service, _ = make_service()
+
+    first = service.get_terrain_hit(None)
+    second = service.get_terrain_hit(None)
+
+    assert first["node"] == second["node"] == "chunk"
+    assert service.terrain_raycaster.calls == 1
+    assert service.get_stats()["cache_hits"] == 1
+    assert service.get_stats()["cache_misses"] == 1
+    print("✓ Duplicate terrain queries are cached")
+
+
+def test_longer_hit_answers_shorter_range():
+    """Test range compatibility: a 100m hit at 10m answers 20m and 5m queries."""
+    service, _ = make_service()
+    start = Vec3(0, 0, 0)
+
+    long_hit = service.raycast(start, Vec3(0, 100, 0))
+    mid_hit = service.raycast(start, Vec3(0, 20, 0))
+    short_miss = service.raycast(start, Vec3(0, 5, 0))
+
+    assert long_hit["hit"] and mid_hit["hit"]
+    assert not short_miss["hit"]
+    assert short_miss["distance"] == 5
+    assert service.building_raycaster.calls == 1
+    print("✓ Cached hits answer shorter ranges")
+
+
+def test_cache_cleared_on_new_frame():
+    """Test that results never leak into the next frame."""
+    service, clock = make_service()
+    start = Vec3(0, 0, 0)
+
+    service.raycast(start, Vec3(0, 100, 0))
+    clock.frame += 1
+    service.raycast(start, Vec3(0, 100, 0))
+
+    assert service.building_raycaster.calls == 2
+    print("✓ Cache resets every frame")
+
+
+def test_cached_hits_are_copies():
+    """Test that mutating a returned hit does not corrupt the cache."""
+    service, _ = make_service()
+
+    first = service.get_terrain_hit(None)
+    first["position"].z = 99.0
+    first["normal"].set(1, 0, 0)
+
+    second = service.get_terrain_hit(None)
+    assert second["position"] == Vec3(0, 0, 0)
+    assert second["normal"] == Vec3(0, 0, 1)
+    print("✓ Cached hits are returned as copies")
+
+
+def test_world_damage_invalidates_cache(world, house):
+    """Test that damaging a building drops hits cached earlier in the frame."""
+    service, _ = make_service()
+    world.raycast_service = service
+    service.raycast(Point3(0, -20, 2), Point3(0, 20, 2))
+
+    piece = house.pieces[0]
+    world.damage_building_at_position(piece.body_np.getPos(), damage=10)
+    service.raycast(Point3(0, -20, 2), Point3(0, 20, 2))
+
+    assert service.building_raycaster.calls == 2
+    world.clear_world()
+    world.prefracturer.shutdown()
+    print("✓ World damage invalidates cached raycasts")
@@ -0,0 +1,47 @@
+"""Tests for per-building render batching."""
+
+from panda3d.core import Vec3
+
+from testgame.config.destruction_config import BUILDING_BATCH_REBUILD_DELAY
+
+
+def count_geoms(batch_np):
+    """Count the Geoms a batch combiner draws."""
+    scene = batch_np.node().getInternalScene()
+    matches = [scene, *scene.findAllMatches("**/+GeomNode")]
+    return sum(
+        match.node().getNumGeoms() for match in matches if match.node().isGeomNode()
+    )
+
+
+def test_intact_building_draws_as_one_batch(house):
+    """Test that all intact pieces are merged and their own nodes hidden."""
+    assert len(house._batched) == len(house.pieces)
+    assert count_geoms(house.render_batch_np) < len(house.pieces)
+    assert all(piece.body_np.isHidden() for piece in house.pieces)
+    print("✓ Intact building renders as one batch")
+
+
+def test_damaged_piece_is_split_out(house):
+    """Test that damage collapses a piece's share and rebuilds only when quiet."""
+    wall = house.piece_map["house_wall_back"]
+    old_batch = house.render_batch_np
+    holder = house._batch_holders[wall]
+
+    house.damage_piece(wall.name, 10)
+
+    assert wall not in house._batched
+    assert not wall.body_np.isHidden()
+    assert house.render_batch_np is old_batch  # Kept, with the wall collapsed
+    assert holder.getScale() == Vec3(0, 0, 0)
+
+    # Further damage keeps pushing the rebuild back
+    assert not house.flush_render_batch(100.0)
+    house.damage_piece("house_wall_left", 10)
+    assert not house.flush_render_batch(100.0 + BUILDING_BATCH_REBUILD_DELAY)
+
+    assert house.flush_render_batch(101.0 + BUILDING_BATCH_REBUILD_DELAY * 2)
+    assert old_batch.isEmpty()
+    names = [child.getName() for child in house.render_batch_np.getChildren()]
+    assert wall.name not in names
+    print("✓ Damaged piece split out of the batch")
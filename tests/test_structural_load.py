@@ -0,0 +1,74 @@
+"""Tests for load propagation and overloaded supports."""
+
+import numpy as np
+from panda3d.bullet import BulletWorld
+from panda3d.core import NodePath, Vec3, Vec4
+
+from testgame.structures.building import Building, BuildingPiece
+from testgame.structures.structural_load import StructuralSolver, propagate_loads
+
+
+def make_stack(levels, strength, mass=100):
+    """Create a column of 2x2x2 blocks on a foundation, watched by a solver."""
+    world = BulletWorld()
+    render = NodePath("render")
+    building = Building(world, render, Vec3(0, 0, 0), name="stack")
+    color = Vec4(0.5, 0.5, 0.5, 1)
+
+    names = []
+    for i in range(levels):
+        piece_type = "foundation" if i == 0 else "wall"
+        name = f"stack_{i}"
+        building.add_piece(
+            BuildingPiece(
+                world, render, Vec3(0, 0, i * 2 + 1), Vec3(2, 2, 2), mass, color,
+                name, piece_type, building,
+            )
+        )
+        if names:
+            building.connect_pieces(names[-1], name)
+        names.append(name)
+
+    solver = StructuralSolver(strength=strength)
+    building.structural_solver = solver
+    solver.mark_building(building)
+    return building, names, solver
+
+
+def test_loads_flow_down_and_split():
+    """Test that a beam on two posts splits its load and posts add their own."""
+    # 0 = beam, 1 and 2 = posts, 3 = ground block under both posts
+    weights = np.array([4.0, 1.0, 1.0, 1.0])
+    sources = np.array([0, 0, 1, 2])
+    targets = np.array([1, 2, 3, 3])
+    shares = np.array([0.5, 0.5, 1.0, 1.0])
+
+    loads = propagate_loads(weights, sources, targets, shares)
+    assert np.allclose(loads, [4.0, 3.0, 3.0, 7.0])
+    print("✓ Loads flow down and split between supports")
+
+
+def test_overloaded_support_fails():
+    """Test that only the lowest block of a too-heavy stack is crushed."""
+    # Capacity 4 m^2 * 100 = 400, but the first block carries 5 blocks of 100
+    building, names, solver = make_stack(levels=6, strength=100)
+
+    assert solver.flush() >= 1
+    assert building.piece_map[names[1]].is_destroyed
+    for name in names[2:]:
+        piece = building.piece_map[name]
+        assert not piece.is_destroyed
+        assert piece.body_np.node().getMass() > 0  # Fell once its support went
+    print("✓ Overloaded support failed and the stack above fell")
+
+
+def test_damage_weakens_supports():
+    """Test that a stack that stands intact fails once its base is damaged."""
+    building, names, solver = make_stack(levels=4, strength=100)
+    assert solver.flush() == 0  # 300 on a capacity of 400
+
+    building.damage_piece(names[1], 50)  # Capacity drops to 200
+    assert len(solver) == 1
+    assert solver.flush() >= 1
+    assert building.piece_map[names[1]].is_destroyed
+    print("✓ Damage weakened the support until it failed")
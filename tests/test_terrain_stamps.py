@@ -0,0 +1,86 @@
+"""Tests for batched terrain stamps."""
+
+import numpy as np
+
+from testgame.interaction import terrain_editor
+from testgame.interaction.terrain_editor import TerrainEditor
+
+
+class FakeChunk:
+    """Minimal stand-in for TerrainChunk that counts rebuilds."""
+
+    def __init__(self, chunk_x, chunk_z, size=32, resolution=16):
+        self.size = size
+        self.resolution = resolution
+        self.world_x = chunk_x * size
+        self.world_z = chunk_z * size
+        self.height_data = np.zeros((resolution + 1, resolution + 1), dtype=np.float32)
+        self.regenerate_count = 0
+
+    def regenerate(self):
+        self.regenerate_count += 1
+
+
+class FakeTerrain:
+    """Terrain holding a 2x2 block of fake chunks."""
+
+    def __init__(self):
+        self.chunks = {(cx, cz): FakeChunk(cx, cz) for cx in (0, 1) for cz in (0, 1)}
+
+
+def test_stamps_regenerate_each_chunk_once(monkeypatch):
+    """Test that a volley of craters rebuilds each affected chunk once."""
+    monkeypatch.setattr(terrain_editor, "MODIFIABLE_TERRAIN", True)
+    terrain = FakeTerrain()
+    editor = TerrainEditor(terrain)
+
+    stamps = [((10.0 + i, 10.0, 0.0), 4.0, 1.0, "crater") for i in range(10)]
+    rebuilt = editor.apply_stamps(stamps)
+
+    assert rebuilt == 1
+    assert terrain.chunks[(0, 0)].regenerate_count == 1
+    assert terrain.chunks[(1, 1)].regenerate_count == 0
+    assert terrain.chunks[(0, 0)].height_data.min() < 0
+    print("✓ Stamp volley regenerates once per chunk")
+
+
+def test_stamps_keep_chunk_edges_consistent(monkeypatch):
+    """Test that stamps on a chunk corner leave shared vertices identical."""
+    monkeypatch.setattr(terrain_editor, "MODIFIABLE_TERRAIN", True)
+    terrain = FakeTerrain()
+    editor = TerrainEditor(terrain)
+
+    editor.apply_stamps([((32.0, 32.0, 0.0), 6.0, 2.0, "crater")])
+
+    a = terrain.chunks[(0, 0)].height_data
+    b = terrain.chunks[(1, 0)].height_data
+    c = terrain.chunks[(0, 1)].height_data
+    assert np.allclose(a[-1, :], b[0, :])
+    assert np.allclose(a[:, -1], c[:, 0])
+    assert all(chunk.regenerate_count == 1 for chunk in terrain.chunks.values())
+    print("✓ Shared chunk edges stay consistent")
+
+
+def test_flatten_stamp_blends_to_target(monkeypatch):
+    """Test that a full-strength flatten stamp pulls the centre to its height."""
+    monkeypatch.setattr(terrain_editor, "MODIFIABLE_TERRAIN", True)
+    terrain = FakeTerrain()
+    terrain.chunks[(0, 0)].height_data[:] = 5.0
+    editor = TerrainEditor(terrain)
+
+    editor.apply_stamps([((16.0, 16.0, 1.0), 8.0, 1.0, "flatten")])
+
+    assert np.isclose(terrain.chunks[(0, 0)].height_data[8, 8], 1.0)
+    assert np.isclose(terrain.chunks[(0, 0)].height_data[0, 0], 5.0)
+    print("✓ Flatten stamp blends toward target height")
+
+
+def test_stamps_ignored_when_terrain_locked(monkeypatch):
+    """Test that stamps are a no-op when terrain modification is disabled."""
+    monkeypatch.setattr(terrain_editor, "MODIFIABLE_TERRAIN", False)
+    terrain = FakeTerrain()
+    editor = TerrainEditor(terrain)
+
+    assert editor.apply_stamps([((10.0, 10.0, 0.0), 4.0, 1.0, "crater")]) == 0
+    assert terrain.chunks[(0, 0)].regenerate_count == 0
+    print("✓ Stamps respect MODIFIABLE_TERRAIN")